@@ -371,15 +371,12 @@ def visualize_pollution_with_alerts(datatree, hotspots, regional_alerts, thresho
     ax3 = fig.add_subplot(133, projection=data_proj)
     make_nice_map(ax3)
     
-    # Create categorical alert map
-    alert_levels = np.zeros_like(good_data.values)
-    for i in range(good_data.shape[0]):
-        for j in range(good_data.shape[1]):
-            if not np.isnan(good_data.values[i, j]):
-                _, severity = classify_pollution_level(good_data.values[i, j], thresholds)
-                alert_levels[i, j] = severity
-            else:
-                alert_levels[i, j] = np.nan
+    # Create categorical alert map (one digitize over the grid; same bins as classify_pollution_level)
+    values = good_data.values
+    bins = np.array([thresholds['moderate'], thresholds['unhealthy'],
+                     thresholds['very_unhealthy'], thresholds['hazardous']])
+    alert_levels = np.digitize(values, bins).astype(values.dtype)
+    alert_levels[np.isnan(values)] = np.nan
     
     alert_colors = ['green', 'yellow', 'orange', 'red', 'purple']
     contour3 = ax3.contourf(lons, lats, alert_levels, 
@@ -0,0 +1,47 @@
+"""Composite (gas_type, timestamp DESC) indexes on netcdf_files and pollution_grid
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build without blocking writes to live tables
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_netcdf_files_gas_ts", "netcdf_files", ["gas_type", sa.text("timestamp DESC")],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_pollution_grid_gas_ts", "pollution_grid", ["gas_type", sa.text("timestamp DESC")],
+            unique=False, postgresql_concurrently=True,
+        )
+        # gas_type is the leading column of the composites above
+        op.drop_index(op.f("ix_netcdf_files_gas_type"), table_name="netcdf_files", postgresql_concurrently=True)
+        op.drop_index(op.f("ix_pollution_grid_gas_type"), table_name="pollution_grid", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_pollution_grid_gas_type"), "pollution_grid", ["gas_type"],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f("ix_netcdf_files_gas_type"), "netcdf_files", ["gas_type"],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.drop_index("ix_pollution_grid_gas_ts", table_name="pollution_grid", postgresql_concurrently=True)
+        op.drop_index("ix_netcdf_files_gas_ts", table_name="netcdf_files", postgresql_concurrently=True)
@@ -0,0 +1,54 @@
+"""Users: notify_email / notify_push / notify_in_app booleans replace notification_preferences JSONB
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# JSON values that were falsy for the alert channel builder (prefs.get(key) truthiness)
+_FALSY = "('false'::jsonb, 'null'::jsonb, '0'::jsonb, '\"\"'::jsonb)"
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("notify_email", sa.Boolean(), server_default=sa.text("false"), nullable=False))
+    op.add_column("users", sa.Column("notify_push", sa.Boolean(), server_default=sa.text("false"), nullable=False))
+    op.add_column("users", sa.Column("notify_in_app", sa.Boolean(), server_default=sa.text("true"), nullable=False))
+    op.execute(
+        f"""
+        UPDATE users SET
+            notify_email = COALESCE(notification_preferences -> 'email' NOT IN {_FALSY}, false),
+            notify_push = COALESCE(notification_preferences -> 'push' NOT IN {_FALSY}, false),
+            notify_in_app = COALESCE(notification_preferences -> 'in_app' NOT IN {_FALSY}, true)
+        WHERE jsonb_typeof(notification_preferences) = 'object'
+        """
+    )
+    op.drop_column("users", "notification_preferences")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("notification_preferences", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE users SET notification_preferences = jsonb_build_object(
+            'email', notify_email, 'push', notify_push, 'in_app', notify_in_app
+        )
+        """
+    )
+    op.drop_column("users", "notify_in_app")
+    op.drop_column("users", "notify_push")
+    op.drop_column("users", "notify_email")
@@ -1,37 +1,65 @@
 import os
-import glob
+import asyncio
 import datetime as dt
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple, Any
 
 import numpy as np
 import xarray as xr
+from diskcache import Cache
 from fastapi import Depends, FastAPI, Request, Form, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from geopy.adapters import AioHTTPAdapter
+from geopy.extra.rate_limiter import AsyncRateLimiter
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
 from scipy import ndimage
+from scipy.spatial import cKDTree
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
-import cartopy.feature as cfeature
 from matplotlib.patches import Circle
 import math
-from weather_service import get_weather_data, get_pollutant_movement_prediction
-from groq_service import generate_weather_interpretation, generate_prediction_interpretation
-from cache import get_weather_cached, get_pollutant_movement_cached
-from database.session import get_db
-from database.models import AlertLog, PollutionGrid, SavedRoute, User
-from geoalchemy2 import WKTElement
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import threading
+from map_render import FIGURE_DPI, PANEL_PX, PNG_PIL_KWARGS, add_basemap, plot_grid, render_tripanel
+from weather_service import get_weather_data, get_weather_data_async, get_pollutant_movement_prediction
+from groq_service import (
+    generate_prediction_interpretation,
+    generate_prediction_interpretation_async,
+    generate_weather_interpretation,
+    generate_weather_interpretation_async,
+)
+from cache import (
+    cache_get,
+    cache_set,
+    geocode_first_hit,
+    get_pollutant_movement_cached,
+    get_weather_cached,
+    TTL_GROQ_INTERPRETATION,
+    TTL_HOTSPOTS,
+    TTL_ROUTE_EXPOSURE,
+    key_groq_interpretation,
+    key_hotspots,
+    key_osrm_routes,
+    key_route_exposure,
+    reverse_geocode_batch,
+)
+from database.bulk import bulk_insert_pollution_grid
+from database.session import get_db, get_db_tx
+from database.models import AlertLog, SavedRoute, User
 from database.schemas import (
-    AlertLogResponse,
+    AlertLogListAdapter,
     SavedRouteCreate,
+    SavedRouteListAdapter,
     SavedRouteResponse,
     Token,
     UserLogin,
@@ -43,12 +71,22 @@ from auth import create_access_token, get_current_user, hash_password, verify_pa
 from config import settings as app_settings
 from netcdf_resolver import resolve_netcdf_paths_for_gases
 import json
-import requests
+import time
+import httpx
 
 
 # -----------------------------
 # Lifespan: DB extensions, Redis, shutdown
 # -----------------------------
+def _make_http_client() -> httpx.AsyncClient:
+    """AsyncClient with HTTP/2 when the h2 extra is installed, HTTP/1.1 keep-alive otherwise."""
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    try:
+        return httpx.AsyncClient(http2=True, timeout=15, limits=limits)
+    except ImportError:
+        return httpx.AsyncClient(timeout=15, limits=limits)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: ensure PostGIS extensions exist (best-effort)
@@ -69,8 +107,23 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
     app.state.redis = redis_client
+    # Shared outbound HTTP client (keep-alive pool reused across requests)
+    http_client = _make_http_client()
+    app.state.http = http_client
+    render_pool = _make_render_pool()
+    app.state.render_pool = render_pool
+    _open_reverse_geocoder()
     yield
-    # Shutdown: close Redis, dispose DB engine
+    # Shutdown: stop render workers, close HTTP clients and Redis, dispose DB engine
+    render_pool.shutdown(wait=False, cancel_futures=True)
+    try:
+        await _close_reverse_geocoder()
+    except Exception:
+        pass
+    try:
+        await http_client.aclose()
+    except Exception:
+        pass
     if redis_client is not None:
         try:
             await redis_client.aclose()
@@ -93,7 +146,10 @@ OUTPUT_DIR = os.path.join(STATIC_DIR, "outputs")
 os.makedirs(STATIC_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-app = FastAPI(title="TEMPO Pollution Viewer", version="0.1.0", lifespan=lifespan)
+# orjson renders dict/list responses in C (numpy scalars included) instead of json.dumps
+app = FastAPI(
+    title="TEMPO Pollution Viewer", version="0.1.0", lifespan=lifespan, default_response_class=ORJSONResponse
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
@@ -116,7 +172,9 @@ async def root():
 # -----------------------------
 # Domain configuration
 # -----------------------------
-from pollution_utils import POLLUTION_THRESHOLDS, classify_pollution_level
+from grid_astar import astar_grid_path
+from grid_stats import scan_grid_stats
+from pollution_utils import POLLUTION_THRESHOLDS, classify_pollution_level, classify_severity_array
 
 VARIABLE_NAMES: Dict[str, str] = {
     'NO2': "product/vertical_column_troposphere",
@@ -138,65 +196,178 @@ UNITS: Dict[str, str] = {
 # -----------------------------
 # Helpers
 # -----------------------------
+# Persistent geocode cache shared by forward ("fwd") and reverse ("rev") lookups; survives restarts
+# and is LRU-evicted beyond GEOCACHE_SIZE_LIMIT bytes. Opened on first lookup, so importing the
+# module does not create GEOCACHE_DIR.
+GEOCACHE_DIR = os.path.join(BASE_DIR, ".geocache")
+GEOCACHE_SIZE_LIMIT = 64 << 20
+GEOCACHE_EXPIRE_S = 30 * 86400
+_geocode_cache: Optional[Cache] = None
+_geocode_cache_lock = threading.Lock()
+_GEOCACHE_MISS = object()
+
+
+def _get_geocode_cache() -> Cache:
+    global _geocode_cache
+    if _geocode_cache is None:
+        with _geocode_cache_lock:
+            if _geocode_cache is None:
+                _geocode_cache = Cache(
+                    GEOCACHE_DIR, size_limit=GEOCACHE_SIZE_LIMIT, eviction_policy="least-recently-used"
+                )
+    return _geocode_cache
+
+
+# Long-lived geocoders: geopy keeps one requests.Session per instance, so lookups reuse connections
+_forward_geocoder = Nominatim(user_agent="tempo_pollution_frontend")
+_biased_geocoder = Nominatim(user_agent="tempo_pollution_frontend_bias")
+# Async reverse geocoder (one aiohttp session) and its process-wide 1 req/s limiter; opened by the lifespan
+_reverse_geocoder: Optional[Nominatim] = None
+_reverse_limited: Any = None
+
+
+def _open_reverse_geocoder() -> Nominatim:
+    global _reverse_geocoder, _reverse_limited
+    _reverse_geocoder = Nominatim(user_agent="tempo_pollution_frontend_reverse", adapter_factory=AioHTTPAdapter)
+    _reverse_limited = AsyncRateLimiter(_reverse_geocoder.reverse, min_delay_seconds=1.0, swallow_exceptions=False)
+    return _reverse_geocoder
+
+
+async def _close_reverse_geocoder() -> None:
+    global _reverse_geocoder, _reverse_limited
+    geocoder, _reverse_geocoder, _reverse_limited = _reverse_geocoder, None, None
+    if geocoder is not None:
+        await geocoder.__aexit__(None, None, None)
+
+
+def _geocode_lookup(location_name: str) -> Optional[Tuple[float, float]]:
+    """geocode_location that raises on timeouts/network errors, so callers can tell them from 'no match'."""
+    key = ("fwd", " ".join(location_name.lower().split()))
+    geocache = _get_geocode_cache()
+    cached = geocache.get(key, default=_GEOCACHE_MISS)
+    if cached is not _GEOCACHE_MISS:
+        return cached
+    location = _forward_geocoder.geocode(location_name, timeout=10)
+    result = (float(location.latitude), float(location.longitude)) if location else None
+    geocache.set(key, result, expire=GEOCACHE_EXPIRE_S)
+    return result
+
+
 def geocode_location(location_name: str) -> Optional[Tuple[float, float]]:
     try:
-        geolocator = Nominatim(user_agent="tempo_pollution_frontend")
-        location = geolocator.geocode(location_name, timeout=10)
-        if location:
-            return (float(location.latitude), float(location.longitude))
-        return None
+        return _geocode_lookup(location_name)
     except GeocoderTimedOut:
         return None
     except Exception:
         return None
 
 
-# Reverse geocoding with simple in-memory cache to reduce external lookups
-_reverse_cache: Dict[Tuple[float, float], Optional[str]] = {}
-
-def reverse_geocode(lat: float, lon: float) -> Optional[str]:
-    key = (round(float(lat), 4), round(float(lon), 4))
-    if key in _reverse_cache:
-        return _reverse_cache[key]
-    try:
-        geolocator = Nominatim(user_agent="tempo_pollution_frontend_reverse")
-        location = geolocator.reverse((lat, lon), timeout=10, language='en')
-        name: Optional[str] = None
-        if location and getattr(location, 'raw', None) and 'display_name' in location.raw:
-            name = location.raw['display_name']
-        elif location and getattr(location, 'address', None):
-            name = str(location.address)
-        _reverse_cache[key] = name
-        return name
-    except GeocoderTimedOut:
-        _reverse_cache[key] = None
-        return None
-    except Exception:
-        _reverse_cache[key] = None
+def _place_name(location: Any) -> Optional[str]:
+    if location is None or isinstance(location, BaseException):
         return None
+    if getattr(location, 'raw', None) and 'display_name' in location.raw:
+        return location.raw['display_name']
+    if getattr(location, 'address', None):
+        return str(location.address)
+    return None
+
+
+async def reverse_geocode_many(points: List[Tuple[float, float]]) -> List[Optional[str]]:
+    """Reverse-geocode points concurrently over one async Nominatim session (rate limited to 1 req/s)."""
+    # ~110 m buckets; hotspots cluster, so most lookups hit the persistent cache
+    keys = [("rev", round(float(lat), 3), round(float(lon), 3)) for lat, lon in points]
+    resolved: Dict[Any, Optional[str]] = {}
+    missing = []
+    geocache = _get_geocode_cache()
+    for k in dict.fromkeys(keys):
+        cached = geocache.get(k, default=_GEOCACHE_MISS)
+        if cached is _GEOCACHE_MISS:
+            missing.append(k)
+        else:
+            resolved[k] = cached
+    if missing:
+        try:
+            if _reverse_limited is not None:
+                locations = await asyncio.gather(
+                    *(_reverse_limited((k[1], k[2]), timeout=10, language='en') for k in missing),
+                    return_exceptions=True,
+                )
+            else:
+                # No lifespan (scripts/tests): use a short-lived session
+                async with Nominatim(user_agent="tempo_pollution_frontend_reverse",
+                                     adapter_factory=AioHTTPAdapter) as geolocator:
+                    reverse = AsyncRateLimiter(geolocator.reverse, min_delay_seconds=1.0, swallow_exceptions=False)
+                    locations = await asyncio.gather(
+                        *(reverse((k[1], k[2]), timeout=10, language='en') for k in missing), return_exceptions=True
+                    )
+        except Exception as exc:
+            locations = [exc] * len(missing)
+        for k, location in zip(missing, locations):
+            resolved[k] = _place_name(location)
+            # Don't persist transient failures
+            if not isinstance(location, BaseException):
+                geocache.set(k, resolved[k], expire=GEOCACHE_EXPIRE_S)
+    return [resolved.get(k) for k in keys]
+
+# Recursive TempData scans are slow on deep trees; reuse the answer for a short TTL
+LATEST_FILE_TTL_S = 30.0
+_latest_file_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+
 
 def find_latest_file_for_gas(gas: str) -> Optional[str]:
-    """Search TempData/ and TempData/{gas}/ for the most recent file."""
-    candidates: List[str] = []
+    """Search TempData/ and TempData/{gas}/ for the most recent file (memoized for LATEST_FILE_TTL_S)."""
+    hit = _latest_file_cache.get(gas)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < LATEST_FILE_TTL_S and (hit[1] is None or os.path.exists(hit[1])):
+        return hit[1]
+    latest = _scan_latest_file_for_gas(gas)
+    _latest_file_cache[gas] = (now, latest)
+    return latest
+
+
+def _newest_file(root: str, exts: Tuple[str, ...] = (".nc", ".nc4")) -> Optional[str]:
+    """Walk root with os.scandir, stat-ing only matching files and keeping just the newest."""
+    best_path: Optional[str] = None
+    best_mtime = -1.0
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(exts):
+                        mtime = entry.stat().st_mtime
+                        if mtime > best_mtime:
+                            best_path, best_mtime = entry.path, mtime
+                except OSError:
+                    continue
+    return best_path
+
+
+def _scan_latest_file_for_gas(gas: str) -> Optional[str]:
     tempdata_root = os.path.join(BASE_DIR, "TempData")
-    # Search common subdir pattern first
+    # Search common subdir pattern first, then fall back to all of TempData
     gas_dir = os.path.join(tempdata_root, gas)
-    patterns = []
     if os.path.isdir(gas_dir):
-        patterns.append(os.path.join(gas_dir, "**", "*.nc"))
-        patterns.append(os.path.join(gas_dir, "**", "*.nc4"))
-    # Also search root TempData
-    patterns.append(os.path.join(tempdata_root, "**", "*.nc"))
-    patterns.append(os.path.join(tempdata_root, "**", "*.nc4"))
-
-    for pattern in patterns:
-        candidates.extend(glob.glob(pattern, recursive=True))
-
-    if not candidates:
+        latest = _newest_file(gas_dir)
+        if latest:
+            return latest
+    if not os.path.isdir(tempdata_root):
         return None
+    return _newest_file(tempdata_root)
+
 
-    candidates.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-    return candidates[0]
+def _lat_lon_grids(lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(lat_grid, lon_grid) for a scene; 1D axes become zero-copy broadcast views instead of a meshgrid."""
+    if lats.ndim == 1 and lons.ndim == 1:
+        shape = (lats.size, lons.size)
+        return np.broadcast_to(lats[:, None], shape), np.broadcast_to(lons[None, :], shape)
+    return lats, lons
 
 
 def detect_hotspots(data: np.ndarray, lats: np.ndarray, lons: np.ndarray, gas: str,
@@ -205,13 +376,11 @@ def detect_hotspots(data: np.ndarray, lats: np.ndarray, lons: np.ndarray, gas: s
     if gas not in POLLUTION_THRESHOLDS:
         return hotspots
 
-    if lats.ndim == 1 and lons.ndim == 1:
-        lon_grid, lat_grid = np.meshgrid(lons, lats)
-    else:
-        lat_grid = lats
-        lon_grid = lons
+    lat_grid, lon_grid = _lat_lon_grids(lats, lons)
 
     thresholds = POLLUTION_THRESHOLDS[gas]
+    # Each level is labelled on its own mask: the masks are nested, so a hazardous core is also
+    # reported inside its very_unhealthy/unhealthy/moderate regions, each with that level's footprint.
     for level_name, threshold in [
         ('hazardous', thresholds['hazardous']),
         ('very_unhealthy', thresholds['very_unhealthy']),
@@ -220,25 +389,35 @@ def detect_hotspots(data: np.ndarray, lats: np.ndarray, lons: np.ndarray, gas: s
     ]:
         mask = data >= threshold
         labeled_array, num_features = ndimage.label(mask)
-        for region_id in range(1, num_features + 1):
-            region_mask = labeled_array == region_id
-            region_size = int(np.sum(region_mask))
-            if region_size >= min_cluster_size:
-                region_values = data[region_mask]
-                region_lats = lat_grid[region_mask]
-                region_lons = lon_grid[region_mask]
-                hotspots.append({
-                    'gas': gas,
-                    'level': level_name,
-                    'size_pixels': region_size,
-                    'max_value': float(np.nanmax(region_values)),
-                    'mean_value': float(np.nanmean(region_values)),
-                    'center_lat': float(np.mean(region_lats)),
-                    'center_lon': float(np.mean(region_lons)),
-                    'lat_range': (float(np.min(region_lats)), float(np.max(region_lats))),
-                    'lon_range': (float(np.min(region_lons)), float(np.max(region_lons))),
-                    'area_km2': float(region_size * 2.1 * 4.4),
-                })
+        if num_features == 0:
+            continue
+        # Per-region statistics in one labelled pass each (NaN never satisfies >=, so regions hold no NaN)
+        idx = np.arange(1, num_features + 1)
+        sizes = ndimage.sum_labels(mask, labeled_array, idx)
+        keep = idx[sizes >= min_cluster_size]
+        if keep.size == 0:
+            continue
+        sizes = sizes[keep - 1]
+        max_vals = ndimage.maximum(data, labeled_array, keep)
+        mean_vals = ndimage.mean(data, labeled_array, keep)
+        center_lats = ndimage.mean(lat_grid, labeled_array, keep)
+        center_lons = ndimage.mean(lon_grid, labeled_array, keep)
+        lat_min, lat_max = ndimage.minimum(lat_grid, labeled_array, keep), ndimage.maximum(lat_grid, labeled_array, keep)
+        lon_min, lon_max = ndimage.minimum(lon_grid, labeled_array, keep), ndimage.maximum(lon_grid, labeled_array, keep)
+        for k in range(keep.size):
+            region_size = int(sizes[k])
+            hotspots.append({
+                'gas': gas,
+                'level': level_name,
+                'size_pixels': region_size,
+                'max_value': float(max_vals[k]),
+                'mean_value': float(mean_vals[k]),
+                'center_lat': float(center_lats[k]),
+                'center_lon': float(center_lons[k]),
+                'lat_range': (float(lat_min[k]), float(lat_max[k])),
+                'lon_range': (float(lon_min[k]), float(lon_max[k])),
+                'area_km2': float(region_size * 2.1 * 4.4),
+            })
 
     hotspots.sort(key=lambda x: (
         {'hazardous': 4, 'very_unhealthy': 3, 'unhealthy': 2, 'moderate': 1}[x['level']],
@@ -247,6 +426,18 @@ def detect_hotspots(data: np.ndarray, lats: np.ndarray, lons: np.ndarray, gas: s
     return hotspots
 
 
+def _axis_slice(axis: np.ndarray, lo: float, hi: float) -> Any:
+    """Index range of a 1D coordinate axis within [lo, hi]: a slice via searchsorted when monotonic, else a mask."""
+    if axis.size > 1 and axis[-1] < axis[0]:
+        if np.all(axis[1:] <= axis[:-1]):
+            n = axis.size
+            rev = axis[::-1]
+            return slice(n - int(np.searchsorted(rev, hi, side='right')), n - int(np.searchsorted(rev, lo, side='left')))
+    elif np.all(axis[1:] >= axis[:-1]):
+        return slice(int(np.searchsorted(axis, lo, side='left')), int(np.searchsorted(axis, hi, side='right')))
+    return (axis >= lo) & (axis <= hi)
+
+
 def check_regional_alerts(data: np.ndarray, lats: np.ndarray, lons: np.ndarray,
                           center_lat: float, center_lon: float, radius: float,
                           gas: str, location_name: str) -> List[Dict[str, Any]]:
@@ -254,18 +445,27 @@ def check_regional_alerts(data: np.ndarray, lats: np.ndarray, lons: np.ndarray,
     if gas not in POLLUTION_THRESHOLDS:
         return alerts
 
+    lat_lo, lat_hi = center_lat - radius, center_lat + radius
+    lon_lo, lon_hi = center_lon - radius, center_lon + radius
     if lats.ndim == 1 and lons.ndim == 1:
-        lon_grid, lat_grid = np.meshgrid(lons, lats)
+        # Separable box: slice rows and columns straight off the sorted 1D axes
+        region_values = data[_axis_slice(lats, lat_lo, lat_hi)][:, _axis_slice(lons, lon_lo, lon_hi)].ravel()
     else:
-        lat_grid = lats
-        lon_grid = lons
-
-    lat_mask = np.abs(lat_grid - center_lat) <= radius
-    lon_mask = np.abs(lon_grid - center_lon) <= radius
-    region_mask = lat_mask & lon_mask
+        # Curvilinear grid: bound the rows/columns that can reach the box, then mask only that block.
+        # fmin/fmax skip NaN (fill) coordinates, so one bad pixel does not drop its row or column;
+        # an all-NaN row/column reduces to NaN and stays out of range.
+        rows = np.flatnonzero((np.fmin.reduce(lats, axis=1) <= lat_hi) & (np.fmax.reduce(lats, axis=1) >= lat_lo))
+        cols = np.flatnonzero((np.fmin.reduce(lons, axis=0) <= lon_hi) & (np.fmax.reduce(lons, axis=0) >= lon_lo))
+        if rows.size and cols.size:
+            block = (slice(rows[0], rows[-1] + 1), slice(cols[0], cols[-1] + 1))
+            sub_lats, sub_lons = lats[block], lons[block]
+            region_mask = ((sub_lats >= lat_lo) & (sub_lats <= lat_hi)
+                           & (sub_lons >= lon_lo) & (sub_lons <= lon_hi))
+            region_values = data[block][region_mask]
+        else:
+            region_values = data[:0, :0].ravel()
 
-    if np.sum(region_mask) > 0:
-        region_values = data[region_mask]
+    if region_values.size > 0:
         region_values = region_values[~np.isnan(region_values)]
         if len(region_values) > 0:
             max_value = float(np.max(region_values))
@@ -314,43 +514,28 @@ def visualize_multi_gas(gas_data: Dict[str, Any], location_name: str,
             break
         ax = axes[idx]
         info = gas_data[gas]
-        datatree = info['datatree']
-        variable_name = VARIABLE_NAMES[gas]
         try:
-            da = datatree[variable_name]
-            lons_raw = datatree["geolocation/longitude"].values
-            lats_raw = datatree["geolocation/latitude"].values
-            if 'product/main_data_quality_flag' in datatree:
-                quality_flag = datatree["product/main_data_quality_flag"].values
-                good_data = da.where(quality_flag == 0).squeeze()
-            else:
-                good_data = da.squeeze()
+            stats = info.get('stats') or scan_grid_stats(info['values'])
 
-            if lons_raw.ndim == 1 and lats_raw.ndim == 1:
-                lons, lats = np.meshgrid(lons_raw, lats_raw)
-            else:
-                lons = lons_raw
-                lats = lats_raw
+            # Only the visible extent is drawn, at no more cells than the panel has pixels
+            lons, lats, good_data = plot_grid(info['lons'], info['lats'], info['values'], PANEL_PX, extent=extent)
 
-            ax.set_extent(extent, crs=data_proj)
-            ax.add_feature(cfeature.OCEAN, color="white", zorder=0)
-            ax.add_feature(cfeature.LAND, color="white", zorder=0)
-            ax.add_feature(cfeature.STATES, color="black", linewidth=1, zorder=1)
-            ax.coastlines(resolution="10m", color="black", linewidth=1, zorder=1)
+            add_basemap(ax, extent)
 
-            vmax_val = float(np.nanpercentile(good_data, 98))
-            contour = ax.contourf(
+            vmax_val = stats['p98']
+            contour = ax.pcolormesh(
                 lons, lats, good_data,
-                levels=20,
+                shading='auto',
+                rasterized=True,
                 vmin=0,
-                vmax=vmax_val if np.isfinite(vmax_val) and vmax_val > 0 else float(np.nanmax(good_data)),
+                vmax=vmax_val if np.isfinite(vmax_val) and vmax_val > 0 else stats['max'],
                 alpha=0.85,
                 cmap='YlOrRd',
                 zorder=2
             )
             # Thin black contour lines to improve readability
             try:
-                ax.contour(lons, lats, good_data, levels=10, colors='k', linewidths=0.3, alpha=0.6, zorder=3)
+                ax.contour(lons, lats, good_data, levels=5, colors='k', linewidths=0.3, alpha=0.6, zorder=3)
             except Exception:
                 pass
             cb = plt.colorbar(contour, ax=ax, fraction=0.046, pad=0.04)
@@ -389,12 +574,12 @@ def visualize_multi_gas(gas_data: Dict[str, Any], location_name: str,
     ts = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     out_name = f"analysis_{ts}.png"
     out_path = os.path.join(OUTPUT_DIR, out_name)
-    plt.savefig(out_path, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(out_path, dpi=FIGURE_DPI, bbox_inches='tight', facecolor='white', pil_kwargs=PNG_PIL_KWARGS)
     plt.close()
     return f"/static/outputs/{out_name}"
 
 
-def gather_hotspots_geojson(gas_data: Dict[str, Any], limit: int = 50) -> Dict[str, Any]:
+async def gather_hotspots_geojson(gas_data: Dict[str, Any], limit: int = 50, redis: Any = None) -> Dict[str, Any]:
     """Collect hotspots across gases and convert to GeoJSON with center point and radius_km for circle rendering."""
     features: List[Dict[str, Any]] = []
     count = 0
@@ -419,160 +604,206 @@ def gather_hotspots_geojson(gas_data: Dict[str, Any], limit: int = 50) -> Dict[s
                 "area_km2": h.get('area_km2'),
                 "radius_km": radius_km,
             }
-            place = reverse_geocode(center_lat, center_lon)
-            if place:
-                props["place"] = place
             features.append({
                 "type": "Feature",
                 "geometry": {"type": "Point", "coordinates": [center_lon, center_lat]},
                 "properties": props
             })
             count += 1
+    # Resolve place names for all features at once, then stitch them back in
+    places = await reverse_geocode_batch(
+        redis, [(f["geometry"]["coordinates"][1], f["geometry"]["coordinates"][0]) for f in features],
+        reverse_geocode_many,
+    )
+    for feature, place in zip(features, places):
+        if place:
+            feature["properties"]["place"] = place
     return {"type": "FeatureCollection", "features": features}
 
 
-def build_hotspot_circles(gas_data: Dict[str, Any], limit: int = 200) -> List[Dict[str, Any]]:
+@dataclass
+class HotspotArrays:
+    """Hotspot circles as parallel columns (center, radius_km, severity 0-4), one row per circle."""
+    lats: np.ndarray
+    lons: np.ndarray
+    radii_km: np.ndarray
+    severities: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.lats.size)
+
+
+def build_hotspot_circles(gas_data: Dict[str, Any], limit: int = 200) -> HotspotArrays:
     """Build simplified hotspot circles with center, radius_km, and severity (0-4)."""
     level_to_sev = {'moderate': 1, 'unhealthy': 2, 'very_unhealthy': 3, 'hazardous': 4}
-    circles: List[Dict[str, Any]] = []
-    count = 0
+    rows: List[Tuple[float, float, float, float, int]] = []
     for gas, info in gas_data.items():
-        hs = info.get('hotspots') or []
-        for h in hs:
-            if count >= limit:
+        for h in info.get('hotspots') or []:
+            if len(rows) >= limit:
                 break
             lat_min, lat_max = h.get('lat_range', (h.get('center_lat'), h.get('center_lat')))
             lon_min, lon_max = h.get('lon_range', (h.get('center_lon'), h.get('center_lon')))
-            center_lat = float(h.get('center_lat'))
-            center_lon = float(h.get('center_lon'))
-            lat_span_km = abs(float(lat_max) - float(lat_min)) * 111.0
-            lon_km_factor = 111.0 * max(0.1, math.cos(math.radians(center_lat)))
-            lon_span_km = abs(float(lon_max) - float(lon_min)) * lon_km_factor
-            radius_km = max(2.0, 0.5 * math.hypot(lat_span_km, lon_span_km))
-            sev = level_to_sev.get(h.get('level'), 0)
-            circles.append({
-                'lat': center_lat,
-                'lon': center_lon,
-                'radius_km': radius_km,
-                'severity': sev,
-                'gas': h.get('gas', gas),
-            })
-            count += 1
-    return circles
+            rows.append((float(h.get('center_lat')), float(h.get('center_lon')),
+                         abs(float(lat_max) - float(lat_min)), abs(float(lon_max) - float(lon_min)),
+                         level_to_sev.get(h.get('level'), 0)))
+    table = np.array(rows, dtype=float).reshape(-1, 5)
+    lats = table[:, 0]
+    lat_span_km = table[:, 2] * 111.0
+    lon_span_km = table[:, 3] * 111.0 * np.maximum(0.1, np.cos(np.radians(lats)))
+    return HotspotArrays(
+        lats=lats,
+        lons=table[:, 1],
+        radii_km=np.maximum(2.0, 0.5 * np.hypot(lat_span_km, lon_span_km)),
+        severities=table[:, 4].astype(np.uint8),
+    )
+
+
+def _tripanel_job(gas: str, lons: np.ndarray, lats: np.ndarray, values: np.ndarray,
+                  hotspots: List[Dict[str, Any]],
+                  stats: Optional[Dict[str, float]] = None) -> Tuple[tuple, str]:
+    """Reduce one gas to render_tripanel's picklable NumPy arguments; returns (args, static url)."""
+    if stats is None:
+        stats = scan_grid_stats(values)
+    vmax = stats['p98'] if np.isfinite(stats['p98']) and stats['p98'] > 0 else stats['max']
+    # Decimated before pickling, so workers receive at most PANEL_PX cells per axis
+    lons, lats, good_vals = plot_grid(lons, lats, values, PANEL_PX)
+    points = [(h['center_lon'], h['center_lat']) for h in hotspots if h['gas'] == gas][:15]
+
+    ts = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    out_name = f"tripanel_{gas}_{ts}.png"
+    args = (gas, UNITS[gas], lons, lats, good_vals, vmax, points, os.path.join(OUTPUT_DIR, out_name))
+    return args, f"/static/outputs/{out_name}"
 
 
 def visualize_tripanel_for_gas(gas: str, datatree: Any, hotspots: List[Dict[str, Any]],
                                regional_alerts: List[Dict[str, Any]],
-                               thresholds: Dict[str, float]) -> str:
-    data_proj = ccrs.PlateCarree()
-    var_name = VARIABLE_NAMES[gas]
-    da = datatree[var_name]
+                               thresholds: Dict[str, float],
+                               good_data: Any = None,
+                               stats: Optional[Dict[str, float]] = None) -> str:
+    if good_data is None:
+        da = datatree[VARIABLE_NAMES[gas]]
+        qf = None
+        if 'product/main_data_quality_flag' in datatree:
+            qf = datatree["product/main_data_quality_flag"].values
+        good_data = da.where(qf == 0).squeeze() if qf is not None else da.squeeze()
+    args, url = _tripanel_job(
+        gas, datatree["geolocation/longitude"].values, datatree["geolocation/latitude"].values,
+        np.asarray(getattr(good_data, 'values', good_data)), hotspots, stats=stats,
+    )
+    render_tripanel(*args)
+    return url
 
-    lons_raw = datatree["geolocation/longitude"].values
-    lats_raw = datatree["geolocation/latitude"].values
-    if lons_raw.ndim == 1 and lats_raw.ndim == 1:
-        lons, lats = np.meshgrid(lons_raw, lats_raw)
-    else:
-        lons = lons_raw
-        lats = lats_raw
 
-    qf = None
+def _make_render_pool() -> ProcessPoolExecutor:
+    """Worker processes for tri-panel renders; spawned (not forked) since the server is multi-threaded."""
+    return ProcessPoolExecutor(
+        max_workers=max(1, min(len(VARIABLE_NAMES), os.cpu_count() or 1)),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+# Opened gas files keyed by path, reused across requests while the file's mtime/size are unchanged.
+# Entries hold eagerly loaded, read-only arrays so concurrent requests can share them safely.
+GAS_FILE_CACHE_MAX = 8
+_gas_file_cache: Dict[str, Tuple[Tuple[float, int], Dict[str, Any]]] = {}
+# Callers run in asyncio.to_thread workers: _gas_file_lock guards the dict (lookup/insert/evict), and a
+# per-path lock makes a second request for the same file wait for the first open instead of repeating it.
+# A path's lock is dropped with its cache entry (or when its load fails), so the locks stay bounded too.
+_gas_file_lock = threading.Lock()
+_gas_file_path_locks: Dict[str, threading.Lock] = {}
+
+
+def _open_gas_file(data_file: str, gas: str, cacheable: bool = True) -> Dict[str, Any]:
+    """
+    Open a gas file and materialize its arrays once, cached while fresh. Returns datatree, data
+    (quality-filtered DataArray), values/lats/lons (the NumPy arrays every consumer shares), hotspots, stats.
+    """
+    if not cacheable:
+        return _load_gas_file(data_file, gas, cacheable=False)
+    st = os.stat(data_file)
+    stamp = (st.st_mtime, st.st_size)
+    with _gas_file_lock:
+        hit = _gas_file_cache.get(data_file)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+        path_lock = _gas_file_path_locks.setdefault(data_file, threading.Lock())
+    with path_lock:
+        # Another request may have loaded this file while we waited
+        with _gas_file_lock:
+            hit = _gas_file_cache.get(data_file)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+        try:
+            entry = _load_gas_file(data_file, gas, cacheable=True)
+        except Exception:
+            with _gas_file_lock:
+                if data_file not in _gas_file_cache:
+                    _gas_file_path_locks.pop(data_file, None)
+            raise
+        with _gas_file_lock:
+            if data_file not in _gas_file_cache and len(_gas_file_cache) >= GAS_FILE_CACHE_MAX:
+                evicted = next(iter(_gas_file_cache))
+                _gas_file_cache.pop(evicted, None)
+                _gas_file_path_locks.pop(evicted, None)
+            _gas_file_cache[data_file] = (stamp, entry)
+    return entry
+
+
+def _load_gas_file(data_file: str, gas: str, cacheable: bool) -> Dict[str, Any]:
+    """Entry dict for _open_gas_file; cacheable entries load the whole datatree so they outlive the request."""
+    datatree = xr.open_datatree(data_file)
+    var_name = VARIABLE_NAMES[gas]
+    # float32 holds these column densities/indices comfortably and halves every downstream pass
+    da = datatree[var_name].astype(np.float32)
+    lons = datatree["geolocation/longitude"].values
+    lats = datatree["geolocation/latitude"].values
     if 'product/main_data_quality_flag' in datatree:
         qf = datatree["product/main_data_quality_flag"].values
-    good_data = da.where(qf == 0).squeeze() if qf is not None else da.squeeze()
-
-    fig = plt.figure(figsize=(24, 8))
-
-    # Panel 1: concentration
-    ax1 = fig.add_subplot(131, projection=data_proj)
-    ax1.add_feature(cfeature.OCEAN, color="white", zorder=0)
-    ax1.add_feature(cfeature.LAND, color="white", zorder=0)
-    ax1.add_feature(cfeature.STATES, color="black", linewidth=1, zorder=1)
-    ax1.coastlines(resolution="10m", color="black", linewidth=1, zorder=1)
-    vmax1 = float(np.nanpercentile(good_data, 98))
-    contour1 = ax1.contourf(
-        lons, lats, good_data,
-        levels=30,
-        vmin=0,
-        vmax=vmax1 if np.isfinite(vmax1) and vmax1 > 0 else float(np.nanmax(good_data)),
-        alpha=0.9,
-        cmap='YlOrRd',
-        zorder=2
-    )
-    try:
-        ax1.contour(lons, lats, good_data, levels=12, colors='k', linewidths=0.3, alpha=0.6, zorder=3)
-    except Exception:
-        pass
-    cb1 = plt.colorbar(contour1, ax=ax1, fraction=0.046, pad=0.04)
-    cb1.set_label(f"{gas} ({UNITS[gas]})", fontsize=10)
-    ax1.set_title(f"{gas} Concentration", fontsize=12, weight='bold', pad=10)
-
-    # Panel 2: hotspots overlay (rects approximated by center points for simplicity)
-    ax2 = fig.add_subplot(132, projection=data_proj)
-    ax2.add_feature(cfeature.OCEAN, color="white", zorder=0)
-    ax2.add_feature(cfeature.LAND, color="white", zorder=0)
-    ax2.add_feature(cfeature.STATES, color="black", linewidth=1, zorder=1)
-    ax2.coastlines(resolution="10m", color="black", linewidth=1, zorder=1)
-    vmax2 = float(np.nanpercentile(good_data, 98))
-    contour2 = ax2.contourf(
-        lons, lats, good_data,
-        levels=30,
-        vmin=0,
-        vmax=vmax2 if np.isfinite(vmax2) and vmax2 > 0 else float(np.nanmax(good_data)),
-        alpha=0.85,
-        cmap='YlOrRd',
-        zorder=2
-    )
+        good_data = da.where(qf == 0).squeeze()
+    else:
+        good_data = da.squeeze()
+    if cacheable:
+        datatree.load()
+    good_data = good_data.load()
+    values = good_data.values
+    entry = {
+        'datatree': datatree,
+        'data': good_data,
+        'values': values,
+        'lats': lats,
+        'lons': lons,
+        'hotspots': detect_hotspots(values, lats, lons, gas),
+        'stats': scan_grid_stats(values),
+        # Lazily built per-scene lookups (see _scene_route_index); shared with every copy of this entry
+        'derived': {},
+    }
+    return entry
+
+
+def _process_gas(
+    gas: str,
+    center_lat: float,
+    center_lon: float,
+    radius: float,
+    location_name: str,
+    data_file: Optional[str],
+    cacheable: bool = True,
+) -> Dict[str, Any]:
+    """Load one gas file (latest local file if none given) and run hotspot/alert analysis; returns its gas_data entry."""
+    data_file = data_file or find_latest_file_for_gas(gas)
+    if not data_file or not os.path.exists(data_file):
+        return {'datatree': None, 'data': None, 'hotspots': [], 'alerts': [], 'file': None}
     try:
-        ax2.contour(lons, lats, good_data, levels=10, colors='k', linewidths=0.3, alpha=0.6, zorder=3)
+        opened = _open_gas_file(data_file, gas, cacheable=cacheable)
+        alerts = check_regional_alerts(opened['values'], opened['lats'], opened['lons'],
+                                       center_lat, center_lon, radius, gas, location_name)
+        # Copy: the opened entry is shared through the file cache, alerts are per request
+        return dict(opened, alerts=alerts, file=data_file)
     except Exception:
-        pass
-    plt.colorbar(contour2, ax=ax2, fraction=0.046, pad=0.04)
-    for i, h in enumerate([h for h in hotspots if h['gas'] == gas][:15]):
-        ax2.plot(h['center_lon'], h['center_lat'], 'o', color='black',
-                 markersize=6, markeredgecolor='white', markeredgewidth=1,
-                 transform=data_proj, zorder=4)
-        if i < 5:
-            ax2.text(h['center_lon'], h['center_lat'], str(i+1), fontsize=9,
-                     ha='center', va='center', color='white', weight='bold',
-                     transform=data_proj, zorder=5,
-                     bbox=dict(boxstyle='circle', facecolor='black', edgecolor='white', linewidth=1))
-    ax2.set_title("Detected Hotspots", fontsize=12, weight='bold', pad=10)
-
-    # Panel 3: categorical alert map
-    ax3 = fig.add_subplot(133, projection=data_proj)
-    ax3.add_feature(cfeature.OCEAN, color="white", zorder=0)
-    ax3.add_feature(cfeature.LAND, color="white", zorder=0)
-    ax3.add_feature(cfeature.STATES, color="black", linewidth=1, zorder=1)
-    ax3.coastlines(resolution="10m", color="black", linewidth=1, zorder=1)
-    alert_levels = np.zeros_like(good_data.values)
-    for i in range(good_data.shape[0]):
-        for j in range(good_data.shape[1]):
-            if not np.isnan(good_data.values[i, j]):
-                _, sev = classify_pollution_level(good_data.values[i, j], gas)
-                alert_levels[i, j] = sev
-            else:
-                alert_levels[i, j] = np.nan
-    contour3 = ax3.contourf(
-        lons, lats, alert_levels,
-        levels=[-0.5, 0.5, 1.5, 2.5, 3.5, 4.5],
-        colors=['#2ECC71', '#F1C40F', '#E67E22', '#E74C3C', '#8E44AD'],
-        alpha=0.7, zorder=2
-    )
-    plt.colorbar(contour3, ax=ax3, fraction=0.046, pad=0.04,
-                 ticks=[0, 1, 2, 3, 4])
-    ax3.set_title("Alert Levels", fontsize=12, weight='bold', pad=10)
-
-    plt.tight_layout()
-    ts = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    out_name = f"tripanel_{gas}_{ts}.png"
-    out_path = os.path.join(OUTPUT_DIR, out_name)
-    plt.savefig(out_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
-    return f"/static/outputs/{out_name}"
+        return {'datatree': None, 'data': None, 'hotspots': [], 'alerts': [], 'file': data_file}
 
 
-def load_and_analyze_for_gases(
+async def load_and_analyze_for_gases(
     gases: List[str],
     center_lat: float,
     center_lon: float,
@@ -580,44 +811,24 @@ def load_and_analyze_for_gases(
     location_name: str,
     file_overrides: Optional[Dict[str, str]] = None,
 ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Analyze each gas in its own worker thread; gases are independent files, so they load concurrently."""
+    overrides = file_overrides or {}
+    # Per-request temp downloads (file_overrides) are never reused, so only cache local files
+    entries = await asyncio.gather(*(
+        asyncio.to_thread(
+            _process_gas, gas, center_lat, center_lon, radius, location_name,
+            overrides.get(gas), gas not in overrides,
+        )
+        for gas in gases
+    ))
+
     gas_data: Dict[str, Any] = {}
     all_hotspots: List[Dict[str, Any]] = []
     all_alerts: List[Dict[str, Any]] = []
-    overrides = file_overrides or {}
-
-    for gas in gases:
-        data_file = overrides.get(gas) or find_latest_file_for_gas(gas)
-        if not data_file or not os.path.exists(data_file):
-            gas_data[gas] = {'datatree': None, 'data': None, 'hotspots': [], 'alerts': [], 'file': None}
-            continue
-
-        try:
-            datatree = xr.open_datatree(data_file)
-            var_name = VARIABLE_NAMES[gas]
-            da = datatree[var_name]
-            lons = datatree["geolocation/longitude"].values
-            lats = datatree["geolocation/latitude"].values
-            if 'product/main_data_quality_flag' in datatree:
-                qf = datatree["product/main_data_quality_flag"].values
-                good_data = da.where(qf == 0).squeeze()
-            else:
-                good_data = da.squeeze()
-
-            hs = detect_hotspots(good_data.values, lats, lons, gas)
-            alerts = check_regional_alerts(good_data.values, lats, lons, center_lat, center_lon, radius, gas, location_name)
-            all_hotspots.extend(hs)
-            all_alerts.extend(alerts)
-
-            gas_data[gas] = {
-                'datatree': datatree,
-                'data': good_data,
-                'hotspots': hs,
-                'alerts': alerts,
-                'file': data_file,
-            }
-        except Exception:
-            gas_data[gas] = {'datatree': None, 'data': None, 'hotspots': [], 'alerts': [], 'file': data_file}
-
+    for gas, entry in zip(gases, entries):
+        gas_data[gas] = entry
+        all_hotspots.extend(entry['hotspots'])
+        all_alerts.extend(entry['alerts'])
     return gas_data, all_hotspots, all_alerts
 
 
@@ -629,57 +840,63 @@ async def persist_pollution_grid_cells(
 ) -> None:
     """
     Optionally persist gridded pollution cells to PostGIS (pollution_grid).
-    Builds a small polygon per grid point and inserts with severity from classify_pollution_level.
+    Builds a small polygon per grid point, classifies with classify_severity_array and bulk-inserts per gas.
     """
     for gas, info in gas_data.items():
         if info.get("data") is None or info.get("datatree") is None:
             continue
-        da = info["data"]
-        lats_raw = info["datatree"]["geolocation/latitude"].values
-        lons_raw = info["datatree"]["geolocation/longitude"].values
-        if lats_raw.ndim == 1 and lons_raw.ndim == 1:
-            lons_grid, lats_grid = np.meshgrid(lons_raw, lats_raw)
-        else:
-            lats_grid = lats_raw
-            lons_grid = lons_raw
-        vals = da.values
+        lats_raw = info["lats"]
+        lons_raw = info["lons"]
+        lats_grid, lons_grid = _lat_lon_grids(lats_raw, lons_raw)
+        vals = info["values"]
         if vals.size == 0:
             continue
         # Approximate cell half-size in degrees (TEMPO L3 ~ 0.05 deg)
         dy = 0.025
         dx = 0.025
-        count = 0
-        for i in range(0, vals.shape[0], max(1, vals.shape[0] // 50)):
-            if count >= max_cells_per_gas:
+        rows: List[Dict[str, Any]] = []
+        step_i = max(1, vals.shape[0] // 50)
+        step_j = max(1, vals.shape[1] // 50)
+        # Classify the sampled cells in one pass instead of per cell
+        sev_sampled = classify_severity_array(vals[::step_i, ::step_j], gas)
+        for si, i in enumerate(range(0, vals.shape[0], step_i)):
+            if len(rows) >= max_cells_per_gas:
                 break
-            for j in range(0, vals.shape[1], max(1, vals.shape[1] // 50)):
-                if count >= max_cells_per_gas:
+            for sj, j in enumerate(range(0, vals.shape[1], step_j)):
+                if len(rows) >= max_cells_per_gas:
                     break
                 v = float(vals[i, j])
                 if np.isnan(v):
                     continue
                 lat_c = float(lats_grid[i, j])
                 lon_c = float(lons_grid[i, j])
-                _, severity = classify_pollution_level(v, gas)
+                severity = int(sev_sampled[si, sj])
                 # Build polygon (closed ring): minx miny, maxx miny, maxx maxy, minx maxy, minx miny
                 wkt = (
                     f"POLYGON(({lon_c - dx} {lat_c - dy}, {lon_c + dx} {lat_c - dy}, "
                     f"{lon_c + dx} {lat_c + dy}, {lon_c - dx} {lat_c + dy}, {lon_c - dx} {lat_c - dy}))"
                 )
-                row = PollutionGrid(
-                    timestamp=timestamp,
-                    gas_type=gas,
-                    geom=WKTElement(wkt, srid=4326),
-                    pollution_value=v,
-                    severity_level=severity,
-                )
-                session.add(row)
-                count += 1
+                rows.append({
+                    "timestamp": timestamp,
+                    "gas_type": gas,
+                    "geom_wkt": wkt,
+                    "pollution_value": v,
+                    "severity_level": severity,
+                })
+        await bulk_insert_pollution_grid(session, rows)
 
 
 # -----------------------------
 # Weather API Endpoints
 # -----------------------------
+async def fetch_weather(lat: float, lon: float, days: int = 1) -> Dict[str, Any]:
+    """get_weather_data over the shared HTTP client (blocking fallback outside the app lifespan)."""
+    client = getattr(app.state, "http", None)
+    if client is None:
+        return await asyncio.to_thread(get_weather_data, lat, lon, days)
+    return await get_weather_data_async(client, lat, lon, days)
+
+
 @app.get("/api/weather")
 async def api_weather(
     request: Request,
@@ -692,7 +909,7 @@ async def api_weather(
     Integrates with WeatherAPI.com to provide real-time weather data.
     """
     redis = getattr(request.app.state, "redis", None)
-    return await get_weather_cached(redis, lat, lon, days, get_weather_data)
+    return await get_weather_cached(redis, lat, lon, days, fetch_weather)
 
 
 @app.get("/api/pollutant_movement")
@@ -724,7 +941,7 @@ async def api_combined_analysis(
     """
     # Get weather data (cached)
     redis = getattr(request.app.state, "redis", None)
-    weather_data = await get_weather_cached(redis, lat, lon, 1, get_weather_data)
+    weather_data = await get_weather_cached(redis, lat, lon, 1, fetch_weather)
     gas_list = [g.strip().upper() for g in (gases or "NO2").split(',') if g.strip()]
     gas_list = [g for g in gas_list if g in VARIABLE_NAMES]
     if not gas_list:
@@ -732,7 +949,7 @@ async def api_combined_analysis(
     location_name = "Combined Analysis Location"
     overrides, temp_paths = await resolve_netcdf_paths_for_gases(db, gas_list)
     try:
-        gas_data, all_hotspots, all_alerts = load_and_analyze_for_gases(
+        gas_data, all_hotspots, all_alerts = await load_and_analyze_for_gases(
             gas_list, lat, lon, radius, location_name, file_overrides=overrides
         )
         result = {
@@ -768,6 +985,18 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return R * c
 
 
+def haversine_km_vec(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Element-wise (broadcasting) haversine_km over NumPy arrays."""
+    R = 6371.0
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    dlat = lat2 - lat1
+    dlon = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return R * c
+
+
 def parse_coordinates(text: str) -> Optional[Tuple[float, float]]:
     try:
         if not text:
@@ -784,7 +1013,15 @@ def parse_coordinates(text: str) -> Optional[Tuple[float, float]]:
     return None
 
 
-def robust_geocode(name: str) -> Optional[Tuple[float, float]]:
+def _geocode_us(query: str) -> Optional[Tuple[float, float]]:
+    """Last-resort lookup restricted to US results; raises on timeouts/network errors (not cached as no match)."""
+    location = _biased_geocoder.geocode(query, timeout=10, country_codes='us')
+    if location:
+        return (float(location.latitude), float(location.longitude))
+    return None
+
+
+async def robust_geocode(name: str, redis: Any = None) -> Optional[Tuple[float, float]]:
     # 1) If coordinates provided, use them directly
     coords = parse_coordinates(name)
     if coords:
@@ -797,53 +1034,34 @@ def robust_geocode(name: str) -> Optional[Tuple[float, float]]:
 
     cleaned = _clean(name)
 
-    # 2) Try plain and cleaned
-    c = geocode_location(name)
-    if c:
-        return c
-    if cleaned and cleaned != name:
-        c = geocode_location(cleaned)
-        if c:
-            return c
-    # 3) Try appending common qualifiers
+    # 2) Plain and cleaned, then common qualifiers; cached variants resolve in one MGET,
+    #    uncached ones are issued together and the first hit wins
+    candidates = [name, cleaned]
     for suffix in [", California", ", USA", ", CA, USA", " California, USA", ", Santa Barbara County, CA"]:
-        c = geocode_location(name + suffix)
-        if c:
-            return c
-        if cleaned:
-            c = geocode_location(cleaned + suffix)
-            if c:
-                return c
-    # 4) Try bounded by US West viewbox to bias search
-    try:
-        geolocator = Nominatim(user_agent="tempo_pollution_frontend_bias")
-        # Prefer US results
-        location = geolocator.geocode(name, timeout=10, country_codes='us')
-        if location:
-            return (float(location.latitude), float(location.longitude))
+        candidates.append(name + suffix)
         if cleaned:
-            location = geolocator.geocode(cleaned, timeout=10, country_codes='us')
-            if location:
-                return (float(location.latitude), float(location.longitude))
-        # Try stronger California bias
-        location = geolocator.geocode(f"{name}, California, USA", timeout=10, country_codes='us')
-        if location:
-            return (float(location.latitude), float(location.longitude))
-    except Exception:
-        pass
-    return None
+            candidates.append(cleaned + suffix)
+    c = await geocode_first_hit(redis, candidates, _geocode_lookup)
+    if c:
+        return c
+    # 3) Try bounded by US to bias search (and a stronger California bias); same throttle and cache,
+    #    keyed apart from the unrestricted lookups
+    return await geocode_first_hit(
+        redis, [name, cleaned, f"{name}, California, USA"], _geocode_us, namespace="us:"
+    )
 
 
 def sample_line(lat1: float, lon1: float, lat2: float, lon2: float, step_km: float) -> List[Tuple[float, float]]:
     total = haversine_km(lat1, lon1, lat2, lon2)
     n = max(2, int(total / max(1.0, step_km)))
-    pts = []
-    for i in range(n + 1):
-        t = i / n
-        lat = lat1 + (lat2 - lat1) * t
-        lon = lon1 + (lon2 - lon1) * t
-        pts.append((lat, lon))
-    return pts
+    t = np.arange(n + 1) / n
+    lats = lat1 + (lat2 - lat1) * t
+    lons = lon1 + (lon2 - lon1) * t
+    return list(zip(lats.tolist(), lons.tolist()))
+
+
+# Swath grids are bucketed in row blocks of about this many pixels to keep the temporaries cache-sized
+SEVERITY_GRID_CHUNK_PIXELS = 1 << 20
 
 
 def build_severity_grid(gas_data: Dict[str, Any], gases: List[str], bounds: Tuple[float, float, float, float],
@@ -851,29 +1069,40 @@ def build_severity_grid(gas_data: Dict[str, Any], gases: List[str], bounds: Tupl
     lon_min, lat_min, lon_max, lat_max = bounds
     lats = np.arange(lat_min, lat_max + step_deg, step_deg)
     lons = np.arange(lon_min, lon_max + step_deg, step_deg)
-    grid = np.zeros((len(lats), len(lons)))
-    # Aggregate max severity per cell across requested gases
+    grid = np.zeros((len(lats), len(lons)), dtype=np.uint8)
+    gases = [g for g in gases if (gas_data.get(g) or {}).get('data') is not None]
+    if not gases:
+        return grid, lats, lons
+    # Aggregate max severity per cell across requested gases: bucket every pixel to its nearest cell
+    # and scatter-max the severities. Only pixels that land inside the grid are classified.
     for gas in gases:
-        info = gas_data.get(gas)
-        if not info or info.get('data') is None:
-            continue
-        da = info['data']
+        info = gas_data[gas]
         try:
-            vals = da.values
-            lats_raw = info['datatree']["geolocation/latitude"].values
-            lons_raw = info['datatree']["geolocation/longitude"].values
+            values = info['values']
+            lats_raw = info['lats']
+            lons_raw = info['lons']
             if lats_raw.ndim == 1 and lons_raw.ndim == 1:
-                lon_grid, lat_grid = np.meshgrid(lons_raw, lats_raw)
-            else:
-                lat_grid = lats_raw
-                lon_grid = lons_raw
-            for i, glat in enumerate(lats):
-                for j, glon in enumerate(lons):
-                    mask = (np.abs(lat_grid - glat) <= step_deg/2) & (np.abs(lon_grid - glon) <= step_deg/2)
-                    if np.any(mask):
-                        v = np.nanmax(vals[mask])
-                        _, sev = classify_pollution_level(float(v), gas)
-                        grid[i, j] = max(grid[i, j], sev)
+                # Regular grid: bucket the 1D axes, then combine into per-pixel cell ids
+                ri = np.rint((lats_raw - lat_min) / step_deg)
+                cj = np.rint((lons_raw - lon_min) / step_deg)
+                rows = np.flatnonzero((ri >= 0) & (ri < len(lats)))
+                cols = np.flatnonzero((cj >= 0) & (cj < len(lons)))
+                if rows.size == 0 or cols.size == 0:
+                    continue
+                cell = ri[rows].astype(np.intp)[:, None] * len(lons) + cj[cols].astype(np.intp)[None, :]
+                sev = classify_severity_array(values[np.ix_(rows, cols)], gas)
+                np.maximum.at(grid.ravel(), cell.ravel(), sev.ravel())
+                continue
+            step_rows = max(1, SEVERITY_GRID_CHUNK_PIXELS // max(1, values.shape[1]))
+            for r0 in range(0, values.shape[0], step_rows):
+                block = slice(r0, r0 + step_rows)
+                ri = np.rint((lats_raw[block] - lat_min) / step_deg)
+                cj = np.rint((lons_raw[block] - lon_min) / step_deg)
+                inside = (ri >= 0) & (ri < len(lats)) & (cj >= 0) & (cj < len(lons))
+                if not inside.any():
+                    continue
+                cell = ri[inside].astype(np.intp) * len(lons) + cj[inside].astype(np.intp)
+                np.maximum.at(grid.ravel(), cell, classify_severity_array(values[block][inside], gas))
         except Exception:
             continue
     return grid, lats, lons
@@ -881,58 +1110,50 @@ def build_severity_grid(gas_data: Dict[str, Any], gases: List[str], bounds: Tupl
 
 def a_star_avoid_pollution(grid: np.ndarray, lats: np.ndarray, lons: np.ndarray,
                            start: Tuple[float, float], goal: Tuple[float, float]) -> List[Tuple[float, float]]:
-    # Map lat/lon to nearest grid indices
+    # Map lat/lon to nearest grid indices; lats/lons are uniform np.arange axes from build_severity_grid
+    n_lat, n_lon = len(lats), len(lons)
+    lat0, lon0 = float(lats[0]), float(lons[0])
+    step_lat = float(lats[1] - lats[0]) if n_lat > 1 else 1.0
+    step_lon = float(lons[1] - lons[0]) if n_lon > 1 else 1.0
+
     def idx_for(lat: float, lon: float) -> Tuple[int, int]:
-        i = int(np.clip(np.searchsorted(lats, lat), 1, len(lats)-1))
-        j = int(np.clip(np.searchsorted(lons, lon), 1, len(lons)-1))
-        # choose closer neighbor
-        i = i-1 if abs(lats[i-1]-lat) <= abs(lats[i]-lat) else i
-        j = j-1 if abs(lons[j-1]-lon) <= abs(lons[j]-lon) else j
+        i = int(round((lat - lat0) / step_lat))
+        j = int(round((lon - lon0) / step_lon))
+        i = 0 if i < 0 else (n_lat - 1 if i >= n_lat else i)
+        j = 0 if j < 0 else (n_lon - 1 if j >= n_lon else j)
         return i, j
 
-    si, sj = idx_for(start[0], start[1])
-    gi, gj = idx_for(goal[0], goal[1])
-
-    from heapq import heappush, heappop
-    open_set = []
-    heappush(open_set, (0, (si, sj)))
-    came_from = {}
-    gscore = {(si, sj): 0.0}
-
-    def heuristic(i: int, j: int) -> float:
-        return abs(i - gi) + abs(j - gj)
-
-    neighbors = [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(-1,1),(1,-1),(1,1)]
-
-    while open_set:
-        _, current = heappop(open_set)
-        if current == (gi, gj):
-            # reconstruct
-            path = [current]
-            while current in came_from:
-                current = came_from[current]
-                path.append(current)
-            path.reverse()
-            coords = [(float(lats[i]), float(lons[j])) for (i, j) in path]
-            return coords
-        ci, cj = current
-        for di, dj in neighbors:
-            ni, nj = ci + di, cj + dj
-            if ni < 0 or nj < 0 or ni >= grid.shape[0] or nj >= grid.shape[1]:
-                continue
-            # movement cost (diagonal slightly more) + pollution penalty
-            move_cost = 1.4 if di != 0 and dj != 0 else 1.0
-            pollution_penalty = 1.0 + grid[ni, nj] * 3.0
-            tentative = gscore[current] + move_cost * pollution_penalty
-            if (ni, nj) not in gscore or tentative < gscore[(ni, nj)]:
-                came_from[(ni, nj)] = current
-                gscore[(ni, nj)] = tentative
-                heappush(open_set, (tentative + heuristic(ni, nj), (ni, nj)))
-    return []
-
-
-def fetch_osrm_routes(o_lat: float, o_lon: float, d_lat: float, d_lon: float, alternatives: bool = True) -> List[Dict[str, Any]]:
+    path = astar_grid_path(grid, idx_for(start[0], start[1]), idx_for(goal[0], goal[1]))
+    # Cell indices back to coordinates with one gather per axis
+    return list(zip(lats[path[:, 0]].tolist(), lons[path[:, 1]].tolist()))
+
+
+# OSRM routes for the same (rounded) O/D rarely change; keep a small in-process TTL cache
+OSRM_CACHE_TTL_S = 600
+OSRM_CACHE_MAX = 256
+_osrm_cache: Dict[Tuple[float, float, float, float, bool], Tuple[float, List[Dict[str, Any]]]] = {}
+
+
+def _osrm_cache_put(key: Tuple[float, float, float, float, bool], routes: List[Dict[str, Any]]) -> None:
+    # FIFO eviction keeps the cache at OSRM_CACHE_MAX entries
+    if key not in _osrm_cache and len(_osrm_cache) >= OSRM_CACHE_MAX:
+        _osrm_cache.pop(next(iter(_osrm_cache)))
+    _osrm_cache[key] = (time.monotonic(), routes)
+
+
+async def fetch_osrm_routes(client: Optional[httpx.AsyncClient], o_lat: float, o_lon: float, d_lat: float, d_lon: float,
+                            alternatives: bool = True, redis: Any = None) -> List[Dict[str, Any]]:
     """Fetch road routes from OSRM public server. Returns list of routes with geojson geometry."""
+    key = (round(o_lat, 3), round(o_lon, 3), round(d_lat, 3), round(d_lon, 3), alternatives)
+    hit = _osrm_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < OSRM_CACHE_TTL_S:
+        return hit[1]
+    # Shared across workers through Redis; the in-process entry above saves the round-trip
+    redis_key = key_osrm_routes(o_lat, o_lon, d_lat, d_lon, alternatives)
+    routes = await cache_get(redis, redis_key)
+    if routes:
+        _osrm_cache_put(key, routes)
+        return routes
     try:
         alt_flag = 'true' if alternatives else 'false'
         url = (
@@ -940,15 +1161,23 @@ def fetch_osrm_routes(o_lat: float, o_lon: float, d_lat: float, d_lon: float, al
             f"{o_lon:.6f},{o_lat:.6f};{d_lon:.6f},{d_lat:.6f}"
             f"?overview=full&geometries=geojson&alternatives={alt_flag}&steps=false"
         )
-        r = requests.get(url, timeout=15)
+        if client is None:
+            async with httpx.AsyncClient(timeout=15) as tmp:
+                r = await tmp.get(url)
+        else:
+            r = await client.get(url)
         if r.status_code != 200:
             return []
         data = r.json()
         if not data or data.get('code') != 'Ok':
             return []
-        return data.get('routes', []) or []
+        routes = data.get('routes', []) or []
     except Exception:
         return []
+    _osrm_cache_put(key, routes)
+    if routes:
+        await cache_set(redis, redis_key, routes, OSRM_CACHE_TTL_S)
+    return routes
 
 
 def resample_polyline_km(coords: List[List[float]], step_km: float) -> List[Tuple[float, float]]:
@@ -956,95 +1185,159 @@ def resample_polyline_km(coords: List[List[float]], step_km: float) -> List[Tupl
     if not coords:
         return []
     out: List[Tuple[float, float]] = [(float(coords[0][0]), float(coords[0][1]))]
-    acc = 0.0
-    for i in range(1, len(coords)):
-        lat1, lon1 = float(coords[i-1][0]), float(coords[i-1][1])
-        lat2, lon2 = float(coords[i][0]), float(coords[i][1])
-        seg = haversine_km(lat1, lon1, lat2, lon2)
-        if seg <= 0:
-            continue
-        acc += seg
-        if acc >= max(0.5, step_km):
-            out.append((lat2, lon2))
-            acc = 0.0
+    pts = np.array([(c[0], c[1]) for c in coords], dtype=float)
+    # Cumulative length to each vertex; emit the first vertex at least step_km past the last one emitted
+    cum = np.zeros(len(pts))
+    np.cumsum(haversine_km_vec(pts[:-1, 0], pts[:-1, 1], pts[1:, 0], pts[1:, 1]), out=cum[1:])
+    step = max(0.5, step_km)
+    i = int(np.searchsorted(cum, step))
+    while i < len(cum):
+        out.append((float(pts[i, 0]), float(pts[i, 1])))
+        i = int(np.searchsorted(cum, cum[i] + step))
     if out[-1] != (float(coords[-1][0]), float(coords[-1][1])):
         out.append((float(coords[-1][0]), float(coords[-1][1])))
     return out
 
 
+def _scene_route_index(info: Dict[str, Any], gas: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, bool, Any,
+                                                                  Optional[np.ndarray]]:
+    """
+    (sev_grid, lat_grid, lon_grid, is_1d, tree, sev_flat) for route scoring. Built once per opened file and
+    kept in its 'derived' dict, so every request and route alternative on the same scene reuses it.
+    """
+    derived = info.get('derived')
+    if derived is not None and 'route_index' in derived:
+        return derived['route_index']
+    # Pre-bucket pixels into int8 severities so the per-sample scan never classifies floats
+    sev_grid = classify_severity_array(info['values'], gas)
+    lats_raw = info['lats']
+    lons_raw = info['lons']
+    if lats_raw.ndim == 1 and lons_raw.ndim == 1:
+        index = (sev_grid, lats_raw, lons_raw, True, None, None)
+    else:
+        pts = np.column_stack((lats_raw.ravel(), lons_raw.ravel()))
+        finite = np.isfinite(pts).all(axis=1)
+        tree = cKDTree(pts[finite]) if finite.any() else None
+        index = (sev_grid, lats_raw, lons_raw, False, tree, sev_grid.ravel()[finite])
+    if derived is not None:
+        derived['route_index'] = index
+    return index
+
+
 def score_route_exposure(samples: List[Tuple[float, float]], gas_data: Dict[str, Any], gas_list: List[str],
                          proximity_km: float = 10.0,
-                         hotspot_circles: Optional[List[Dict[str, Any]]] = None,
+                         hotspot_circles: Optional[HotspotArrays] = None,
                          hard_block_threshold: int = 3,
                          hotspot_extra_buffer_km: float = 3.0) -> Tuple[float, List[List[float]], List[int], bool]:
     """Compute exposure score and collect dangerous points for a sampled route.
     Also return per-point severities for gradient rendering. Applies a proximity buffer around sample points.
     """
-    danger_points: List[List[float]] = []
-    per_point_severity: List[int] = []
-    total_score: float = 0.0
-    blocked: bool = False
-
-    # Build per-gas coordinate grids once
-    per_gas_coords: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    # Per-gas lookups: 1D axes for regular grids, 2D swath + nearest-pixel KD-tree otherwise
+    per_gas_coords: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, bool, Any, Optional[np.ndarray]]] = {}
     for gas in gas_list:
         info = gas_data.get(gas)
         if not info or info.get('data') is None:
             continue
         try:
-            da = info['data']
-            vals = da.values
-            lats_raw = info['datatree']["geolocation/latitude"].values
-            lons_raw = info['datatree']["geolocation/longitude"].values
-            if lats_raw.ndim == 1 and lons_raw.ndim == 1:
-                lon_grid, lat_grid = np.meshgrid(lons_raw, lats_raw)
-            else:
-                lat_grid = lats_raw
-                lon_grid = lons_raw
-            per_gas_coords[gas] = (vals, lat_grid, lon_grid)
+            per_gas_coords[gas] = _scene_route_index(info, gas)
         except Exception:
             continue
+    if not per_gas_coords and (hotspot_circles is None or not len(hotspot_circles)):
+        # Nothing to score against (no gas loaded, no hotspots): every sample is clean
+        return 0.0, [], [0] * len(samples), False
 
     # Convert proximity to degrees approximately at mid-latitude
     # 1 deg lat ~ 111 km; 1 deg lon ~ 111 km * cos(lat)
-    for lat, lon in samples:
-        max_sev = 0
-        lat_tol = proximity_km / 111.0
-        lon_tol = proximity_km / (111.0 * max(0.1, math.cos(math.radians(lat))))
-        for gas, triple in per_gas_coords.items():
-            vals, lat_grid, lon_grid = triple
-            try:
-                mask = (np.abs(lat_grid - lat) <= lat_tol) & (np.abs(lon_grid - lon) <= lon_tol)
-                if np.any(mask):
-                    v = float(np.nanmax(vals[mask]))
-                else:
-                    # fallback nearest
-                    idx = np.unravel_index(np.nanargmin((lat_grid - lat)**2 + (lon_grid - lon)**2), lat_grid.shape)
-                    v = float(vals[idx])
-                _, sev = classify_pollution_level(v, gas)
-                max_sev = max(max_sev, sev)
-            except Exception:
+    sample_lat = np.array([p[0] for p in samples], dtype=float)
+    sample_lon = np.array([p[1] for p in samples], dtype=float)
+    lat_tol = proximity_km / 111.0
+    lon_tols = proximity_km / (111.0 * np.maximum(0.1, np.cos(np.radians(sample_lat))))
+    sample_sev = np.zeros(len(samples), dtype=np.int64)
+    for gas, entry in per_gas_coords.items():
+        sev_grid, lat_grid, lon_grid, is_1d, tree, sev_flat = entry
+        try:
+            if is_1d:
+                # lat_grid / lon_grid are the 1D axes; the proximity box is separable per axis
+                for k, (lat, lon) in enumerate(samples):
+                    imask = np.abs(lat_grid - lat) <= lat_tol
+                    jmask = np.abs(lon_grid - lon) <= lon_tols[k]
+                    if imask.any() and jmask.any():
+                        sev = int(sev_grid[np.ix_(imask, jmask)].max())
+                    else:
+                        i = int(np.nanargmin(np.abs(lat_grid - lat)))
+                        j = int(np.nanargmin(np.abs(lon_grid - lon)))
+                        sev = int(sev_grid[i, j])
+                    sample_sev[k] = max(sample_sev[k], sev)
+                continue
+            if tree is None or not samples:
                 continue
-        # Also consider hotspot circles (whole radius), if provided
-        if hotspot_circles:
-            for c in hotspot_circles:
-                # quick bounding-box precheck in degrees
-                d_km = haversine_km(lat, lon, c['lat'], c['lon'])
-                if d_km <= (c['radius_km'] + hotspot_extra_buffer_km):
-                    max_sev = max(max_sev, int(c.get('severity', 0)))
-        per_point_severity.append(max_sev)
-        total_score += max_sev
-        if max_sev >= hard_block_threshold:
-            danger_points.append([lat, lon])
-            blocked = True
+            # One batched box query for all samples: Chebyshev ball of the larger half-width,
+            # then trim each sample's hits to its exact lat/lon box
+            sample_pts = np.column_stack((sample_lat, sample_lon))
+            hits = tree.query_ball_point(sample_pts, r=np.maximum(lat_tol, lon_tols), p=np.inf)
+            counts = np.fromiter((len(h) for h in hits), dtype=np.intp, count=len(hits))
+            gas_sev = np.full(len(samples), -1, dtype=np.int64)
+            if counts.sum():
+                idx = np.concatenate([np.asarray(h, dtype=np.intp) for h in hits])
+                owner = np.repeat(np.arange(len(samples)), counts)
+                keep = ((np.abs(tree.data[idx, 0] - sample_lat[owner]) <= lat_tol)
+                        & (np.abs(tree.data[idx, 1] - sample_lon[owner]) <= lon_tols[owner]))
+                np.maximum.at(gas_sev, owner[keep], sev_flat[idx[keep]])
+            empty = gas_sev < 0
+            if empty.any():
+                # fallback nearest pixel via the prebuilt KD-tree
+                _, nearest = tree.query(sample_pts[empty])
+                gas_sev[empty] = sev_flat[nearest]
+            np.maximum(sample_sev, gas_sev, out=sample_sev)
+        except Exception:
+            continue
+
+    # Also consider hotspot circles (whole radius), if provided: one samples x circles distance matrix
+    if hotspot_circles is not None and len(hotspot_circles) and samples:
+        H = hotspot_circles
+        d_km = haversine_km_vec(sample_lat[:, None], sample_lon[:, None], H.lats[None, :], H.lons[None, :])
+        hit = d_km <= (H.radii_km + hotspot_extra_buffer_km)
+        np.maximum(sample_sev, np.where(hit, H.severities, 0).max(axis=1), out=sample_sev)
+
+    # Reduce the per-sample array in bulk; lists are only built for the JSON payload
+    sev_arr = sample_sev.astype(np.uint8)
+    danger = sev_arr >= hard_block_threshold
+    total_score = float(sample_sev.sum())
+    danger_points: List[List[float]] = np.column_stack((sample_lat, sample_lon))[danger].tolist()
+    per_point_severity: List[int] = sev_arr.tolist()
+    blocked = bool(danger.any())
     # Strong penalty for blocked routes so selector avoids them when possible
     if blocked:
         total_score += 1e6
     return total_score, danger_points, per_point_severity, blocked
 
 
+def _score_osrm_route(idx: int, rdata: Dict[str, Any], gas_data: Dict[str, Any], gas_list: List[str],
+                      hotspot_circles: HotspotArrays, step_km: float) -> Dict[str, Any]:
+    """Resample one OSRM route and score its exposure; returns the route payload for the response."""
+    geom = rdata.get('geometry', {})
+    coords = geom.get('coordinates') or []
+    latlon_coords = [[float(c[1]), float(c[0])] for c in coords]
+    samples = resample_polyline_km(latlon_coords, step_km)
+    score, danger_pts, per_point_sev, blocked = score_route_exposure(
+        samples, gas_data, gas_list, proximity_km=10.0, hotspot_circles=hotspot_circles,
+        hard_block_threshold=3, hotspot_extra_buffer_km=3.0
+    )
+    return {
+        "name": f"Route {idx+1}",
+        "distance_km": float(rdata.get('distance', 0.0)) / 1000.0,
+        "duration_min": float(rdata.get('duration', 0.0)) / 60.0,
+        "coords": latlon_coords,
+        "score": score,
+        "danger": danger_pts,
+        "severity": per_point_sev,
+        "blocked": blocked,
+    }
+
+
 @app.post("/api/route/analyze")
 async def api_route_analyze(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     origin: str = Form(...),
     destination: str = Form(...),
@@ -1059,8 +1352,10 @@ async def api_route_analyze(
     )
     origin_name = origin.strip()
     dest_name = destination.strip()
-    ocoords = robust_geocode(origin_name)
-    dcoords = robust_geocode(dest_name)
+    redis = getattr(request.app.state, "redis", None)
+    ocoords, dcoords = await asyncio.gather(
+        robust_geocode(origin_name, redis), robust_geocode(dest_name, redis)
+    )
     if not ocoords or not dcoords:
         return JSONResponse(
             {"error": "Could not geocode origin/destination. Please try different names."},
@@ -1083,9 +1378,19 @@ async def api_route_analyze(
     center_lat = (o_lat + d_lat) / 2
     center_lon = (o_lon + d_lon) / 2
     radius = max(abs(lat_max - lat_min), abs(lon_max - lon_min)) / 2
+
+    # Same (~100 m) endpoints, gases and options within the TTL reuse the scored result
+    result_key = key_route_exposure(
+        round(o_lat, 3), round(o_lon, 3), round(d_lat, 3), round(d_lon, 3), gas_list,
+        variant=f"{grid_step_km}:{use_optimized_bool}:{(route_mode or 'commute').strip().lower()}",
+    )
+    cached = await cache_get(redis, result_key)
+    if cached is not None:
+        return dict(cached, origin_name=origin_name, dest_name=dest_name)
+
     overrides, temp_paths = await resolve_netcdf_paths_for_gases(db, gas_list)
     try:
-        gas_data, _, _ = load_and_analyze_for_gases(
+        gas_data, _, _ = await load_and_analyze_for_gases(
             gas_list, center_lat, center_lon, radius, origin_name, file_overrides=overrides
         )
 
@@ -1108,7 +1413,6 @@ async def api_route_analyze(
                 G = build_weighted_graph(north, south, east, west, mode=mode)
                 return k_shortest_paths(G, o_lat, o_lon, d_lat, d_lon, k=3)
             try:
-                import asyncio
                 opt_routes = await asyncio.get_event_loop().run_in_executor(None, _optimized_routes)
                 if opt_routes:
                     for idx, r in enumerate(opt_routes):
@@ -1131,28 +1435,17 @@ async def api_route_analyze(
             except Exception:
                 pass
         if not routes_payload:
-            osrm_routes = fetch_osrm_routes(o_lat, o_lon, d_lat, d_lon, alternatives=True)
+            osrm_routes = await fetch_osrm_routes(
+                getattr(request.app.state, "http", None), o_lat, o_lon, d_lat, d_lon, alternatives=True, redis=redis
+            )
         if osrm_routes:
             hotspot_circles = build_hotspot_circles(gas_data)
-            for idx, rdata in enumerate(osrm_routes):
-                geom = rdata.get('geometry', {})
-                coords = geom.get('coordinates') or []
-                latlon_coords = [[float(c[1]), float(c[0])] for c in coords]
-                samples = resample_polyline_km(latlon_coords, max(5.0, float(grid_step_km)))
-                score, danger_pts, per_point_sev, blocked = score_route_exposure(
-                    samples, gas_data, gas_list, proximity_km=10.0, hotspot_circles=hotspot_circles,
-                    hard_block_threshold=3, hotspot_extra_buffer_km=3.0
-                )
-                routes_payload.append({
-                    "name": f"Route {idx+1}",
-                    "distance_km": float(rdata.get('distance', 0.0)) / 1000.0,
-                    "duration_min": float(rdata.get('duration', 0.0)) / 60.0,
-                    "coords": latlon_coords,
-                    "score": score,
-                    "danger": danger_pts,
-                    "severity": per_point_sev,
-                    "blocked": blocked,
-                })
+            # Alternatives share only read-only grids, so score them concurrently
+            routes_payload.extend(await asyncio.gather(*[
+                asyncio.to_thread(_score_osrm_route, idx, rdata, gas_data, gas_list, hotspot_circles,
+                                  max(5.0, float(grid_step_km)))
+                for idx, rdata in enumerate(osrm_routes)
+            ]))
             if routes_payload:
                 unblocked = [r for r in routes_payload if not r.get('blocked')]
                 candidates = unblocked if unblocked else routes_payload
@@ -1186,9 +1479,9 @@ async def api_route_analyze(
             }]
             status_text = "Road routing unavailable; evaluated direct path"
 
-        hotspots_geojson = gather_hotspots_geojson(gas_data, limit=50)
+        hotspots_geojson = await gather_hotspots_geojson(gas_data, limit=50, redis=redis)
 
-        return {
+        result = {
             "origin_name": origin_name,
             "dest_name": dest_name,
             "origin": {"lat": o_lat, "lon": o_lon},
@@ -1200,6 +1493,8 @@ async def api_route_analyze(
             "grid_step_km": grid_step_km,
             "alt_available": False,
         }
+        await cache_set(redis, result_key, result, TTL_ROUTE_EXPOSURE)
+        return result
     finally:
         for p in temp_paths:
             try:
@@ -1230,7 +1525,7 @@ async def analyze_api(
         except Exception:
             pass
     if (lat_val is None or lon_val is None) and location_name:
-        coords = geocode_location(location_name)
+        coords = await geocode_first_hit(getattr(request.app.state, "redis", None), [location_name], _geocode_lookup)
         if coords:
             lat_val, lon_val = coords
     if lat_val is None or lon_val is None:
@@ -1243,25 +1538,34 @@ async def analyze_api(
 
     overrides, temp_paths = await resolve_netcdf_paths_for_gases(db, gas_list)
     try:
-        gas_data, all_hotspots, all_alerts = load_and_analyze_for_gases(
+        gas_data, all_hotspots, all_alerts = await load_and_analyze_for_gases(
             gas_list, lat_val, lon_val, radius, location_name, file_overrides=overrides
         )
         if getattr(app_settings, "persist_pollution_grid", False):
             try:
                 ts = dt.datetime.now(dt.timezone.utc)
                 await persist_pollution_grid_cells(db, gas_data, ts)
+                await db.commit()
             except Exception:
-                pass
-        image_url = visualize_multi_gas(gas_data, location_name, lat_val, lon_val, radius)
-
+                await db.rollback()
+        # Tri-panels render in worker processes while the combined map renders here
+        render_pool = getattr(request.app.state, "render_pool", None)
+        loop = asyncio.get_running_loop()
         per_gas_images = []
+        renders = []
         for gas in gas_list:
             info = gas_data.get(gas)
             if info and info.get('datatree') is not None:
-                url = visualize_tripanel_for_gas(
-                    gas, info['datatree'], all_hotspots, info['alerts'], POLLUTION_THRESHOLDS.get(gas, {})
+                args, url = _tripanel_job(
+                    gas, info['lons'], info['lats'], info['values'], all_hotspots, stats=info.get('stats'),
                 )
+                if render_pool is not None:
+                    renders.append(loop.run_in_executor(render_pool, render_tripanel, *args))
+                else:
+                    render_tripanel(*args)
                 per_gas_images.append({"gas": gas, "url": url})
+        image_url = visualize_multi_gas(gas_data, location_name, lat_val, lon_val, radius)
+        await asyncio.gather(*renders)
 
         severity = max([a['severity'] for a in all_alerts], default=0)
         severity_to_status = {
@@ -1271,9 +1575,14 @@ async def analyze_api(
         overall_status = severity_to_status.get(severity, 'Good')
 
         enriched_hotspots = []
-        for h in all_hotspots[:10]:
+        top_hotspots = all_hotspots[:10]
+        places = await reverse_geocode_batch(
+            getattr(request.app.state, "redis", None),
+            [(h['center_lat'], h['center_lon']) for h in top_hotspots],
+            reverse_geocode_many,
+        )
+        for h, place in zip(top_hotspots, places):
             h_with_place = dict(h)
-            place = reverse_geocode(h_with_place['center_lat'], h_with_place['center_lon'])
             if place:
                 h_with_place['place'] = place
             enriched_hotspots.append(h_with_place)
@@ -1282,37 +1591,69 @@ async def analyze_api(
         pollutant_predictions = None
         weather_interpretation = None
         prediction_interpretation = None
-        if include_weather or include_pollutant_prediction:
+        redis = getattr(request.app.state, "redis", None)
+
+        async def _fetch_weather() -> Optional[Dict[str, Any]]:
             try:
-                redis = getattr(request.app.state, "redis", None)
-                weather_data = await get_weather_cached(redis, lat_val, lon_val, 1, get_weather_data)
-                if "error" in (weather_data or {}):
-                    weather_data = None
-                elif weather_data:
-                    try:
-                        weather_interpretation = generate_weather_interpretation(weather_data, location_name)
-                    except Exception:
-                        weather_interpretation = None
+                data = await get_weather_cached(redis, lat_val, lon_val, 1, fetch_weather)
             except Exception:
-                weather_data = None
+                return None
+            return None if "error" in (data or {}) else data
 
-        if include_pollutant_prediction and weather_data and "error" not in (weather_data or {}):
+        async def _fetch_predictions() -> Optional[List[Dict[str, Any]]]:
             try:
-                redis = getattr(request.app.state, "redis", None)
-                pollutant_resp = await get_pollutant_movement_cached(
+                resp = await get_pollutant_movement_cached(
                     redis, lat_val, lon_val, get_pollutant_movement_prediction
                 )
-                if "error" not in (pollutant_resp or {}):
-                    pollutant_predictions = pollutant_resp.get("predictions_next_3h", [])
-                    if pollutant_predictions:
-                        try:
-                            prediction_interpretation = generate_prediction_interpretation(
-                                pollutant_predictions, location_name
-                            )
-                        except Exception:
-                            prediction_interpretation = None
             except Exception:
-                pollutant_predictions = None
+                return None
+            return None if "error" in (resp or {}) else (resp or {}).get("predictions_next_3h", [])
+
+        async def _interpret(kind: str, fn: Any, async_fn: Any, *args: Any) -> Optional[str]:
+            # Same inputs give the same advice, so reuse it for the weather TTL instead of another LLM call
+            key = key_groq_interpretation(kind, *args)
+            cached = await cache_get(redis, key)
+            if cached is not None:
+                return cached
+            # Shared client keeps the Groq connection warm; blocking fallback outside the app lifespan
+            client = getattr(request.app.state, "http", None)
+            try:
+                if client is not None:
+                    text = await async_fn(client, *args)
+                else:
+                    text = await asyncio.to_thread(fn, *args)
+            except Exception:
+                return None
+            if text:
+                await cache_set(redis, key, text, TTL_GROQ_INTERPRETATION)
+            return text
+
+        # Weather and the movement forecast are independent upstream calls, so fetch them together
+        if include_weather or include_pollutant_prediction:
+            weather_data, pollutant_predictions = await asyncio.gather(
+                _fetch_weather(),
+                _fetch_predictions() if include_pollutant_prediction else asyncio.sleep(0),
+            )
+        # Predictions are only reported alongside usable weather data
+        if not weather_data:
+            pollutant_predictions = None
+
+        interpretations = []
+        if weather_data:
+            interpretations.append(_interpret(
+                "weather", generate_weather_interpretation, generate_weather_interpretation_async,
+                weather_data, location_name,
+            ))
+        if pollutant_predictions:
+            interpretations.append(_interpret(
+                "prediction", generate_prediction_interpretation, generate_prediction_interpretation_async,
+                pollutant_predictions, location_name,
+            ))
+        results = await asyncio.gather(*interpretations)
+        if weather_data:
+            weather_interpretation = results[0]
+        if pollutant_predictions:
+            prediction_interpretation = results[-1]
 
         return {
             "location": location_name,
@@ -1361,6 +1702,7 @@ def hotspots_to_geojson(hotspots: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 @app.get("/api/hotspots")
 async def api_hotspots(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     location: Optional[str] = Query(default=""),
     latitude: Optional[float] = Query(default=None),
@@ -1372,7 +1714,7 @@ async def api_hotspots(
     lat_val = latitude
     lon_val = longitude
     if (lat_val is None or lon_val is None) and location_name:
-        coords = geocode_location(location_name)
+        coords = await geocode_first_hit(getattr(request.app.state, "redis", None), [location_name], _geocode_lookup)
         if coords:
             lat_val, lon_val = coords
     if lat_val is None or lon_val is None:
@@ -1383,12 +1725,20 @@ async def api_hotspots(
     if not gas_list:
         gas_list = ['NO2']
 
+    redis = getattr(request.app.state, "redis", None)
+    result_key = key_hotspots(round(lat_val, 3), round(lon_val, 3), radius, gas_list)
+    cached = await cache_get(redis, result_key)
+    if cached is not None:
+        return cached
+
     overrides, temp_paths = await resolve_netcdf_paths_for_gases(db, gas_list)
     try:
-        gas_data, _, _ = load_and_analyze_for_gases(
+        gas_data, _, _ = await load_and_analyze_for_gases(
             gas_list, lat_val, lon_val, radius, location_name, file_overrides=overrides
         )
-        return gather_hotspots_geojson(gas_data, limit=200)
+        result = await gather_hotspots_geojson(gas_data, limit=200, redis=redis)
+        await cache_set(redis, result_key, result, TTL_HOTSPOTS)
+        return result
     finally:
         for p in temp_paths:
             try:
@@ -1671,13 +2021,13 @@ async def api_route_optimized_post(request: Request):
 # Auth and saved routes
 # -----------------------------
 @app.post("/auth/register", response_class=JSONResponse)
-async def register(body: UserRegister, db: AsyncSession = Depends(get_db)):
+async def register(body: UserRegister, db: AsyncSession = Depends(get_db_tx)):
     result = await db.execute(select(User).where(User.email == body.email))
     if result.scalar_one_or_none() is not None:
         return JSONResponse({"detail": "Email already registered"}, status_code=409)
     user = User(
         email=body.email,
-        password_hash=hash_password(body.password),
+        password_hash=await asyncio.to_thread(hash_password, body.password),
     )
     db.add(user)
     await db.flush()
@@ -1692,7 +2042,8 @@ async def register(body: UserRegister, db: AsyncSession = Depends(get_db)):
 async def login(body: UserLogin, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == body.email))
     user = result.scalar_one_or_none()
-    if user is None or not verify_password(body.password, user.password_hash):
+    # bcrypt takes tens to hundreds of ms; keep it off the event loop
+    if user is None or not await asyncio.to_thread(verify_password, body.password, user.password_hash):
         return JSONResponse({"detail": "Invalid email or password"}, status_code=401)
     return Token(access_token=create_access_token(user.id))
 
@@ -1737,13 +2088,15 @@ async def list_alerts(
     q = q.order_by(AlertLog.created_at.desc())
     result = await db.execute(q)
     rows = result.scalars().all()
-    return [AlertLogResponse.model_validate(r).model_dump(mode="json") for r in rows]
+    # JSON bytes straight from pydantic-core: no per-row models and no jsonable_encoder pass
+    body = AlertLogListAdapter.dump_json(AlertLogListAdapter.validate_python(rows, from_attributes=True))
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/saved-routes", response_class=JSONResponse)
 async def create_saved_route(
     body: SavedRouteCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_tx),
     current_user: User = Depends(get_current_user),
 ):
     route = SavedRoute(
@@ -1767,7 +2120,8 @@ async def list_saved_routes(
 ):
     result = await db.execute(select(SavedRoute).where(SavedRoute.user_id == current_user.id).order_by(SavedRoute.created_at.desc()))
     routes = result.scalars().all()
-    return [SavedRouteResponse.model_validate(r).model_dump(mode="json") for r in routes]
+    body = SavedRouteListAdapter.dump_json(SavedRouteListAdapter.validate_python(routes, from_attributes=True))
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/saved-routes/{route_id}")
@@ -1786,7 +2140,7 @@ async def get_saved_route(
 @app.delete("/api/saved-routes/{route_id}")
 async def delete_saved_route(
     route_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_tx),
     current_user: User = Depends(get_current_user),
 ):
     result = await db.execute(select(SavedRoute).where(SavedRoute.id == route_id, SavedRoute.user_id == current_user.id))
@@ -1,8 +1,10 @@
 """
 Authentication: password hashing, JWT create/verify, get_current_user dependency.
 """
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -15,7 +17,21 @@ from config import settings
 from database.models import User
 from database.session import get_db
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id when argon2-cffi is installed (cheaper to verify than cost-12 bcrypt at a
+# comparable strength); bcrypt stays listed so existing hashes keep verifying.
+try:
+    import argon2  # noqa: F401  (argon2-cffi, passlib's argon2 backend)
+except ImportError:  # argon2-cffi is optional
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+else:
+    pwd_context = CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated="auto",
+        argon2__type="ID",
+        argon2__time_cost=2,
+        argon2__memory_cost=65536,
+        argon2__parallelism=2,
+    )
 security = HTTPBearer(auto_error=False)
 
 
@@ -33,13 +49,29 @@ def create_access_token(subject: str | int) -> str:
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
+# Verified tokens: digest -> (sub, exp as unix time); entries are dropped once the token expires
+TOKEN_CACHE_MAX = 4096
+_token_cache: Dict[bytes, Tuple[Optional[str], float]] = {}
+
+
 def decode_access_token(token: str) -> Optional[str]:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    hit = _token_cache.get(key)
+    if hit is not None:
+        if time.time() < hit[1]:
+            return hit[0]
+        _token_cache.pop(key, None)
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         sub = payload.get("sub")
-        return sub
     except JWTError:
         return None
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        if len(_token_cache) >= TOKEN_CACHE_MAX:
+            _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[key] = (sub, float(exp))
+    return sub
 
 
 async def get_current_user(
@@ -2,23 +2,60 @@
 Redis cache helpers: key builders and async get/set with TTL.
 Redis is optional (REDIS_URL empty = no cache).
 """
+import asyncio
 import hashlib
+import inspect
 import json
-from typing import Any, Optional
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 # Cache key prefixes and TTLs (seconds)
 TTL_WEATHER = 600
 TTL_POLLUTANT_MOVEMENT = 600
 TTL_HOTSPOTS = 300
 TTL_ROUTE_EXPOSURE = 300
+TTL_REVERSE_GEOCODE = 86400
+TTL_GEOCODE = 86400
+TTL_GROQ_INTERPRETATION = 600  # matches the weather cache freshness
 
+# Nominatim usage policy: at most one request per second
+NOMINATIM_MIN_INTERVAL_S = 1.0
 
-def _key_weather(lat: float, lon: float, days: int) -> str:
-    return f"weather:{lat}:{lon}:{days}"
+# Spatial grid for weather / pollutant movement: 0.05 deg cells (~5 km); a cached
+# payload is reused for any request within SPATIAL_TOLERANCE_KM of where it was fetched.
+SPATIAL_GRID_DEG = 0.05
+SPATIAL_TOLERANCE_KM = 5.0
 
 
-def _key_pollutant_movement(lat: float, lon: float) -> str:
-    return f"pollutant_movement:{lat}:{lon}"
+def _grid_cell(lat: float, lon: float) -> Tuple[int, int]:
+    """Return (ilat, ilon) index of the SPATIAL_GRID_DEG cell containing the point."""
+    return math.floor(lat / SPATIAL_GRID_DEG), math.floor(lon / SPATIAL_GRID_DEG)
+
+
+def _key_weather(ilat: int, ilon: int, days: int) -> str:
+    return f"wx:{ilat}:{ilon}:{days}"
+
+
+def _key_pollutant_movement(ilat: int, ilon: int) -> str:
+    return f"pmv:{ilat}:{ilon}"
+
+
+def _neighbor_cells(ilat: int, ilon: int) -> List[Tuple[int, int]]:
+    """Own cell first, then the 8 surrounding cells."""
+    cells = [(ilat, ilon)]
+    for di in (-1, 0, 1):
+        for dj in (-1, 0, 1):
+            if di or dj:
+                cells.append((ilat + di, ilon + dj))
+    return cells
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    return 6371.0 * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
 def key_hotspots(lat: float, lon: float, radius: float, gases: list[str]) -> str:
@@ -26,11 +63,35 @@ def key_hotspots(lat: float, lon: float, radius: float, gases: list[str]) -> str
     return f"hotspots:{lat}:{lon}:{radius}:{h}"
 
 
-def key_route_exposure(origin_lat: float, origin_lon: float, dest_lat: float, dest_lon: float, gases: list[str]) -> str:
-    h = hashlib.sha256(",".join(sorted(gases)).encode()).hexdigest()[:12]
+def key_route_exposure(origin_lat: float, origin_lon: float, dest_lat: float, dest_lon: float, gases: list[str],
+                       variant: str = "") -> str:
+    """variant folds in any other request options the result depends on (step, routing mode, ...)."""
+    h = hashlib.sha256((",".join(sorted(gases)) + "|" + variant).encode()).hexdigest()[:12]
     return f"route_exposure:{origin_lat}:{origin_lon}:{dest_lat}:{dest_lon}:{h}"
 
 
+def key_geocode(query: str) -> str:
+    """Forward-geocode key for a normalized free-text query."""
+    h = hashlib.sha256(" ".join(query.lower().split()).encode()).hexdigest()[:16]
+    return f"geo:fwd:{h}"
+
+
+def key_groq_interpretation(kind: str, *inputs: Any) -> str:
+    """LLM interpretation keyed by kind ("weather" / "prediction") and a digest of its prompt inputs."""
+    raw = json.dumps([kind, *inputs], sort_keys=True, default=str).encode()
+    return f"groq:{kind}:{hashlib.blake2b(raw, digest_size=16).hexdigest()}"
+
+
+def key_osrm_routes(o_lat: float, o_lon: float, d_lat: float, d_lon: float, alternatives: bool) -> str:
+    """OSRM driving routes for an origin/destination pair rounded to 0.001 deg (~100 m)."""
+    return f"osrm:{round(o_lat, 3)}:{round(o_lon, 3)}:{round(d_lat, 3)}:{round(d_lon, 3)}:{int(alternatives)}"
+
+
+def key_reverse_geocode(lat: float, lon: float) -> str:
+    """Reverse-geocode key on a 0.01 deg (~1 km) grid so clustered hotspots share one lookup."""
+    return f"geo:rev:{round(lat, 2)}:{round(lon, 2)}"
+
+
 def key_route_optimized(
     start_lat: float,
     start_lon: float,
@@ -66,23 +127,215 @@ async def cache_set(redis: Any, key: str, value: Any, ttl: int) -> None:
         pass
 
 
+# In-process stand-in for the spatial cache when Redis is not configured: key -> (expires_at, raw json)
+LOCAL_SPATIAL_CACHE_MAX = 1024
+_local_spatial_cache: Dict[str, Tuple[float, str]] = {}
+
+
+def _local_get(key: str) -> Optional[str]:
+    hit = _local_spatial_cache.get(key)
+    if hit is None or hit[0] < time.monotonic():
+        return None
+    return hit[1]
+
+
+def _local_set(key: str, raw: str, ttl: int) -> None:
+    if key not in _local_spatial_cache and len(_local_spatial_cache) >= LOCAL_SPATIAL_CACHE_MAX:
+        _local_spatial_cache.pop(next(iter(_local_spatial_cache)))
+    _local_spatial_cache[key] = (time.monotonic() + ttl, raw)
+
+
+async def spatial_cache_get(redis: Any, keys: List[str], lat: float, lon: float) -> Optional[Any]:
+    """
+    MGET the given grid-cell keys; return the first payload whose stored (lat, lon)
+    is within SPATIAL_TOLERANCE_KM of (lat, lon), else None. Without Redis, an in-process
+    TTL cache is used instead.
+    """
+    if redis is None:
+        raws = [_local_get(k) for k in keys]
+    else:
+        try:
+            raws = await redis.mget(*keys)
+        except Exception:
+            return None
+    for raw in raws or []:
+        if raw is None:
+            continue
+        try:
+            entry = json.loads(raw)
+            if _haversine_km(lat, lon, float(entry["lat"]), float(entry["lon"])) <= SPATIAL_TOLERANCE_KM:
+                return entry["payload"]
+        except Exception:
+            continue
+    return None
+
+
+async def spatial_cache_set(redis: Any, key: str, lat: float, lon: float, value: Any, ttl: int) -> None:
+    """Store value with the exact point it was fetched for, so neighbours can check distance."""
+    # Upstream failures come back as {"error": ...}; don't pin them for the whole TTL
+    if isinstance(value, dict) and "error" in value:
+        return
+    entry = {"lat": lat, "lon": lon, "payload": value}
+    if redis is None:
+        _local_set(key, json.dumps(entry, default=str), ttl)
+        return
+    await cache_set(redis, key, entry, ttl)
+
+
 async def get_weather_cached(redis: Any, lat: float, lon: float, days: int, fetch_fn: Any) -> dict:
-    """Return weather from cache or fetch and cache."""
-    key = _key_weather(lat, lon, days)
-    cached = await cache_get(redis, key)
+    """
+    Return weather from the spatial grid cache (own + 8 neighbour cells) or fetch and cache.
+    fetch_fn may be a coroutine function (awaited directly) or a blocking one (run in a worker thread).
+    """
+    ilat, ilon = _grid_cell(lat, lon)
+    keys = [_key_weather(i, j, days) for i, j in _neighbor_cells(ilat, ilon)]
+    cached = await spatial_cache_get(redis, keys, lat, lon)
     if cached is not None:
         return cached
-    data = fetch_fn(lat, lon, days)
-    await cache_set(redis, key, data, TTL_WEATHER)
+    if inspect.iscoroutinefunction(fetch_fn):
+        data = await fetch_fn(lat, lon, days)
+    else:
+        data = await asyncio.to_thread(fetch_fn, lat, lon, days)
+    await spatial_cache_set(redis, keys[0], lat, lon, data, TTL_WEATHER)
     return data
 
 
 async def get_pollutant_movement_cached(redis: Any, lat: float, lon: float, fetch_fn: Any) -> dict:
-    """Return pollutant movement from cache or fetch and cache."""
-    key = _key_pollutant_movement(lat, lon)
-    cached = await cache_get(redis, key)
+    """Return pollutant movement from the spatial grid cache or fetch and cache."""
+    ilat, ilon = _grid_cell(lat, lon)
+    keys = [_key_pollutant_movement(i, j) for i, j in _neighbor_cells(ilat, ilon)]
+    cached = await spatial_cache_get(redis, keys, lat, lon)
     if cached is not None:
         return cached
-    data = fetch_fn(lat, lon)
-    await cache_set(redis, key, data, TTL_POLLUTANT_MOVEMENT)
+    data = await asyncio.to_thread(fetch_fn, lat, lon)
+    await spatial_cache_set(redis, keys[0], lat, lon, data, TTL_POLLUTANT_MOVEMENT)
     return data
+
+
+_nominatim_lock = asyncio.Lock()
+_nominatim_last_call = 0.0
+
+
+async def _nominatim_throttle(min_interval_s: float) -> None:
+    """Process-wide spacing between outbound Nominatim calls."""
+    global _nominatim_last_call
+    async with _nominatim_lock:
+        loop = asyncio.get_running_loop()
+        wait = _nominatim_last_call + min_interval_s - loop.time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        _nominatim_last_call = loop.time()
+
+
+# Marks a candidate with no cached answer (distinct from a cached negative, which is None)
+_GEOCODE_PENDING = object()
+
+
+async def geocode_first_hit(
+    redis: Any,
+    candidates: List[str],
+    fetch_fn: Any,
+    max_concurrency: int = 1,
+    min_interval_s: float = NOMINATIM_MIN_INTERVAL_S,
+    namespace: str = "",
+) -> Optional[Tuple[float, float]]:
+    """
+    Resolve the first candidate query that geocodes, in candidate priority order. All candidate
+    keys are read with one MGET; a cached hit wins only when every earlier candidate is a cached
+    negative. Uncached candidates ahead of it are issued concurrently through fetch_fn(query)
+    behind a semaphore and the Nominatim throttle, and answers are taken in candidate order.
+    Real answers (coords or no match) are cached per query; fetch_fn raising (timeout, network)
+    is treated as a miss for this call and not cached. namespace separates lookups whose fetch_fn
+    differs (e.g. country-restricted) from plain ones for the same query text.
+    """
+    candidates = list(dict.fromkeys(c for c in candidates if c))
+    if not candidates:
+        return None
+    keys = [key_geocode(namespace + c) for c in candidates]
+    raws: List[Any] = [None] * len(keys)
+    if redis is not None:
+        try:
+            raws = await redis.mget(*keys)
+        except Exception:
+            raws = [None] * len(keys)
+    # Per candidate: cached coords, cached negative (None), or _GEOCODE_PENDING; stop at the first cached hit
+    plan: List[Tuple[str, str, Any]] = []
+    for query, key, raw in zip(candidates, keys, raws):
+        state = _GEOCODE_PENDING
+        if raw is not None:
+            try:
+                hit = json.loads(raw)
+                state = (float(hit[0]), float(hit[1])) if hit else None
+            except Exception:
+                state = _GEOCODE_PENDING
+        plan.append((query, key, state))
+        if state is not None and state is not _GEOCODE_PENDING:
+            break
+
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(query: str, key: str) -> Optional[Tuple[float, float]]:
+        async with sem:
+            await _nominatim_throttle(min_interval_s)
+            try:
+                result = await asyncio.to_thread(fetch_fn, query)
+            except Exception:
+                # Transient failure: not an answer, so nothing is cached for this query
+                return None
+        await cache_set(redis, key, list(result) if result else None, TTL_GEOCODE)
+        return result
+
+    tasks = {key: asyncio.create_task(_one(query, key)) for query, key, state in plan if state is _GEOCODE_PENDING}
+    try:
+        for query, key, state in plan:
+            if state is _GEOCODE_PENDING:
+                state = await tasks[key]
+            if state:
+                return state
+    finally:
+        for t in tasks.values():
+            t.cancel()
+    return None
+
+
+async def reverse_geocode_batch(
+    redis: Any,
+    points: List[Tuple[float, float]],
+    fetch_many: Any,
+) -> List[Optional[str]]:
+    """
+    Resolve place names for many points with one MGET over deduplicated ~1 km grid keys.
+    Misses are resolved together by `await fetch_many(points)` (which owns rate limiting); only names
+    are cached, so a failed or empty lookup is retried next time instead of blanking the cell for a day.
+    """
+    keys = [key_reverse_geocode(lat, lon) for lat, lon in points]
+    unique: dict = {}
+    for key, pt in zip(keys, points):
+        unique.setdefault(key, pt)
+    resolved: dict = {}
+    raws: List[Any] = [None] * len(unique)
+    if redis is not None and unique:
+        try:
+            raws = await redis.mget(*unique.keys())
+        except Exception:
+            raws = [None] * len(unique)
+    misses = []
+    for key, raw in zip(unique.keys(), raws):
+        if raw is None:
+            misses.append(key)
+            continue
+        try:
+            resolved[key] = json.loads(raw)
+        except Exception:
+            misses.append(key)
+    if misses:
+        try:
+            names = await fetch_many([unique[key] for key in misses])
+        except Exception:
+            # Transient failure: answer None for this call and write nothing
+            return [resolved.get(key) for key in keys]
+        for key, name in zip(misses, names):
+            resolved[key] = name
+            if name is not None:
+                await cache_set(redis, key, name, TTL_REVERSE_GEOCODE)
+    return [resolved.get(key) for key in keys]
@@ -20,6 +20,9 @@ app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # Reuse a bounded pool of broker connections; keep retrying if Redis is not up yet at worker start
+    broker_pool_limit=10,
+    broker_connection_retry_on_startup=True,
 )
 
 # Celery Beat: fetch_tempo_hourly at :00; compute_upes_hourly at :15; UPES route scores at :20; alert pipeline at :25
@@ -1,10 +1,14 @@
-from database.session import get_db, async_session_factory, async_engine
+from database.session import get_db, get_db_tx, async_session_factory, async_engine
+from database.bulk import bulk_insert_pollution_grid, pollution_grid_params
 from database.models import Base, User, SavedRoute, PollutionGrid, NetcdfFile
 
 __all__ = [
     "get_db",
+    "get_db_tx",
     "async_session_factory",
     "async_engine",
+    "bulk_insert_pollution_grid",
+    "pollution_grid_params",
     "Base",
     "User",
     "SavedRoute",
@@ -0,0 +1,36 @@
+"""
+Core-level bulk inserts for high-volume tables: one executemany per batch, no ORM instance state or
+unit-of-work bookkeeping per row.
+"""
+from typing import Any, Dict, Iterable, List
+
+from geoalchemy2 import WKTElement
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import PollutionGrid
+
+# Table-level INSERT; executemany is batched into multi-row VALUES by the dialect (insertmanyvalues)
+POLLUTION_GRID_INSERT = insert(PollutionGrid.__table__)
+
+
+def pollution_grid_params(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert parameters from raster-normalizer rows (timestamp, gas_type, geom_wkt, pollution_value, severity_level)."""
+    return [
+        {
+            "timestamp": row["timestamp"],
+            "gas_type": row["gas_type"],
+            "geom": WKTElement(row["geom_wkt"], srid=4326),
+            "pollution_value": row["pollution_value"],
+            "severity_level": row["severity_level"],
+        }
+        for row in rows
+    ]
+
+
+async def bulk_insert_pollution_grid(session: AsyncSession, rows: Iterable[Dict[str, Any]]) -> int:
+    """Insert pollution_grid rows in one statement execution; the caller commits. Returns rows inserted."""
+    params = pollution_grid_params(rows)
+    if params:
+        await session.execute(POLLUTION_GRID_INSERT, params)
+    return len(params)
@@ -6,12 +6,15 @@ from typing import Any, Optional
 
 from geoalchemy2 import Geometry
 from sqlalchemy import (
+    Boolean,
     CheckConstraint,
     DateTime,
     Double,
     ForeignKey,
+    Index,
     Integer,
     Text,
+    desc,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -27,7 +30,10 @@ class User(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(Text, unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(Text, nullable=False)
-    notification_preferences: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # Fixed channel set as plain columns (no JSONB decode per row; filterable for alert fan-out)
+    notify_email: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="false")
+    notify_push: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="false")
+    notify_in_app: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default="true")
     preferred_activity: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
@@ -49,6 +55,23 @@ class User(Base):
 
     saved_routes: Mapped[list["SavedRoute"]] = relationship("SavedRoute", back_populates="user", cascade="all, delete-orphan")
 
+    @property
+    def notification_preferences(self) -> dict:
+        """API view of the notify_* columns, e.g. {"email": true, "push": false, "in_app": true}."""
+        return {
+            "email": bool(self.notify_email),
+            "push": bool(self.notify_push),
+            "in_app": True if self.notify_in_app is None else bool(self.notify_in_app),
+        }
+
+    @notification_preferences.setter
+    def notification_preferences(self, prefs: Optional[dict]) -> None:
+        """Replace all channels from a dict; missing keys fall back to email/push off, in_app on."""
+        prefs = prefs if isinstance(prefs, dict) else {}
+        self.notify_email = bool(prefs.get("email", False))
+        self.notify_push = bool(prefs.get("push", False))
+        self.notify_in_app = bool(prefs.get("in_app", True))
+
 
 class SavedRoute(Base):
     __tablename__ = "saved_routes"
@@ -84,7 +107,7 @@ class PollutionGrid(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    gas_type: Mapped[str] = mapped_column(Text, nullable=False, index=True)
+    gas_type: Mapped[str] = mapped_column(Text, nullable=False)
     geom: Mapped[Any] = mapped_column(Geometry(geometry_type="POLYGON", srid=4326), nullable=False)
     pollution_value: Mapped[float] = mapped_column(Double, nullable=False)
     severity_level: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -92,6 +115,8 @@ class PollutionGrid(Base):
 
     __table_args__ = (
         CheckConstraint("severity_level >= 0", name="pollution_grid_severity_level_check"),
+        # Latest cells per gas; also serves plain gas_type filters
+        Index("ix_pollution_grid_gas_ts", "gas_type", desc("timestamp")),
     )
 
 
@@ -130,5 +155,10 @@ class NetcdfFile(Base):
     file_name: Mapped[str] = mapped_column(Text, nullable=False)
     bucket_path: Mapped[str] = mapped_column(Text, nullable=False)
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    gas_type: Mapped[str] = mapped_column(Text, nullable=False, index=True)
+    gas_type: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+
+    __table_args__ = (
+        # "Latest file per gas" is an index scan instead of a sort
+        Index("ix_netcdf_files_gas_ts", "gas_type", desc("timestamp")),
+    )
@@ -1,10 +1,14 @@
 """
 Pydantic schemas for API request/response validation.
 """
+import re
 from datetime import datetime
-from typing import Any, Optional
+from typing import Annotated, Any, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
+
+# Read-only response models built from ORM rows: no assignment validation, never revalidate nested instances
+ORM_RESPONSE_CONFIG = ConfigDict(from_attributes=True, validate_assignment=False, revalidate_instances="never")
 
 
 # ----- Auth -----
@@ -13,8 +17,23 @@ class UserRegister(BaseModel):
     password: str = Field(..., min_length=8)
 
 
+# Login only needs to find an existing row: a shape check instead of full email-validator parsing
+_LOGIN_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _login_email(value: str) -> str:
+    """Reject non-email shapes; lowercase the domain only, as EmailStr stored it at registration."""
+    if not _LOGIN_EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+LoginEmail = Annotated[str, AfterValidator(_login_email)]
+
+
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: LoginEmail
     password: str
 
 
@@ -31,8 +50,7 @@ class UserResponse(BaseModel):
     exposure_sensitivity_level: Optional[int] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 # ----- Saved routes -----
@@ -63,8 +81,7 @@ class SavedRouteResponse(BaseModel):
     last_upes_updated_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
 
 
 # ----- User profile update (preferences, sensitivity) -----
@@ -86,5 +103,9 @@ class AlertLogResponse(BaseModel):
     created_at: datetime
     notified_channels: Optional[list] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_RESPONSE_CONFIG
+
+
+# List endpoints validate and dump all rows in one pydantic-core call instead of one model per row
+SavedRouteListAdapter = TypeAdapter(List[SavedRouteResponse])
+AlertLogListAdapter = TypeAdapter(List[AlertLogResponse])
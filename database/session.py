@@ -4,6 +4,7 @@ Async database engine and session factory.
 from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import settings
 from database.models import Base
@@ -13,10 +14,28 @@ _db_url = settings.database_url
 if _db_url.startswith("postgresql://"):
     _db_url = _db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 
+# asyncpg: skip server-side JIT on short OLTP queries; statement caches off so the engine also
+# works behind transaction-pooling proxies (pgbouncer)
+_connect_args = {}
+if _db_url.startswith("postgresql+asyncpg://"):
+    _connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "server_settings": {"jit": "off", "application_name": "aeris"},
+    }
+
+# AsyncAdaptedQueuePool (not the sync QueuePool) is the asyncio-safe pool for async drivers
 async_engine = create_async_engine(
     _db_url,
     echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=getattr(settings, "db_pool_size", 20),
+    max_overflow=getattr(settings, "db_max_overflow", 40),
+    pool_recycle=1800,
+    pool_timeout=10,
     pool_pre_ping=True,
+    pool_reset_on_return="rollback",
+    connect_args=_connect_args,
 )
 
 async_session_factory = async_sessionmaker(
@@ -29,15 +48,19 @@ async_session_factory = async_sessionmaker(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request-scoped session without an implicit commit: read-only handlers skip the COMMIT round-trip and
+    uncommitted work is rolled back when the session closes. Handlers that write commit explicitly or use get_db_tx.
+    """
+    async with async_session_factory() as session:
+        yield session
+
+
+async def get_db_tx() -> AsyncGenerator[AsyncSession, None]:
+    """Session inside a transaction that commits when the handler returns and rolls back if it raises."""
     async with async_session_factory() as session:
-        try:
+        async with session.begin():
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
 
 
 async def init_db_extensions(session: AsyncSession) -> None:
@@ -0,0 +1,86 @@
+"""
+A* search over the pollution severity grid used by the route endpoints (8-connected, diagonal cost 1.4,
+per-step penalty 1 + 3 * severity). Compiled with Numba when numba is installed; otherwise the same
+code runs as plain Python.
+"""
+import os
+from heapq import heappop, heappush
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+_USE_JIT = njit is not None and os.environ.get("NUMBA_DISABLE_JIT", "0") != "1"
+
+# 8-connected moves as parallel offset arrays
+_DI = np.array([-1, 1, 0, 0, -1, -1, 1, 1], dtype=np.int64)
+_DJ = np.array([0, 0, -1, 1, -1, 1, -1, 1], dtype=np.int64)
+
+
+def _astar(grid, si, sj, gi, gj, di, dj):
+    """
+    Search grid (H x W severities, any numeric dtype) from (si, sj) to (gi, gj). Nodes are flat indices i * W + j.
+    Returns the node path start..goal as an int64 array, empty if the goal is unreachable.
+    """
+    h, w = grid.shape
+    start = si * w + sj
+    goal = gi * w + gj
+    gscore = np.full(h * w, np.inf)
+    came_from = np.full(h * w, -1, dtype=np.int64)
+    closed = np.zeros(h * w, dtype=np.bool_)
+    gscore[start] = 0.0
+    open_set = [(0.0, 0.0, start)]
+    while len(open_set) > 0:
+        _, g, current = heappop(open_set)
+        # Skip stale entries (a cheaper push for this node came later) and already-expanded nodes
+        if closed[current] or g > gscore[current]:
+            continue
+        closed[current] = True
+        if current == goal:
+            n = 1
+            node = current
+            while came_from[node] >= 0:
+                node = came_from[node]
+                n += 1
+            path = np.empty(n, dtype=np.int64)
+            node = current
+            for k in range(n - 1, -1, -1):
+                path[k] = node
+                node = came_from[node]
+            return path
+        ci = current // w
+        cj = current - ci * w
+        for k in range(di.size):
+            ni = ci + di[k]
+            nj = cj + dj[k]
+            if ni < 0 or nj < 0 or ni >= h or nj >= w:
+                continue
+            # movement cost (diagonal slightly more) + pollution penalty
+            move_cost = 1.4 if di[k] != 0 and dj[k] != 0 else 1.0
+            nxt = ni * w + nj
+            if closed[nxt]:
+                continue
+            tentative = gscore[current] + move_cost * (1.0 + grid[ni, nj] * 3.0)
+            if tentative < gscore[nxt]:
+                came_from[nxt] = current
+                gscore[nxt] = tentative
+                # Octile distance: exact clean-grid cost for 8-connected moves, so admissible and consistent
+                dx = abs(ni - gi)
+                dy = abs(nj - gj)
+                heappush(open_set, (tentative + max(dx, dy) + 0.4 * min(dx, dy), tentative, nxt))
+    return np.empty(0, dtype=np.int64)
+
+
+if _USE_JIT:
+    _astar = njit(cache=True)(_astar)
+
+
+def astar_grid_path(grid: np.ndarray, start: tuple, goal: tuple) -> np.ndarray:
+    """Shortest (i, j) cell path from start to goal as an (n, 2) int array; empty if none."""
+    arr = np.ascontiguousarray(grid)
+    w = arr.shape[1]
+    nodes = _astar(arr, int(start[0]), int(start[1]), int(goal[0]), int(goal[1]), _DI, _DJ)
+    return np.column_stack((nodes // w, nodes % w))
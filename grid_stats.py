@@ -0,0 +1,141 @@
+"""
+Single-scan summary statistics for pollution grids (count, mean, min, max, approximate p98).
+Uses a parallel Numba kernel when numba is installed; otherwise falls back to NumPy.
+"""
+import os
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    from numba import config as numba_config, get_num_threads, njit, prange, threading_layer
+except ImportError:  # numba is optional
+    njit = None
+else:
+    # Scans run from request worker threads: prefer OpenMP, which is safe for concurrent callers
+    # (a TBB pool started off the main thread blocks interpreter exit). numba requires all three layers
+    # here; workqueue is not safe for concurrent callers, so if it is what loads, _jit_layer_safe
+    # routes scans to the NumPy path instead.
+    numba_config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+# Threading layers the parallel kernels may run on; see _jit_layer_safe
+SAFE_THREADING_LAYERS = ("omp", "tbb")
+
+# Histogram resolution for the approximate percentile (bin width = (max - min) / HIST_BINS)
+HIST_BINS = 512
+PERCENTILE = 98.0
+
+_USE_JIT = njit is not None and os.environ.get("NUMBA_DISABLE_JIT", "0") != "1"
+
+
+if _USE_JIT:
+
+    @njit(parallel=True, cache=True)
+    def _scan_moments(flat, nchunks):
+        n = flat.size
+        size = (n + nchunks - 1) // nchunks
+        cnt = np.zeros(nchunks, np.int64)
+        s = np.zeros(nchunks)
+        mn = np.full(nchunks, np.inf)
+        mx = np.full(nchunks, -np.inf)
+        for c in prange(nchunks):
+            lo = c * size
+            hi = min(n, lo + size)
+            for k in range(lo, hi):
+                v = flat[k]
+                if np.isfinite(v):
+                    cnt[c] += 1
+                    s[c] += v
+                    if v < mn[c]:
+                        mn[c] = v
+                    if v > mx[c]:
+                        mx[c] = v
+        return cnt.sum(), s.sum(), mn.min(), mx.max()
+
+    @njit(parallel=True, cache=True)
+    def _scan_hist(flat, nchunks, vmin, vmax, nbins):
+        n = flat.size
+        size = (n + nchunks - 1) // nchunks
+        hist = np.zeros((nchunks, nbins), np.int64)
+        scale = nbins / (vmax - vmin)
+        for c in prange(nchunks):
+            lo = c * size
+            hi = min(n, lo + size)
+            for k in range(lo, hi):
+                v = flat[k]
+                if np.isfinite(v):
+                    b = int((v - vmin) * scale)
+                    if b >= nbins:
+                        b = nbins - 1
+                    hist[c, b] += 1
+        return hist.sum(axis=0)
+
+
+_layer_lock = threading.Lock()
+_layer_safe: Optional[bool] = None
+
+
+def _jit_layer_safe() -> bool:
+    """
+    Launch numba's threading layer once (under a lock) and report whether it is safe for concurrent
+    callers. False when neither OpenMP nor TBB loads, or workqueue was forced via NUMBA_THREADING_LAYER.
+    """
+    global _layer_safe
+    if _layer_safe is None:
+        with _layer_lock:
+            if _layer_safe is None:
+                try:
+                    _scan_moments(np.zeros(1), 1)
+                    _layer_safe = threading_layer() in SAFE_THREADING_LAYERS
+                except ValueError:  # "No threading layer could be loaded"
+                    _layer_safe = False
+    return _layer_safe
+
+
+def _empty_stats() -> Dict[str, float]:
+    nan = float("nan")
+    return {"count": 0, "mean": nan, "min": nan, "max": nan, "p98": nan}
+
+
+def scan_grid_stats(data: np.ndarray) -> Dict[str, float]:
+    """
+    Summary statistics over the finite values of data. p98 comes from a HIST_BINS histogram and is
+    accurate to one bin (used for colour scaling, not thresholds); no sort or partition is needed.
+    """
+    arr = np.asarray(data)
+    if arr.dtype not in (np.float32, np.float64):
+        arr = arr.astype(np.float64)
+    # float32 grids are scanned as-is (accumulation is float64), no widened copy
+    flat = np.ascontiguousarray(arr).ravel()
+    if flat.size == 0:
+        return _empty_stats()
+    if not (_USE_JIT and _jit_layer_safe()):
+        finite = flat[np.isfinite(flat)]
+        if finite.size == 0:
+            return _empty_stats()
+        count = int(finite.size)
+        mean = float(finite.mean(dtype=np.float64))
+        vmin, vmax = float(finite.min()), float(finite.max())
+        hist = np.histogram(finite, bins=HIST_BINS, range=(vmin, vmax))[0] if vmax > vmin else None
+    else:
+        nchunks = max(1, get_num_threads() * 4)
+        count, total, vmin, vmax = _scan_moments(flat, nchunks)
+        if count == 0:
+            return _empty_stats()
+        mean = total / count
+        hist = _scan_hist(flat, nchunks, vmin, vmax, HIST_BINS) if vmax > vmin else None
+    if hist is not None:
+        # Invert the histogram CDF; upper edge of the bin holding the target rank
+        target = PERCENTILE / 100.0 * count
+        b = int(np.searchsorted(np.cumsum(hist), target))
+        p98 = vmin + (min(b, HIST_BINS - 1) + 1) * (vmax - vmin) / HIST_BINS
+    else:
+        p98 = vmax
+    return {
+        "count": int(count),
+        "mean": float(mean),
+        "min": float(vmin),
+        "max": float(vmax),
+        "p98": float(p98),
+    }
@@ -4,9 +4,12 @@ Focuses on air quality and commute optimization recommendations.
 """
 
 import os
+import time
+import httpx
 import requests
 import re
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,6 +22,21 @@ if not GROQ_API_KEY:
 
 GROQ_BASE_URL = "https://api.groq.com/openai/v1/chat/completions"
 
+WEATHER_SYSTEM_PROMPT = "You are an expert Air Quality & Commute Optimizer. Provide concise, actionable advice for healthier commuting. Keep responses brief and focused."
+PREDICTION_SYSTEM_PROMPT = "You are an expert Air Quality & Commute Optimizer. Analyze pollutant movement predictions to provide concise advice for healthier commuting. Keep responses brief and focused."
+
+# Keep-alive session for the blocking helpers so repeat calls reuse the TLS connection to api.groq.com
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Markdown cleanup patterns, compiled once; applied in order since later passes see earlier output
+_MD_BOLD = re.compile(r'\*\*(.*?)\*\*')
+_MD_ITALIC = re.compile(r'\*(.*?)\*')
+_MD_HEADER = re.compile(r'^#+\s*', re.MULTILINE)
+_MD_BULLET = re.compile(r'^\s*[-*+]\s*', re.MULTILINE)
+_MD_NUMBERED = re.compile(r'^\s*\d+\.\s*', re.MULTILINE)
+_MD_BLANK_RUN = re.compile(r'\n\s*\n\s*\n')
+
 def clean_markdown_formatting(text: str) -> str:
     """
     Clean up any markdown formatting that might slip through.
@@ -27,45 +45,125 @@ def clean_markdown_formatting(text: str) -> str:
     if not text:
         return text
     
-    # Remove markdown bold formatting
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-    
-    # Remove markdown italic formatting
-    text = re.sub(r'\*(.*?)\*', r'\1', text)
+    # Each pass is skipped when its marker character is absent (a substring check, no regex scan)
+    if '*' in text:
+        # Remove markdown bold formatting
+        text = _MD_BOLD.sub(r'\1', text)
+        
+        # Remove markdown italic formatting
+        text = _MD_ITALIC.sub(r'\1', text)
     
     # Remove markdown headers
-    text = re.sub(r'^#+\s*', '', text, flags=re.MULTILINE)
+    if '#' in text:
+        text = _MD_HEADER.sub('', text)
     
     # Remove markdown list formatting
-    text = re.sub(r'^\s*[-*+]\s*', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\s*\d+\.\s*', '', text, flags=re.MULTILINE)
+    if '-' in text or '*' in text or '+' in text:
+        text = _MD_BULLET.sub('', text)
+    if '.' in text:
+        text = _MD_NUMBERED.sub('', text)
     
     # Clean up extra whitespace
-    text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
+    if '\n' in text:
+        text = _MD_BLANK_RUN.sub('\n\n', text)
     
     return text.strip()
 
-def generate_weather_interpretation(weather_data: Dict[str, Any], location_name: str) -> Optional[str]:
-    """
-    Generate intelligent interpretation of weather data focused on air quality and commute optimization.
-    """
-    if not GROQ_API_KEY:
-        return None
-    
+def _groq_request(system_content: str, prompt: str) -> Dict[str, Any]:
+    """Keyword arguments (headers, json) for a short chat-completion POST to GROQ_BASE_URL."""
+    headers = {
+        "Authorization": f"Bearer {GROQ_API_KEY}",
+        "Content-Type": "application/json"
+    }
+
+    data = {
+        "model": "llama-3.1-8b-instant",
+        "messages": [
+            {
+                "role": "system",
+                "content": system_content
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "max_tokens": 100,
+        "temperature": 0.7
+    }
+    return {"headers": headers, "json": data}
+
+def _groq_content(response: Any) -> Optional[str]:
+    """Cleaned completion text from a requests or httpx response; None (logged) on an API error."""
+    if response.status_code == 200:
+        result = response.json()
+        content = result['choices'][0]['message']['content'].strip()
+        return clean_markdown_formatting(content)
+    print(f"GROQ API error: {response.status_code} - {response.text}")
+    return None
+
+# In-process memo of weather advice keyed by coarsened conditions: nearby requests within a few
+# minutes see near-identical snapshots, so they reuse the answer instead of a Groq round-trip.
+WEATHER_MEMO_TTL_S = 300
+WEATHER_MEMO_MAX = 1024
+_weather_memo: Dict[Tuple[Any, ...], Tuple[float, str]] = {}
+
+def _quantize(value: Any, step: float) -> Any:
+    """value rounded to a multiple of step; non-numeric values (e.g. 'N/A') pass through."""
     try:
-        # Extract key weather information safely
-        current = weather_data.get('current', {})
-        air_quality = weather_data.get('air_quality', {})
-        
-        # Safely extract condition text
-        condition_text = 'N/A'
-        if isinstance(current.get('condition'), dict):
-            condition_text = current.get('condition', {}).get('text', 'N/A')
-        elif isinstance(current.get('condition'), str):
-            condition_text = current.get('condition', 'N/A')
-        
-        # Prepare context for GROQ
-        weather_context = f"""
+        return round(float(value) / step) * step
+    except (TypeError, ValueError):
+        return value
+
+def _weather_memo_key(weather_data: Dict[str, Any], location_name: str) -> Tuple[Any, ...]:
+    """Hashable key: temp to 1 C, humidity to 5 %, wind to 5 km/h, condition text, AQ values to 1 unit."""
+    current = weather_data.get('current', {}) or {}
+    condition = current.get('condition')
+    if isinstance(condition, dict):
+        condition = condition.get('text')
+    air_quality = weather_data.get('air_quality', {})
+    aq = tuple(sorted(
+        (k, _quantize(v, 1.0)) for k, v in air_quality.items() if isinstance(v, (int, float, str))
+    )) if isinstance(air_quality, dict) else ()
+    return (
+        location_name,
+        _quantize(current.get('temp_c'), 1.0),
+        _quantize(current.get('humidity'), 5.0),
+        _quantize(current.get('wind_kph'), 5.0),
+        current.get('wind_dir'),
+        condition if isinstance(condition, str) else None,
+        aq,
+    )
+
+def _weather_memo_get(key: Tuple[Any, ...]) -> Optional[str]:
+    hit = _weather_memo.get(key)
+    if hit is None or time.monotonic() - hit[0] >= WEATHER_MEMO_TTL_S:
+        return None
+    return hit[1]
+
+def _weather_memo_set(key: Tuple[Any, ...], text: Optional[str]) -> None:
+    # API errors come back as None; leave those uncached so the next call retries
+    if not text:
+        return
+    if key not in _weather_memo and len(_weather_memo) >= WEATHER_MEMO_MAX:
+        _weather_memo.pop(next(iter(_weather_memo)))
+    _weather_memo[key] = (time.monotonic(), text)
+
+def _weather_prompt(weather_data: Dict[str, Any], location_name: str) -> str:
+    """User prompt for generate_weather_interpretation."""
+    # Extract key weather information safely
+    current = weather_data.get('current', {})
+    air_quality = weather_data.get('air_quality', {})
+
+    # Safely extract condition text
+    condition_text = 'N/A'
+    if isinstance(current.get('condition'), dict):
+        condition_text = current.get('condition', {}).get('text', 'N/A')
+    elif isinstance(current.get('condition'), str):
+        condition_text = current.get('condition', 'N/A')
+
+    # Prepare context for GROQ (sections collected, then joined once)
+    parts = [f"""
         Location: {location_name}
         Temperature: {current.get('temp_c', 'N/A')}°C
         Humidity: {current.get('humidity', 'N/A')}%
@@ -73,10 +171,10 @@ def generate_weather_interpretation(weather_data: Dict[str, Any], location_name:
         Wind Direction: {current.get('wind_dir', 'N/A')}
         Condition: {condition_text}
         Visibility: {current.get('vis_km', 'N/A')} km
-        """
-        
-        if air_quality and isinstance(air_quality, dict):
-            weather_context += f"""
+        """]
+
+    if air_quality and isinstance(air_quality, dict):
+        parts.append(f"""
         Air Quality:
         - CO: {air_quality.get('co', 'N/A')} μg/m³
         - NO2: {air_quality.get('no2', 'N/A')} μg/m³
@@ -84,9 +182,10 @@ def generate_weather_interpretation(weather_data: Dict[str, Any], location_name:
         - PM2.5: {air_quality.get('pm2_5', 'N/A')} μg/m³
         - PM10: {air_quality.get('pm10', 'N/A')} μg/m³
         - US EPA Index: {air_quality.get('us-epa-index', 'N/A')}/5
-        """
-        
-        prompt = f"""
+        """)
+    weather_context = "".join(parts)
+
+    return f"""
         Air Quality & Commute advice for {location_name}:
 
         {weather_context}
@@ -98,65 +197,26 @@ def generate_weather_interpretation(weather_data: Dict[str, Any], location_name:
 
         Be extremely concise. No explanations.
         """
-        
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
-            "model": "llama-3.1-8b-instant",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are an expert Air Quality & Commute Optimizer. Provide concise, actionable advice for healthier commuting. Keep responses brief and focused."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 100,
-            "temperature": 0.7
-        }
-        
-        response = requests.post(GROQ_BASE_URL, headers=headers, json=data, timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            content = result['choices'][0]['message']['content'].strip()
-            return clean_markdown_formatting(content)
-        else:
-            print(f"GROQ API error: {response.status_code} - {response.text}")
-            return None
-            
-    except Exception as e:
-        print(f"Error generating weather interpretation: {e}")
-        return None
 
-def generate_prediction_interpretation(pollutant_predictions: list, location_name: str) -> Optional[str]:
-    """
-    Generate intelligent interpretation of pollutant movement predictions focused on commute optimization.
-    """
-    if not GROQ_API_KEY or not pollutant_predictions:
-        return None
-    
-    try:
-        # Prepare prediction context
-        prediction_context = f"""
+def _prediction_prompt(pollutant_predictions: list, location_name: str) -> str:
+    """User prompt for generate_prediction_interpretation."""
+    # Prepare prediction context: one section per hour, joined once
+    header = f"""
         Location: {location_name}
         Pollutant Movement Predictions (Next 3 Hours):
         """
-        
-        for i, pred in enumerate(pollutant_predictions[:3]):  # Limit to first 3 predictions
-            prediction_context += f"""
+    hours = [
+        f"""
         Hour {i+1} ({pred.get('time', 'N/A')}):
         - Wind: {pred.get('wind_kph', 'N/A')} km/h from {pred.get('wind_dir_deg', 'N/A')}°
         - Movement: {pred.get('displacement_km', {}).get('dx', 'N/A')} km E/W, {pred.get('displacement_km', {}).get('dy', 'N/A')} km N/S
         - Predicted Air Quality: {', '.join([f"{k}: {v:.1f}" for k, v in pred.get('predicted_air_quality', {}).items()])}
         """
-        
-        prompt = f"""
+        for i, pred in enumerate(pollutant_predictions[:3])  # Limit to first 3 predictions
+    ]
+    prediction_context = header + "".join(hours)
+
+    return f"""
         Air Quality predictions for {location_name}:
 
         {prediction_context}
@@ -168,38 +228,79 @@ def generate_prediction_interpretation(pollutant_predictions: list, location_nam
 
         Be extremely concise. No explanations.
         """
-        
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
-            "model": "llama-3.1-8b-instant",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are an expert Air Quality & Commute Optimizer. Analyze pollutant movement predictions to provide concise advice for healthier commuting. Keep responses brief and focused."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 100,
-            "temperature": 0.7
-        }
-        
-        response = requests.post(GROQ_BASE_URL, headers=headers, json=data, timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            content = result['choices'][0]['message']['content'].strip()
-            return clean_markdown_formatting(content)
-        else:
-            print(f"GROQ API error: {response.status_code} - {response.text}")
-            return None
-            
+
+def generate_weather_interpretation(weather_data: Dict[str, Any], location_name: str) -> Optional[str]:
+    """
+    Generate intelligent interpretation of weather data focused on air quality and commute optimization.
+    """
+    if not GROQ_API_KEY:
+        return None
+
+    try:
+        key = _weather_memo_key(weather_data, location_name)
+        cached = _weather_memo_get(key)
+        if cached is not None:
+            return cached
+        request = _groq_request(WEATHER_SYSTEM_PROMPT, _weather_prompt(weather_data, location_name))
+        response = _SESSION.post(GROQ_BASE_URL, timeout=30, **request)
+        text = _groq_content(response)
+        _weather_memo_set(key, text)
+        return text
+
+    except Exception as e:
+        print(f"Error generating weather interpretation: {e}")
+        return None
+
+def generate_prediction_interpretation(pollutant_predictions: list, location_name: str) -> Optional[str]:
+    """
+    Generate intelligent interpretation of pollutant movement predictions focused on commute optimization.
+    """
+    if not GROQ_API_KEY or not pollutant_predictions:
+        return None
+
+    try:
+        request = _groq_request(PREDICTION_SYSTEM_PROMPT, _prediction_prompt(pollutant_predictions, location_name))
+        response = _SESSION.post(GROQ_BASE_URL, timeout=30, **request)
+        return _groq_content(response)
+
+    except Exception as e:
+        print(f"Error generating prediction interpretation: {e}")
+        return None
+
+async def generate_weather_interpretation_async(
+    client: httpx.AsyncClient, weather_data: Dict[str, Any], location_name: str
+) -> Optional[str]:
+    """generate_weather_interpretation on a shared httpx client (keep-alive / HTTP/2), without blocking the loop."""
+    if not GROQ_API_KEY:
+        return None
+
+    try:
+        key = _weather_memo_key(weather_data, location_name)
+        cached = _weather_memo_get(key)
+        if cached is not None:
+            return cached
+        request = _groq_request(WEATHER_SYSTEM_PROMPT, _weather_prompt(weather_data, location_name))
+        response = await client.post(GROQ_BASE_URL, timeout=30, **request)
+        text = _groq_content(response)
+        _weather_memo_set(key, text)
+        return text
+
+    except Exception as e:
+        print(f"Error generating weather interpretation: {e}")
+        return None
+
+async def generate_prediction_interpretation_async(
+    client: httpx.AsyncClient, pollutant_predictions: list, location_name: str
+) -> Optional[str]:
+    """generate_prediction_interpretation on a shared httpx client (keep-alive / HTTP/2), without blocking the loop."""
+    if not GROQ_API_KEY or not pollutant_predictions:
+        return None
+
+    try:
+        request = _groq_request(PREDICTION_SYSTEM_PROMPT, _prediction_prompt(pollutant_predictions, location_name))
+        response = await client.post(GROQ_BASE_URL, timeout=30, **request)
+        return _groq_content(response)
+
     except Exception as e:
         print(f"Error generating prediction interpretation: {e}")
         return None
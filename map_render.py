@@ -0,0 +1,201 @@
+"""
+Map rendering for api_server: grid cropping/decimation and the per-gas tri-panel figure.
+Kept free of app state (DB, Redis, geocoder) so renders can run in a separate worker process;
+inputs are plain NumPy arrays, which pickle cheaply.
+"""
+import io
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+from matplotlib.colors import BoundaryNorm, ListedColormap
+
+from pollution_utils import classify_severity_array
+
+# Grids are drawn as rasterized meshes (not filled contours) at this resolution
+FIGURE_DPI = 150
+ALERT_CMAP = ListedColormap(['#2ECC71', '#F1C40F', '#E67E22', '#E74C3C', '#8E44AD'])
+ALERT_NORM = BoundaryNorm([-0.5, 0.5, 1.5, 2.5, 3.5, 4.5], ALERT_CMAP.N)
+# zlib level 3 encodes ~2x faster than the default 6 for a few percent larger PNGs
+# (optimize=True / level 9 shrink them ~2% more at 5-6x the encode time)
+PNG_PIL_KWARGS = {"compress_level": 3}
+# One tri-panel subplot is 8 in square
+PANEL_PX = int(8 * FIGURE_DPI)
+
+
+def plot_grid(lons: np.ndarray, lats: np.ndarray, values, max_px: int,
+              extent: Optional[List[float]] = None, margin: int = 2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Crop a grid to extent [W, E, S, N] (plus a few cells of margin) and stride-decimate it so
+    neither axis has more cells than max_px, the number of output pixels it will be drawn on.
+    """
+    vals = np.asarray(getattr(values, 'values', values))
+    is_1d = lons.ndim == 1 and lats.ndim == 1
+    if extent is not None:
+        w, e, s, n = extent
+        if is_1d:
+            rows = np.flatnonzero((lats >= s) & (lats <= n))
+            cols = np.flatnonzero((lons >= w) & (lons <= e))
+        else:
+            inside = (lons >= w) & (lons <= e) & (lats >= s) & (lats <= n)
+            rows = np.flatnonzero(inside.any(axis=1))
+            cols = np.flatnonzero(inside.any(axis=0))
+        if rows.size and cols.size:
+            r0, r1 = max(0, rows[0] - margin), min(vals.shape[0], rows[-1] + margin + 1)
+            c0, c1 = max(0, cols[0] - margin), min(vals.shape[1], cols[-1] + margin + 1)
+            vals = vals[r0:r1, c0:c1]
+            if is_1d:
+                lats, lons = lats[r0:r1], lons[c0:c1]
+            else:
+                lats, lons = lats[r0:r1, c0:c1], lons[r0:r1, c0:c1]
+    kr = max(1, -(-vals.shape[0] // max_px))
+    kc = max(1, -(-vals.shape[1] // max_px))
+    if kr > 1 or kc > 1:
+        vals = vals[::kr, ::kc]
+        if is_1d:
+            lats, lons = lats[::kr], lons[::kc]
+        else:
+            lats, lons = lats[::kr, ::kc], lons[::kr, ::kc]
+    return lons, lats, vals
+
+
+# Basemaps (Natural Earth states + coastlines) rendered once per extent snapped outward to BASEMAP_STEP_DEG
+BASEMAP_STEP_DEG = 0.5
+BASEMAP_CACHE_MAX = 32
+_basemap_cache: Dict[Tuple[float, float, float, float], np.ndarray] = {}
+
+
+def _basemap_key(extent: List[float]) -> Tuple[float, float, float, float]:
+    w, e, s, n = extent
+    step = BASEMAP_STEP_DEG
+    return (math.floor(w / step) * step, math.ceil(e / step) * step,
+            max(-90.0, math.floor(s / step) * step), min(90.0, math.ceil(n / step) * step))
+
+
+def _render_basemap(key: Tuple[float, float, float, float]) -> np.ndarray:
+    """Rasterize the cartopy features for one snapped extent into an RGBA array."""
+    w, e, s, n = key
+    width_in = 8.0
+    height_in = min(16.0, max(1.0, width_in * (n - s) / max(e - w, 1e-6)))
+    data_proj = ccrs.PlateCarree()
+    fig = plt.figure(figsize=(width_in, height_in))
+    ax = fig.add_axes([0, 0, 1, 1], projection=data_proj)
+    ax.set_extent(list(key), crs=data_proj)
+    ax.set_aspect('auto')
+    ax.add_feature(cfeature.OCEAN, color="white", zorder=0)
+    ax.add_feature(cfeature.LAND, color="white", zorder=0)
+    ax.add_feature(cfeature.STATES, color="black", linewidth=1, zorder=1)
+    ax.coastlines(resolution="10m", color="black", linewidth=1, zorder=1)
+    ax.set_axis_off()
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=FIGURE_DPI, facecolor='white')
+    plt.close(fig)
+    buf.seek(0)
+    return plt.imread(buf)
+
+
+def add_basemap(ax, extent: List[float]) -> None:
+    """Paste the cached basemap for extent [W, E, S, N] under the data and set the view to extent."""
+    key = _basemap_key(extent)
+    img = _basemap_cache.get(key)
+    if img is None:
+        img = _render_basemap(key)
+        if len(_basemap_cache) >= BASEMAP_CACHE_MAX:
+            _basemap_cache.pop(next(iter(_basemap_cache)))
+        _basemap_cache[key] = img
+    data_proj = ccrs.PlateCarree()
+    ax.imshow(img, extent=list(key), origin='upper', transform=data_proj, zorder=0, interpolation='bilinear')
+    ax.set_extent(extent, crs=data_proj)
+
+
+def data_extent(lons: np.ndarray, lats: np.ndarray) -> List[float]:
+    """[W, E, S, N] bounds of a grid's coordinates."""
+    return [float(np.nanmin(lons)), float(np.nanmax(lons)), float(np.nanmin(lats)), float(np.nanmax(lats))]
+
+
+def render_tripanel(gas: str, unit: str, lons: np.ndarray, lats: np.ndarray, values: np.ndarray,
+                    vmax: float, hotspot_points: List[Tuple[float, float]], out_path: str) -> str:
+    """
+    Draw concentration, hotspot and alert-level panels for one gas and save to out_path.
+    values should already be decimated with plot_grid; hotspot_points are (lon, lat), strongest first.
+    """
+    data_proj = ccrs.PlateCarree()
+    extent = data_extent(lons, lats)
+    fig = plt.figure(figsize=(24, 8))
+
+    # Panel 1: concentration
+    ax1 = fig.add_subplot(131, projection=data_proj)
+    add_basemap(ax1, extent)
+    contour1 = ax1.pcolormesh(
+        lons, lats, values,
+        shading='auto',
+        rasterized=True,
+        vmin=0,
+        vmax=vmax,
+        alpha=0.9,
+        cmap='YlOrRd',
+        zorder=2
+    )
+    try:
+        ax1.contour(lons, lats, values, levels=5, colors='k', linewidths=0.3, alpha=0.6, zorder=3)
+    except Exception:
+        pass
+    cb1 = plt.colorbar(contour1, ax=ax1, fraction=0.046, pad=0.04)
+    cb1.set_label(f"{gas} ({unit})", fontsize=10)
+    ax1.set_title(f"{gas} Concentration", fontsize=12, weight='bold', pad=10)
+
+    # Panel 2: hotspots overlay (rects approximated by center points for simplicity)
+    ax2 = fig.add_subplot(132, projection=data_proj)
+    add_basemap(ax2, extent)
+    contour2 = ax2.pcolormesh(
+        lons, lats, values,
+        shading='auto',
+        rasterized=True,
+        vmin=0,
+        vmax=vmax,
+        alpha=0.85,
+        cmap='YlOrRd',
+        zorder=2
+    )
+    try:
+        ax2.contour(lons, lats, values, levels=5, colors='k', linewidths=0.3, alpha=0.6, zorder=3)
+    except Exception:
+        pass
+    plt.colorbar(contour2, ax=ax2, fraction=0.046, pad=0.04)
+    for i, (h_lon, h_lat) in enumerate(hotspot_points[:15]):
+        ax2.plot(h_lon, h_lat, 'o', color='black',
+                 markersize=6, markeredgecolor='white', markeredgewidth=1,
+                 transform=data_proj, zorder=4)
+        if i < 5:
+            ax2.text(h_lon, h_lat, str(i+1), fontsize=9,
+                     ha='center', va='center', color='white', weight='bold',
+                     transform=data_proj, zorder=5,
+                     bbox=dict(boxstyle='circle', facecolor='black', edgecolor='white', linewidth=1))
+    ax2.set_title("Detected Hotspots", fontsize=12, weight='bold', pad=10)
+
+    # Panel 3: categorical alert map
+    ax3 = fig.add_subplot(133, projection=data_proj)
+    add_basemap(ax3, extent)
+    alert_levels = classify_severity_array(values, gas).astype(np.float32)
+    alert_levels[np.isnan(values)] = np.nan
+    contour3 = ax3.pcolormesh(
+        lons, lats, alert_levels,
+        shading='auto',
+        rasterized=True,
+        cmap=ALERT_CMAP,
+        norm=ALERT_NORM,
+        alpha=0.7, zorder=2
+    )
+    plt.colorbar(contour3, ax=ax3, fraction=0.046, pad=0.04,
+                 ticks=[0, 1, 2, 3, 4])
+    ax3.set_title("Alert Levels", fontsize=12, weight='bold', pad=10)
+
+    plt.tight_layout()
+    plt.savefig(out_path, dpi=FIGURE_DPI, bbox_inches='tight', facecolor='white', pil_kwargs=PNG_PIL_KWARGS)
+    plt.close(fig)
+    return out_path
@@ -1,6 +1,7 @@
 """
 Resolve latest NetCDF file per gas from DB + object storage; fallback to TempData scan.
 """
+import asyncio
 from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import select
@@ -9,35 +10,49 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database.models import NetcdfFile
 from storage import download_netcdf_to_path, is_configured
 
+try:
+    from sqlalchemy.dialects.postgresql import distinct_on  # SQLAlchemy >= 2.1
+except ImportError:  # 2.0: DISTINCT ON via Select.distinct(*cols)
+    distinct_on = None
+
 
 async def resolve_netcdf_paths_for_gases(
     session: AsyncSession, gases: List[str]
 ) -> Tuple[Dict[str, str], List[str]]:
     """
-    For each gas, query latest netcdf_files row and download to temp file.
+    Query the latest netcdf_files row for every gas in one round-trip (DISTINCT ON gas_type)
+    and download them to temp files concurrently.
     Returns (gas -> local_path, list of temp paths to unlink later).
     """
     overrides: Dict[str, str] = {}
     temp_paths: List[str] = []
-    if not is_configured():
+    if not is_configured() or not gases:
         return overrides, temp_paths
 
-    for gas in gases:
-        stmt = (
-            select(NetcdfFile)
-            .where(NetcdfFile.gas_type == gas)
-            .order_by(NetcdfFile.timestamp.desc())
-            .limit(1)
-        )
-        result = await session.execute(stmt)
-        row = result.scalar_one_or_none()
-        if row is None:
-            continue
-        try:
-            path = download_netcdf_to_path(row.bucket_path)
-            overrides[gas] = path
-            temp_paths.append(path)
-        except Exception:
+    stmt = (
+        select(NetcdfFile.gas_type, NetcdfFile.bucket_path)
+        .where(NetcdfFile.gas_type.in_(gases))
+        .order_by(NetcdfFile.gas_type, NetcdfFile.timestamp.desc())
+    )
+    if distinct_on is not None:
+        stmt = stmt.ext(distinct_on(NetcdfFile.gas_type))
+    else:
+        stmt = stmt.distinct(NetcdfFile.gas_type)
+    result = await session.execute(stmt)
+    latest = {gas_type: bucket_path for gas_type, bucket_path in result.all()}
+    found = [gas for gas in dict.fromkeys(gases) if gas in latest]
+    if not found:
+        return overrides, temp_paths
+
+    # Object-storage GETs are blocking; overlap them in worker threads
+    downloads = await asyncio.gather(
+        *(asyncio.to_thread(download_netcdf_to_path, latest[gas]) for gas in found),
+        return_exceptions=True,
+    )
+    for gas, path in zip(found, downloads):
+        if isinstance(path, BaseException):
             continue
+        overrides[gas] = path
+        temp_paths.append(path)
 
     return overrides, temp_paths
@@ -1,8 +1,23 @@
-import math
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TypedDict
 
+import numpy as np
 
-def predict_pollutant_movement(hourly_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+class Displacement(TypedDict):
+    dx: float
+    dy: float
+
+
+class PollutantPrediction(TypedDict):
+    """One hour of predict_pollutant_movement output; plain dicts so Redis/JSON/prompt code reads them as-is."""
+    time: str
+    wind_kph: float
+    wind_dir_deg: float
+    displacement_km: Displacement
+    predicted_air_quality: Dict[str, float]
+
+
+def predict_pollutant_movement(hourly_data: List[Dict[str, Any]]) -> List[PollutantPrediction]:
     """
     Predict pollutant movement for the next 3 hours using a simplified model.
 
@@ -12,36 +27,35 @@ def predict_pollutant_movement(hourly_data: List[Dict[str, Any]]) -> List[Dict[s
     Returns:
         List of predictions for next 3 hours with estimated pollutant displacement and concentrations.
     """
-    predictions = []
-
-    for i in range(1, 4):  # next 3 hours
-        if i >= len(hourly_data):
-            break
-
-        hour = hourly_data[i]
-        airq = hour.get("air_quality", {})
-        wind_speed = hour.get("wind_kph", 0)
-        wind_dir_deg = hour.get("wind_degree", 0)
-
-        # Compute displacement (km) based on wind vector
-        # Assuming pollutant particles roughly move with wind
-        dx = wind_speed * math.sin(math.radians(wind_dir_deg)) * 1  # per hour
-        dy = wind_speed * math.cos(math.radians(wind_dir_deg)) * 1
-
-        # Adjust concentration (simplified): dispersion with time & humidity
-        humidity = hour.get("humidity", 50)
-        dispersion_factor = 1 + (humidity / 100) * 0.2  # higher humidity → faster dispersion
-
-        predicted_air_quality = {}
-        for pollutant, value in airq.items():
-            if isinstance(value, (int, float)):
-                predicted_air_quality[pollutant] = value / dispersion_factor
+    hours = hourly_data[1:4]  # next 3 hours
+    if not hours:
+        return []
+
+    wind_speed = np.array([hour.get("wind_kph", 0) for hour in hours], dtype=np.float64)
+    wind_dir_rad = np.radians(np.array([hour.get("wind_degree", 0) for hour in hours], dtype=np.float64))
+    humidity = np.array([hour.get("humidity", 50) for hour in hours], dtype=np.float64)
+
+    # Compute displacement (km) based on wind vector, for all hours at once
+    # Assuming pollutant particles roughly move with wind
+    dx = (wind_speed * np.sin(wind_dir_rad)).tolist()  # per hour
+    dy = (wind_speed * np.cos(wind_dir_rad)).tolist()
+
+    # Adjust concentration (simplified): dispersion with time & humidity
+    dispersion_factor = (1 + (humidity / 100) * 0.2).tolist()  # higher humidity → faster dispersion
+
+    predictions: List[PollutantPrediction] = []
+    for i, hour in enumerate(hours):
+        predicted_air_quality = {
+            pollutant: value / dispersion_factor[i]
+            for pollutant, value in hour.get("air_quality", {}).items()
+            if isinstance(value, (int, float))
+        }
 
         predictions.append({
             "time": hour["time"],
-            "wind_kph": wind_speed,
-            "wind_dir_deg": wind_dir_deg,
-            "displacement_km": {"dx": round(dx, 2), "dy": round(dy, 2)},
+            "wind_kph": hour.get("wind_kph", 0),
+            "wind_dir_deg": hour.get("wind_degree", 0),
+            "displacement_km": {"dx": round(dx[i], 2), "dy": round(dy[i], 2)},
             "predicted_air_quality": predicted_air_quality
         })
 
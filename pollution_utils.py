@@ -1,10 +1,16 @@
 """
 Shared pollution thresholds and classification for api_server and ingestion (raster normalizer, Celery).
 """
+import os
 from typing import Dict, Tuple
 
 import numpy as np
 
+try:
+    from numba import njit, vectorize
+except ImportError:  # numba is optional
+    njit = vectorize = None
+
 POLLUTION_THRESHOLDS: Dict[str, Dict[str, float]] = {
     "NO2": {
         "moderate": 5.0e15,
@@ -40,16 +46,96 @@ POLLUTION_THRESHOLDS: Dict[str, Dict[str, float]] = {
 
 
 def classify_pollution_level(value: float, gas: str) -> Tuple[str, int]:
+    """(level name, severity 0-4); returns the shared LEVELS / NO_DATA_LEVEL tuples, never a new one."""
     if np.isnan(value) or gas not in POLLUTION_THRESHOLDS:
-        return "no_data", 0
+        return NO_DATA_LEVEL
+    if _USE_JIT:
+        return LEVELS[int(_severity_from_bins(float(value), SEVERITY_BINS[gas]))]
     thresholds = POLLUTION_THRESHOLDS[gas]
     if value >= thresholds["hazardous"]:
-        return "hazardous", 4
+        return LEVELS[4]
     elif value >= thresholds["very_unhealthy"]:
-        return "very_unhealthy", 3
+        return LEVELS[3]
     elif value >= thresholds["unhealthy"]:
-        return "unhealthy", 2
+        return LEVELS[2]
     elif value >= thresholds["moderate"]:
-        return "moderate", 1
+        return LEVELS[1]
+    else:
+        return LEVELS[0]
+
+
+# Per-gas ascending bin edges (moderate, unhealthy, very_unhealthy, hazardous) for vectorized classification.
+SEVERITY_BINS: Dict[str, np.ndarray] = {
+    gas: np.array(
+        [t["moderate"], t["unhealthy"], t["very_unhealthy"], t["hazardous"]], dtype=np.float64
+    )
+    for gas, t in POLLUTION_THRESHOLDS.items()
+}
+
+
+# Same edges as a (gas, 4) table for the compiled classifier; rows follow GAS_INDEX.
+GAS_INDEX: Dict[str, int] = {gas: i for i, gas in enumerate(SEVERITY_BINS)}
+THRESHOLD_TABLE = np.stack([SEVERITY_BINS[gas] for gas in GAS_INDEX])
+
+_USE_JIT = vectorize is not None and os.environ.get("NUMBA_DISABLE_JIT", "0") != "1"
+
+LEVEL_NAMES: Tuple[str, ...] = ("good", "moderate", "unhealthy", "very_unhealthy", "hazardous")
+
+# (name, severity) results of classify_pollution_level, indexed by severity; built once and shared.
+LEVELS: Tuple[Tuple[str, int], ...] = tuple((name, sev) for sev, name in enumerate(LEVEL_NAMES))
+NO_DATA_LEVEL: Tuple[str, int] = ("no_data", 0)
+
+
+def _severity_from_bins(value, bins):
+    """Severity 0-4 of one value against a SEVERITY_BINS row; NaN -> 0. Also callable from other njit kernels."""
+    if value != value:
+        return 0
+    sev = 0
+    for k in range(bins.shape[0]):
+        if value >= bins[k]:
+            sev = k + 1
+    return sev
+
+
+if _USE_JIT:
+    _severity_from_bins = njit(cache=True)(_severity_from_bins)
+
+    @vectorize(["int8(float64, int64)"], cache=True)
+    def _severity_ufunc(v, gi):
+        # One branchy pass per element: NaN -> 0, else count of edges at or below v
+        if v != v:
+            return 0
+        sev = 0
+        for k in range(4):
+            if v >= THRESHOLD_TABLE[gi, k]:
+                sev = k + 1
+        return sev
+
+
+# Level name per severity index; index 5 is used for NaN / unknown gas in the vectorized labels.
+LEVEL_LABELS = np.array(LEVEL_NAMES + ("no_data",))
+
+
+def classify_severity_array(values: np.ndarray, gas: str) -> np.ndarray:
+    """Vectorized severity (0-4, int8) matching classify_pollution_level; NaN and unknown gas map to 0."""
+    arr = np.asarray(values)
+    bins = SEVERITY_BINS.get(gas)
+    if bins is None:
+        return np.zeros(arr.shape, dtype=np.int8)
+    if _USE_JIT:
+        return np.asarray(_severity_ufunc(arr, GAS_INDEX[gas]), dtype=np.int8)
+    sev = np.digitize(arr, bins).astype(np.int8)
+    sev[np.isnan(arr)] = 0
+    return sev
+
+
+def classify_pollution_level_vec(values: np.ndarray, gas: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Array form of classify_pollution_level: returns (level names, int8 severities) with matching shapes."""
+    arr = np.asarray(values)
+    sev = classify_severity_array(arr, gas)
+    label_idx = sev.astype(np.intp)
+    if gas not in SEVERITY_BINS:
+        label_idx[...] = 5
     else:
-        return "good", 0
+        label_idx[np.isnan(arr)] = 5
+    return LEVEL_LABELS[label_idx], sev
@@ -13,8 +13,11 @@ Expects .env with BEARER_TOKEN or EARTHDATA_* for --live.
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -37,46 +40,87 @@ FILL_VALUE_THRESHOLD = {
     "O3": 1e10,
 }
 
-REQUIRED_ROW_KEYS = {"timestamp", "gas_type", "geom_wkt", "pollution_value", "severity_level"}
+REQUIRED_ROW_KEYS = ("timestamp", "gas_type", "geom_wkt", "pollution_value", "severity_level")
 
 
-def analyze_raster(geotiff_path: str, gas: str) -> dict:
-    """Analyze GeoTIFF: metadata, band stats, plausibility. Returns report dict and list of errors."""
-    import numpy as np
-    import rasterio
-    from rasterio.crs import CRS
+# Target pixels per window when reading striped (untiled) GeoTIFFs as row bands
+SCANLINE_WINDOW_PIXELS = 1 << 20
 
-    report = {"path": str(geotiff_path), "gas": gas, "errors": [], "warnings": []}
-    path = Path(geotiff_path)
-    if not path.exists():
-        report["errors"].append(f"File not found: {geotiff_path}")
-        return report
+# GDAL settings for the one-shot analysis pass: a fixed block cache (MB) instead of the ~5%-of-RAM
+# default, and no sibling-file directory listing when opening the GeoTIFF
+GDAL_ENV = {
+    "GDAL_CACHEMAX": 512,
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif",
+}
+
+
+def _band_windows(src):
+    """Windows covering band 1: the file's own blocks when tiled, else bands of whole rows."""
+    from rasterio.windows import Window
+
+    if src.profile.get("tiled"):
+        for _, window in src.block_windows(1):
+            yield window
+        return
+    rows = max(1, SCANLINE_WINDOW_PIXELS // max(src.width, 1))
+    for row in range(0, src.height, rows):
+        yield Window(0, row, src.width, min(rows, src.height - row))
+
+
+def _raster_metadata(src, report: dict) -> None:
+    report["width"] = src.width
+    report["height"] = src.height
+    report["count"] = src.count
+    report["dtype"] = str(src.dtypes[0])
+    report["crs"] = str(src.crs) if src.crs else "None"
+    report["bounds"] = list(src.bounds)
 
-    with rasterio.open(path) as src:
-        report["width"] = src.width
-        report["height"] = src.height
-        report["count"] = src.count
-        report["dtype"] = str(src.dtypes[0])
-        report["crs"] = str(src.crs) if src.crs else "None"
-        report["bounds"] = list(src.bounds)
-        band = src.read(1)
-        transform = src.transform
 
-    arr = band.astype(float)
-    nan_mask = np.isnan(arr)
-    valid = arr[~nan_mask]
-    report["valid_pixel_count"] = int(np.sum(~nan_mask))
-    report["nan_pixel_count"] = int(np.sum(nan_mask))
-    report["total_pixels"] = arr.size
+def _band_stats(chunks, floating: bool) -> tuple:
+    """(nan_count, valid_count, min, max, mean, M2) over band chunks, merged per chunk with Chan's update."""
+    import numpy as np
+
+    nan_count = valid_count = 0
+    vmin, vmax, mean, m2 = np.inf, -np.inf, 0.0, 0.0
+    for chunk in chunks:
+        chunk_nan = int(np.count_nonzero(np.isnan(chunk))) if floating else 0
+        nan_count += chunk_nan
+        if chunk.size == chunk_nan:
+            continue
+        n_b = chunk.size - chunk_nan
+        vmin = min(vmin, float(np.nanmin(chunk)))
+        vmax = max(vmax, float(np.nanmax(chunk)))
+        # nanvar subtracts the mean in the input dtype, so promote the window (bounded) first
+        block = chunk.astype(np.float64, copy=False)
+        mean_b = float(np.nanmean(block))
+        m2_b = float(np.nanvar(block)) * n_b
+        n = valid_count + n_b
+        delta = mean_b - mean
+        mean += delta * n_b / n
+        m2 += m2_b + delta * delta * valid_count * n_b / n
+        valid_count = n
+    return nan_count, valid_count, vmin, vmax, mean, m2
+
+
+def _finish_raster_report(report: dict, gas: str, stats: tuple) -> dict:
+    """Fill pixel counts, min/max/mean/std and plausibility warnings from _band_stats output."""
+    import numpy as np
 
-    if valid.size == 0:
+    nan_count, valid_count, vmin, vmax, mean, m2 = stats
+    report["valid_pixel_count"] = valid_count
+    report["nan_pixel_count"] = nan_count
+    report["total_pixels"] = valid_count + nan_count
+
+    if valid_count == 0:
         report["errors"].append("No non-NaN pixels in band 1")
-        report["min"] = report["max"] = report["mean"] = None
+        report["min"] = report["max"] = report["mean"] = report["std"] = None
         return report
 
-    report["min"] = float(np.nanmin(valid))
-    report["max"] = float(np.nanmax(valid))
-    report["mean"] = float(np.nanmean(valid))
+    report["min"] = vmin
+    report["max"] = vmax
+    report["mean"] = mean
+    report["std"] = float(np.sqrt(m2 / valid_count))
 
     low, high = PLAUSIBLE_RANGES.get(gas, (0.0, 1e20))
     if report["min"] < low or report["max"] > high:
@@ -94,38 +138,76 @@ def analyze_raster(geotiff_path: str, gas: str) -> dict:
     return report
 
 
-def analyze_grid_rows(geotiff_path: str, gas: str, timestamp: datetime, max_cells: int = 2000) -> dict:
-    """Run geotiff_to_grid_rows and validate every row: schema, WKT, severity, consistency with classify."""
-    from pollution_utils import classify_pollution_level
-    from services.raster_normalizer import geotiff_to_grid_rows
+def analyze_raster(geotiff_path: str, gas: str) -> dict:
+    """Analyze GeoTIFF: metadata, band stats, plausibility. Returns report dict and list of errors."""
+    import numpy as np
+    import rasterio
 
-    report = {"row_count": 0, "errors": [], "warnings": [], "severity_counts": {0: 0, 1: 0, 2: 0, 3: 0, 4: 0}}
+    report = {"path": str(geotiff_path), "gas": gas, "errors": [], "warnings": []}
     path = Path(geotiff_path)
     if not path.exists():
         report["errors"].append(f"File not found: {geotiff_path}")
         return report
 
-    for chunk in geotiff_to_grid_rows(path, gas, timestamp, max_cells=max_cells):
-        for row in chunk:
-            report["row_count"] += 1
-            if not REQUIRED_ROW_KEYS.issubset(row.keys()):
-                report["errors"].append(f"Row missing keys: {REQUIRED_ROW_KEYS - row.keys()}")
-            if not row.get("geom_wkt", "").startswith("POLYGON(("):
-                report["errors"].append(f"Invalid geom_wkt: {str(row.get('geom_wkt', ''))[:80]}")
-            sev = row.get("severity_level")
-            if sev not in (0, 1, 2, 3, 4):
-                report["errors"].append(f"severity_level {sev} not in 0-4")
-            else:
-                report["severity_counts"][sev] = report["severity_counts"].get(sev, 0) + 1
-            # Consistency: classify_pollution_level(value, gas) should match row severity
-            val = row.get("pollution_value")
-            _, expected_sev = classify_pollution_level(float(val) if val is not None else float("nan"), gas)
-            if expected_sev != sev:
+    # Short-lived CLI: a private dataset handle, not one shared across threads
+    with rasterio.open(path, sharing=False) as src:
+        _raster_metadata(src, report)
+        floating = np.issubdtype(np.dtype(src.dtypes[0]), np.floating)
+        # Stream band 1 one window at a time: memory bounded by a block, not the raster
+        stats = _band_stats((src.read(1, window=w) for w in _band_windows(src)), floating)
+
+    return _finish_raster_report(report, gas, stats)
+
+
+WKT_PREFIX = b"POLYGON(("
+
+
+def _bad_wkt_mask(wkt):
+    """True where a geom_wkt entry does not start with POLYGON((."""
+    import numpy as np
+
+    try:
+        # Casting to S9 keeps just the first 9 bytes, so one equality compare is the prefix check
+        return wkt.astype(f"S{len(WKT_PREFIX)}") != WKT_PREFIX
+    except UnicodeEncodeError:
+        return ~np.char.startswith(wkt.astype(str), WKT_PREFIX.decode())
+
+
+def _validate_grid_columns(chunks, gas: str, max_cells: int) -> dict:
+    """Validate grid column chunks: schema, WKT, severity, consistency with classify."""
+    import numpy as np
+
+    from pollution_utils import classify_severity_array
+
+    report = {"row_count": 0, "errors": [], "warnings": [], "severity_counts": {0: 0, 1: 0, 2: 0, 3: 0, 4: 0}}
+    for columns in chunks:
+        missing = [k for k in REQUIRED_ROW_KEYS if k not in columns]
+        if missing:
+            report["errors"].append(f"Row missing keys: {missing}")
+            continue
+        n = min(len(columns["severity_level"]), max(max_cells - report["row_count"], 1))
+        wkt = columns["geom_wkt"][:n]
+        values = np.asarray(columns["pollution_value"][:n], dtype=np.float64)
+        sev = np.asarray(columns["severity_level"][:n])
+        report["row_count"] += n
+
+        # Whole-chunk checks; only failing rows are visited to format messages (in row order)
+        bad_wkt = _bad_wkt_mask(wkt)
+        in_range = (sev >= 0) & (sev <= 4)
+        for level, count in enumerate(np.bincount(sev[in_range].astype(np.intp), minlength=5).tolist()):
+            report["severity_counts"][level] += count
+        # Consistency: classify_pollution_level(value, gas) should match row severity
+        expected = classify_severity_array(values, gas)
+        mismatch = expected != sev
+        for i in np.flatnonzero(bad_wkt | ~in_range | mismatch).tolist():
+            if bad_wkt[i]:
+                report["errors"].append(f"Invalid geom_wkt: {str(wkt[i])[:80]}")
+            if not in_range[i]:
+                report["errors"].append(f"severity_level {sev[i]} not in 0-4")
+            if mismatch[i]:
                 report["errors"].append(
-                    f"Severity mismatch: value={val} -> expected severity {expected_sev}, got {sev}"
+                    f"Severity mismatch: value={values[i]} -> expected severity {expected[i]}, got {sev[i]}"
                 )
-            if report["row_count"] >= max_cells:
-                break
         if report["row_count"] >= max_cells:
             break
 
@@ -134,27 +216,95 @@ def analyze_grid_rows(geotiff_path: str, gas: str, timestamp: datetime, max_cell
     return report
 
 
-def find_valid_granule_window(collection_id: str, gas: str):
-    # Returns (start_time, end_time) or None
-    """Try CMR granule search for the last 7 days to find a window with granules; return (start, end) or None."""
+def analyze_grid_rows(geotiff_path: str, gas: str, timestamp: datetime, max_cells: int = 2000) -> dict:
+    """Run geotiff_to_grid_columns and validate every row: schema, WKT, severity, consistency with classify."""
+    from services.raster_normalizer import geotiff_to_grid_columns
+
+    path = Path(geotiff_path)
+    if not path.exists():
+        return {
+            "row_count": 0,
+            "errors": [f"File not found: {geotiff_path}"],
+            "warnings": [],
+            "severity_counts": {0: 0, 1: 0, 2: 0, 3: 0, 4: 0},
+        }
+    return _validate_grid_columns(geotiff_to_grid_columns(path, gas, timestamp, max_cells=max_cells), gas, max_cells)
+
+
+def analyze_raster_and_rows(geotiff_path: str, gas: str, timestamp: datetime, max_cells: int = 2000) -> tuple:
+    """
+    analyze_raster and analyze_grid_rows from one open and one read of band 1.
+    Returns (raster_report, row_report), identical to calling the two separately.
+    """
+    import numpy as np
+    import rasterio
+
+    from services.raster_normalizer import band_to_grid_columns
+
+    path = Path(geotiff_path)
+    if not path.exists():
+        return analyze_raster(geotiff_path, gas), analyze_grid_rows(geotiff_path, gas, timestamp, max_cells)
+
+    report = {"path": str(geotiff_path), "gas": gas, "errors": [], "warnings": []}
+    with rasterio.open(path, sharing=False) as src:
+        _raster_metadata(src, report)
+        floating = np.issubdtype(np.dtype(src.dtypes[0]), np.floating)
+        # The grid producer needs the whole band anyway; stats walk the same windows over it in memory
+        band = src.read(1)
+        stats = _band_stats((band[w.toslices()] for w in _band_windows(src)), floating)
+        transform = src.transform
+
+    raster_report = _finish_raster_report(report, gas, stats)
+    row_report = _validate_grid_columns(
+        band_to_grid_columns(band, transform, gas, timestamp, max_cells=max_cells), gas, max_cells
+    )
+    return raster_report, row_report
+
+
+def _utc_hour() -> datetime:
+    """Current UTC time truncated to the hour."""
+    return datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+# Concurrent CMR probes in find_valid_granule_window (each probe is one short HTTP round-trip)
+GRANULE_PROBE_WORKERS = 8
+
+
+@lru_cache(maxsize=256)
+def _window_has_granules(collection_id: str, start_time: datetime, end_time: datetime, bbox: tuple) -> bool:
+    """One CMR page_size=1 probe; memoized for the run so repeated windows are not re-queried."""
     from services.harmony_service import search_cmr_granules
 
+    return bool(search_cmr_granules(collection_id, start_time, end_time, *bbox, page_size=1))
+
+
+def find_valid_granule_window(collection_id: str, gas: str, base: Optional[datetime] = None):
+    # Returns (start_time, end_time) or None
+    """Try CMR granule search for the last 7 days to find a window with granules; return (start, end) or None.
+    base is the current UTC hour (computed here if not given)."""
     # CONUS-style bbox; try recent then older windows (TEMPO may have processing delay)
-    west, south, east, north = -125.0, 24.0, -66.0, 50.0
-    base = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    bbox = (-125.0, 24.0, -66.0, 50.0)
+    if base is None:
+        base = _utc_hour()
     # Try last 14 days, then 30–60 days ago
-    for days_ago in list(range(0, 14)) + list(range(30, 61, 5)):
-        end_time = base - timedelta(days=days_ago)
-        start_time = end_time - timedelta(hours=1)
-        granules = search_cmr_granules(collection_id, start_time, end_time, west, south, east, north, page_size=1)
-        if granules:
-            return (start_time, end_time)
+    windows = [
+        (base - timedelta(days=days_ago) - timedelta(hours=1), base - timedelta(days=days_ago))
+        for days_ago in list(range(0, 14)) + list(range(30, 61, 5))
+    ]
     # Known-good window where CMR has TEMPO NO2 granules (e.g. 2024-06-01)
-    fallback_end = datetime(2024, 6, 1, 1, 0, 0, tzinfo=timezone.utc)
-    fallback_start = datetime(2024, 6, 1, 0, 0, 0, tzinfo=timezone.utc)
-    g = search_cmr_granules(collection_id, fallback_start, fallback_end, west, south, east, north, page_size=1)
-    if g:
-        return (fallback_start, fallback_end)
+    windows.append((
+        datetime(2024, 6, 1, 0, 0, 0, tzinfo=timezone.utc),
+        datetime(2024, 6, 1, 1, 0, 0, tzinfo=timezone.utc),
+    ))
+    # Probe all windows at once; results come back in window order, so the most recent hit wins
+    executor = ThreadPoolExecutor(max_workers=GRANULE_PROBE_WORKERS)
+    try:
+        hits = executor.map(lambda w: _window_has_granules(collection_id, w[0], w[1], bbox), windows)
+        for window, hit in zip(windows, hits):
+            if hit:
+                return window
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     return None
 
 
@@ -169,6 +319,8 @@ def main():
 
     geotiff_path = args.geotiff
     gas = args.gas
+    # One clock read per run; every default window below is relative to this hour
+    now_hour = _utc_hour()
 
     if args.live:
         from services.harmony_service import (
@@ -189,13 +341,13 @@ def main():
         start_time = None
         end_time = None
         if args.find_granules:
-            window = find_valid_granule_window(collection_id, gas)
+            window = find_valid_granule_window(collection_id, gas, base=now_hour)
             if window:
                 start_time, end_time = window
                 print(f"CMR found granules for {start_time.isoformat()} to {end_time.isoformat()}")
             # If CMR fails or finds nothing, fall through to default window
         if start_time is None:
-            end_time = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+            end_time = now_hour
             start_time = end_time - timedelta(hours=1)
             # Try 7 days ago if first attempt fails
             for attempt in range(2):
@@ -221,12 +373,12 @@ def main():
         print(f"Fetched: {geotiff_path}")
         # Use start_time for grid row timestamp
         if start_time is None:
-            start_time = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+            start_time = now_hour - timedelta(hours=1)
     else:
         if not geotiff_path:
             print("Provide --geotiff PATH or --live")
             return 1
-        start_time = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        start_time = now_hour
 
     print()
     print("=" * 60)
@@ -236,8 +388,11 @@ def main():
     print(f"Gas:     {gas}")
     print()
 
-    # 1. Raster analysis
-    raster_report = analyze_raster(geotiff_path, gas)
+    # 1. Raster analysis (one read of band 1 serves both reports)
+    import rasterio
+
+    with rasterio.Env(**GDAL_ENV):
+        raster_report, row_report = analyze_raster_and_rows(geotiff_path, gas, start_time, max_cells=args.max_cells)
     print("--- Raster (GeoTIFF) ---")
     if raster_report["errors"]:
         for e in raster_report["errors"]:
@@ -251,11 +406,10 @@ def main():
     print(f"  bounds:   {raster_report.get('bounds')}")
     print(f"  valid:    {raster_report.get('valid_pixel_count')}  NaN: {raster_report.get('nan_pixel_count')}")
     if raster_report.get("min") is not None:
-        print(f"  min/max/mean: {raster_report['min']:.6g} / {raster_report['max']:.6g} / {raster_report['mean']:.6g}")
+        print(f"  min/max/mean/std: {raster_report['min']:.6g} / {raster_report['max']:.6g} / {raster_report['mean']:.6g} / {raster_report['std']:.6g}")
     print()
 
     # 2. Grid row analysis
-    row_report = analyze_grid_rows(geotiff_path, gas, start_time, max_cells=args.max_cells)
     print("--- Grid rows (required schema + severity consistency) ---")
     if row_report["errors"]:
         for e in row_report["errors"][:15]:
@@ -2,12 +2,40 @@
 Alert detection: route deterioration, hazard, wind shift, time-based.
 """
 import math
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from config import settings
 from services.alerts.constants import get_sensitivity_scale
 
 
+@dataclass(frozen=True)
+class _Thresholds:
+    """Alert thresholds resolved from settings once, not per check call."""
+    deterioration_base_pct: float
+    hazard_threshold: float
+    wind_speed_min_kph: float
+    wind_angle_deg: float
+
+
+def _load_thresholds() -> _Thresholds:
+    return _Thresholds(
+        deterioration_base_pct=getattr(settings, "alerts_deterioration_base_pct", 0.15),
+        hazard_threshold=getattr(settings, "alerts_hazard_threshold", 0.85),
+        wind_speed_min_kph=getattr(settings, "alerts_wind_speed_min_kph", 5.0),
+        wind_angle_deg=getattr(settings, "alerts_wind_angle_deg", 45.0),
+    )
+
+
+_T = _load_thresholds()
+
+
+def refresh_thresholds() -> None:
+    """Re-read thresholds after settings is swapped (e.g. tests patching the module's settings)."""
+    global _T
+    _T = _load_thresholds()
+
+
 def check_route_deterioration(
     prev_score: float,
     curr_score: float,
@@ -21,7 +49,7 @@ def check_route_deterioration(
     """
     if prev_score is None or prev_score <= 0:
         return None
-    base = base_pct if base_pct is not None else getattr(settings, "alerts_deterioration_base_pct", 0.15)
+    base = base_pct if base_pct is not None else _T.deterioration_base_pct
     scale = get_sensitivity_scale(user_sensitivity_level)
     effective_pct = base * scale
     delta_pct = (curr_score - prev_score) / prev_score
@@ -43,7 +71,7 @@ def check_hazard_alert(
     """
     Trigger when max UPES along route >= critical_threshold.
     """
-    thresh = critical_threshold if critical_threshold is not None else getattr(settings, "alerts_hazard_threshold", 0.85)
+    thresh = critical_threshold if critical_threshold is not None else _T.hazard_threshold
     if max_upes_along_route >= thresh:
         return {
             "type": "hazard",
@@ -63,14 +91,35 @@ def _angle_diff_deg(a1: float, a2: float) -> float:
 
 def _bearing_deg(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
     """Bearing from point 1 to point 2 in degrees [0, 360)."""
-    lat1, lat2, lon1, lon2 = map(math.radians, [lat1, lat2, lon1, lon2])
-    dlon = lon2 - lon1
-    x = math.sin(dlon) * math.cos(lat2)
-    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
+    lat1 = math.radians(lat1)
+    lat2 = math.radians(lat2)
+    dlon = math.radians(lon2) - math.radians(lon1)
+    cos_lat2 = math.cos(lat2)
+    x = math.sin(dlon) * cos_lat2
+    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * cos_lat2 * math.cos(dlon)
     b = math.degrees(math.atan2(x, y))
     return (b + 360.0) % 360.0
 
 
+def _wind_toward_deg(wind_degree: float) -> float:
+    """Direction the wind blows toward (wind_degree is where it comes FROM)."""
+    return (wind_degree + 180.0) % 360.0
+
+
+def _wind_shift_alert(wind_kph: float, wind_degree: float, bearing_to_route: float) -> Dict[str, Any]:
+    return {
+        "type": "wind_shift",
+        "score_before": None,
+        "score_after": None,
+        "threshold": None,
+        "metadata": {
+            "wind_kph": wind_kph,
+            "wind_degree": wind_degree,
+            "bearing_source_to_route": round(bearing_to_route, 2),
+        },
+    }
+
+
 def check_wind_shift_alert(
     wind_kph: float,
     wind_degree: float,
@@ -92,27 +141,15 @@ def check_wind_shift_alert(
     So bearing(source, route) should be within max_angle_deg of (wind_degree + 180).
     If angle_diff(bearing(source->route), wind_degree + 180) < max_angle_deg and wind_kph >= min_speed -> trigger.
     """
-    min_speed = min_speed_kph if min_speed_kph is not None else getattr(settings, "alerts_wind_speed_min_kph", 5.0)
-    max_angle = max_angle_deg if max_angle_deg is not None else getattr(settings, "alerts_wind_angle_deg", 45.0)
+    min_speed = min_speed_kph if min_speed_kph is not None else _T.wind_speed_min_kph
+    max_angle = max_angle_deg if max_angle_deg is not None else _T.wind_angle_deg
     if wind_kph < min_speed:
         return None
     # Bearing from source to route (direction from hotspot toward route)
     bearing_to_route = _bearing_deg(source_lon, source_lat, route_mid_lon, route_mid_lat)
-    # Wind direction "where wind is going" (meteorological convention: from = wind_degree)
-    wind_toward = (wind_degree + 180.0) % 360.0
-    diff = _angle_diff_deg(bearing_to_route, wind_toward)
+    diff = _angle_diff_deg(bearing_to_route, _wind_toward_deg(wind_degree))
     if diff <= max_angle:
-        return {
-            "type": "wind_shift",
-            "score_before": None,
-            "score_after": None,
-            "threshold": None,
-            "metadata": {
-                "wind_kph": wind_kph,
-                "wind_degree": wind_degree,
-                "bearing_source_to_route": round(bearing_to_route, 2),
-            },
-        }
+        return _wind_shift_alert(wind_kph, wind_degree, bearing_to_route)
     return None
 
 
@@ -4,8 +4,13 @@ Compute UPES along a saved route (origin -> dest line) for alert scoring and his
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 from services.route_optimization.graph_builder import get_latest_upes_raster_path
-from services.route_optimization.upes_sampling import sample_upes_along_line_mean_max
+from services.route_optimization.upes_sampling import (
+    sample_upes_along_line_mean_max,
+    sample_upes_along_lines_mean_max,
+)
 
 
 def route_line_coords(
@@ -33,3 +38,25 @@ def compute_upes_along_saved_route(
     coords = route_line_coords(origin_lat, origin_lon, dest_lat, dest_lon)
     path = raster_path if raster_path is not None else get_latest_upes_raster_path()
     return sample_upes_along_line_mean_max(path, coords, step_m=step_m)
+
+
+def compute_upes_along_saved_routes(
+    origins: np.ndarray,
+    dests: np.ndarray,
+    raster_path: Optional[Path] = None,
+    step_m: float = 50.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batch compute_upes_along_saved_route: origins and dests are (N, 2) arrays of (lat, lon).
+    The raster is opened once for all routes. Returns (mean_upes, max_upes) arrays of length N.
+    """
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 2)
+    dests = np.asarray(dests, dtype=np.float64).reshape(-1, 2)
+    lines = [
+        route_line_coords(o_lat, o_lon, d_lat, d_lon)
+        for (o_lat, o_lon), (d_lat, d_lon) in zip(origins.tolist(), dests.tolist())
+    ]
+    path = raster_path if raster_path is not None else get_latest_upes_raster_path()
+    pairs = sample_upes_along_lines_mean_max(path, lines, step_m=step_m)
+    stats = np.array(pairs, dtype=np.float64).reshape(-1, 2)
+    return stats[:, 0], stats[:, 1]
@@ -11,6 +11,7 @@ from typing import Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from urllib.parse import urlencode
 
@@ -36,6 +37,12 @@ TEMPO_COLLECTION_IDS = {
 # Default variable for coverage request (Harmony "collections" = variables; "all" often works)
 DEFAULT_VARIABLE = "all"
 
+# Keep-alive session for every Harmony/CMR/URS call, so job polls and CMR probes reuse TLS connections.
+# Retries stay in _request_with_retry (max_retries=0 here); the pool covers concurrent CMR probes.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+_SESSION.headers["User-Agent"] = f"aeris-harmony-client {requests.utils.default_user_agent()}"
+
 
 def search_cmr_collections(
     short_name: Optional[str] = None,
@@ -58,7 +65,7 @@ def search_cmr_collections(
         return []
     url = f"{CMR_BASE_URL.rstrip('/')}/search/collections.json?{urlencode(params)}"
     try:
-        r = requests.get(url, timeout=15)
+        r = _SESSION.get(url, timeout=15)
         r.raise_for_status()
         data = r.json()
         entries = data.get("feed", {}).get("entry", [])
@@ -94,7 +101,7 @@ def search_cmr_granules(
     }
     url = f"{CMR_BASE_URL.rstrip('/')}/search/granules.json?{urlencode(params)}"
     try:
-        r = requests.get(url, timeout=15)
+        r = _SESSION.get(url, timeout=15)
         r.raise_for_status()
         data = r.json()
         entries = data.get("feed", {}).get("entry", [])
@@ -120,13 +127,13 @@ def get_bearer_token() -> Optional[str]:
     headers = {"Authorization": f"Basic {basic}"}
     try:
         # Try existing tokens first (GET)
-        r = requests.get(URSA_TOKENS_URL, headers=headers, timeout=15)
+        r = _SESSION.get(URSA_TOKENS_URL, headers=headers, timeout=15)
         if r.status_code == 200:
             data = r.json()
             if isinstance(data, list) and len(data) > 0:
                 return data[0].get("access_token")
         # Create new token (POST)
-        r = requests.post(URSA_TOKEN_URL, headers=headers, timeout=15)
+        r = _SESSION.post(URSA_TOKEN_URL, headers=headers, timeout=15)
         r.raise_for_status()
         return r.json().get("access_token")
     except Exception as e:
@@ -169,14 +176,13 @@ def _request_with_retry(
     headers: Optional[dict] = None,
     max_retries: int = 3,
 ) -> requests.Response:
-    """GET or POST with exponential backoff on 429/500."""
-    session = requests.Session()
+    """GET or POST with exponential backoff on 429/500 (on the shared keep-alive session)."""
     for attempt in range(max_retries):
         try:
             if method.upper() == "GET":
-                r = session.get(url, headers=headers, timeout=60, allow_redirects=False)
+                r = _SESSION.get(url, headers=headers, timeout=60, allow_redirects=False)
             else:
-                r = session.post(url, headers=headers, timeout=60, allow_redirects=False)
+                r = _SESSION.post(url, headers=headers, timeout=60, allow_redirects=False)
         except requests.RequestException as e:
             logger.warning("Request attempt %s failed: %s", attempt + 1, e)
             if attempt == max_retries - 1:
@@ -271,7 +277,7 @@ def download_to_temp_file(url: str, token: Optional[str], suffix: str = ".tif")
     import tempfile
 
     headers = {"Authorization": f"Bearer {token}"} if token else {}
-    r = requests.get(url, headers=headers, timeout=120, stream=True)
+    r = _SESSION.get(url, headers=headers, timeout=120, stream=True)
     r.raise_for_status()
     fd, path = tempfile.mkstemp(suffix=suffix)
     try:
@@ -9,7 +9,7 @@ import numpy as np
 import rasterio
 from rasterio.transform import xy
 
-from pollution_utils import classify_pollution_level
+from pollution_utils import classify_severity_array
 
 DEFAULT_CHUNK_SIZE = 2000
 DEFAULT_MAX_CELLS = 5000
@@ -54,7 +54,7 @@ def _cell_to_wkt(lon_min: float, lat_min: float, lon_max: float, lat_max: float)
     )
 
 
-def geotiff_to_grid_rows(
+def geotiff_to_grid_columns(
     geotiff_path: Union[str, Path],
     gas_type: str,
     timestamp: datetime,
@@ -62,12 +62,12 @@ def geotiff_to_grid_rows(
     subsample: Optional[int] = None,
     max_cells: int = DEFAULT_MAX_CELLS,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
-) -> Iterator[List[Dict[str, Any]]]:
+) -> Iterator[Dict[str, Any]]:
     """
-    Read GeoTIFF with rasterio; yield chunks of grid row dicts for pollution_grid bulk insert.
+    Columnar form of geotiff_to_grid_rows: yield one dict of arrays per chunk.
 
-    Each row dict has: timestamp, gas_type, geom_wkt, pollution_value, severity_level.
-    Optionally subsample (e.g. subsample=4 → every 4th row/col) to limit cell count.
+    Each chunk has scalar timestamp and gas_type plus parallel columns geom_wkt (object),
+    pollution_value (float64) and severity_level (int8), in the same order as the row dicts.
     """
     path = Path(geotiff_path)
     if not path.exists():
@@ -76,7 +76,24 @@ def geotiff_to_grid_rows(
     with rasterio.open(path) as src:
         band = src.read(1)
         transform = src.transform
-        height, width = band.shape
+
+    yield from band_to_grid_columns(
+        band, transform, gas_type, timestamp, subsample=subsample, max_cells=max_cells, chunk_size=chunk_size
+    )
+
+
+def band_to_grid_columns(
+    band: np.ndarray,
+    transform: Any,
+    gas_type: str,
+    timestamp: datetime,
+    *,
+    subsample: Optional[int] = None,
+    max_cells: int = DEFAULT_MAX_CELLS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """geotiff_to_grid_columns over a band already in memory (lets a caller reuse one read)."""
+    height, width = band.shape
 
     # Subsample step: if subsample is None, choose step to cap total cells roughly
     total_pixels = height * width
@@ -88,32 +105,60 @@ def geotiff_to_grid_rows(
             # approximate: step so that (height/step)*(width/step) <= max_cells
             step = max(1, int((total_pixels / max_cells) ** 0.5))
 
-    chunk: List[Dict[str, Any]] = []
-    count = 0
-    for i in range(0, height, step):
-        if count >= max_cells:
-            break
-        for j in range(0, width, step):
-            if count >= max_cells:
-                break
-            val = float(band[i, j])
-            if np.isnan(val):
-                continue
-            if val >= FILL_VALUE_MAX.get(gas_type, 1e30):
-                continue  # skip fill/no-data
-            lon_min, lat_min, lon_max, lat_max = _pixel_bounds(transform, j, i)
-            wkt = _cell_to_wkt(lon_min, lat_min, lon_max, lat_max)
-            _, severity = classify_pollution_level(val, gas_type)
-            chunk.append({
+    # Classify every kept pixel in one vectorized pass (row-major order, first max_cells valid cells)
+    vals = band[::step, ::step].astype(np.float64)
+    valid = ~np.isnan(vals) & (vals < FILL_VALUE_MAX.get(gas_type, 1e30))
+    rows, cols = np.nonzero(valid)
+    rows, cols = rows[:max_cells], cols[:max_cells]
+    values = vals[rows, cols]
+    severities = classify_severity_array(values, gas_type)
+    rows *= step
+    cols *= step
+
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(values), chunk_size):
+        stop = start + chunk_size
+        wkts = [
+            _cell_to_wkt(*_pixel_bounds(transform, j, i))
+            for i, j in zip(rows[start:stop].tolist(), cols[start:stop].tolist())
+        ]
+        yield {
+            "timestamp": timestamp,
+            "gas_type": gas_type,
+            "geom_wkt": np.array(wkts, dtype=object),
+            "pollution_value": values[start:stop],
+            "severity_level": severities[start:stop],
+        }
+
+
+def geotiff_to_grid_rows(
+    geotiff_path: Union[str, Path],
+    gas_type: str,
+    timestamp: datetime,
+    *,
+    subsample: Optional[int] = None,
+    max_cells: int = DEFAULT_MAX_CELLS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Read GeoTIFF with rasterio; yield chunks of grid row dicts for pollution_grid bulk insert.
+
+    Each row dict has: timestamp, gas_type, geom_wkt, pollution_value, severity_level.
+    Optionally subsample (e.g. subsample=4 → every 4th row/col) to limit cell count.
+    Row view over geotiff_to_grid_columns.
+    """
+    for columns in geotiff_to_grid_columns(
+        geotiff_path, gas_type, timestamp, subsample=subsample, max_cells=max_cells, chunk_size=chunk_size
+    ):
+        yield [
+            {
                 "timestamp": timestamp,
                 "gas_type": gas_type,
                 "geom_wkt": wkt,
                 "pollution_value": val,
                 "severity_level": severity,
-            })
-            count += 1
-            if len(chunk) >= chunk_size:
-                yield chunk
-                chunk = []
-    if chunk:
-        yield chunk
+            }
+            for wkt, val, severity in zip(
+                columns["geom_wkt"].tolist(), columns["pollution_value"].tolist(), columns["severity_level"].tolist()
+            )
+        ]
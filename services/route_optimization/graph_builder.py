@@ -1,6 +1,8 @@
 """
 Build a pollution-weighted OSM graph: fetch OSMnx graph for bbox, sample UPES along edges, assign weight.
 """
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -10,14 +12,48 @@ from services.route_optimization.weights import get_weights, mode_modifier
 from services.upes.storage import upes_output_base
 
 
+# Resolved latest raster per final_score dir: dir -> (dir mtime_ns, resolved_at, path). Reused while
+# the directory is unchanged (a new hourly file bumps its mtime) and the TTL has not run out.
+LATEST_UPES_TTL_S = 60.0
+_latest_upes_cache: Dict[Path, Tuple[int, float, Optional[Path]]] = {}
+_latest_upes_lock = threading.Lock()
+
+
+def _scan_latest_upes_raster(final_dir: Path) -> Optional[Path]:
+    """Newest final_score_*.tif by mtime (one stat per file)."""
+    best: Optional[Path] = None
+    best_mtime = -1
+    for tif in final_dir.glob("final_score_*.tif"):
+        try:
+            mtime = tif.stat().st_mtime_ns
+        except OSError:
+            continue
+        if mtime > best_mtime:
+            best, best_mtime = tif, mtime
+    return best
+
+
 def get_latest_upes_raster_path() -> Optional[Path]:
     """Return path to latest final_score GeoTIFF, or None if none found."""
     base = upes_output_base()
     final_dir = base / "hourly_scores" / "final_score"
-    if not final_dir.exists():
+    try:
+        dir_mtime = final_dir.stat().st_mtime_ns
+    except OSError:
         return None
-    tifs = sorted(final_dir.glob("final_score_*.tif"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return tifs[0] if tifs else None
+    now = time.monotonic()
+    with _latest_upes_lock:
+        hit = _latest_upes_cache.get(final_dir)
+        if (
+            hit is not None
+            and hit[0] == dir_mtime
+            and now - hit[1] < LATEST_UPES_TTL_S
+            and (hit[2] is None or hit[2].exists())
+        ):
+            return hit[2]
+        latest = _scan_latest_upes_raster(final_dir)
+        _latest_upes_cache[final_dir] = (dir_mtime, now, latest)
+        return latest
 
 
 def _edge_geometry_to_coords(geom: Any) -> List[Tuple[float, float]]:
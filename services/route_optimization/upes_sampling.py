@@ -134,3 +134,48 @@ def sample_upes_along_line_mean_max(
         return float(np.mean(values)), float(np.max(values))
     except Exception:
         return fallback, fallback
+
+
+def sample_upes_along_lines_mean_max(
+    raster_path: Optional[Union[str, Path]],
+    lines: List[List[Tuple[float, float]]],
+    step_m: float = 50.0,
+    fallback: float = DEFAULT_UPES_FALLBACK,
+) -> List[Tuple[float, float]]:
+    """
+    sample_upes_along_line_mean_max for many lines in one raster context: the raster is opened and
+    band 1 read once, all resampled points are mapped to pixels in one rowcol call, and values are
+    gathered with one index lookup. Returns (mean, max) per line, (fallback, fallback) where a line
+    has no valid samples.
+    """
+    results = [(fallback, fallback)] * len(lines)
+    path = Path(raster_path) if raster_path else None
+    if not lines or not path or not path.exists():
+        return results
+    point_lists = [_resample_line(coords, step_m) if coords else [] for coords in lines]
+    counts = np.array([len(points) for points in point_lists], dtype=np.intp)
+    if not counts.sum():
+        return results
+    lonlat = np.array([p for points in point_lists for p in points], dtype=np.float64)
+    owner = np.repeat(np.arange(len(lines)), counts)
+    try:
+        import rasterio
+        from rasterio.transform import rowcol
+        with rasterio.open(path) as src:
+            rows, cols = rowcol(src.transform, lonlat[:, 0], lonlat[:, 1])
+            rows, cols = np.asarray(rows), np.asarray(cols)
+            inside = (rows >= 0) & (rows < src.height) & (cols >= 0) & (cols < src.width)
+            band = src.read(1)
+        values = band[rows[inside], cols[inside]].astype(np.float64)
+        owner = owner[inside]
+        keep = ~np.isnan(values)
+        values, owner = np.clip(values[keep], 0.0, 1.0), owner[keep]
+    except Exception:
+        return results
+    # Points stay grouped by line, so each line's valid values are one contiguous run
+    order_counts = np.bincount(owner, minlength=len(lines))
+    starts = np.concatenate(([0], np.cumsum(order_counts)[:-1]))
+    for i in np.flatnonzero(order_counts).tolist():
+        run = values[starts[i]:starts[i] + order_counts[i]]
+        results[i] = (float(np.mean(run)), float(np.max(run)))
+    return results
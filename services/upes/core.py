@@ -18,14 +18,23 @@ def compute_satellite_score(
     """
     weights = weights or getattr(settings, "upes_weights", None) or UPES_DEFAULT_WEIGHTS
     out: Optional[np.ndarray] = None
+    term: Optional[np.ndarray] = None
     for gas, arr in normalized_gases.items():
         w = weights.get(gas, 0.0)
         if w <= 0:
             continue
+        arr = np.asarray(arr)
         if out is None:
-            out = w * np.asarray(arr, dtype=float).copy()
-        else:
+            out = np.multiply(arr, w, dtype=float)
+            continue
+        # Accumulate in place through one scratch buffer instead of two fresh grids per gas
+        if arr.shape != out.shape:
             out = out + w * np.asarray(arr, dtype=float)
+            continue
+        if term is None or term.shape != out.shape:
+            term = np.empty_like(out)
+        np.multiply(arr, w, out=term, dtype=float)
+        out += term
     if out is None:
         return np.array(0.0)
     return out
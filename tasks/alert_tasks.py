@@ -14,7 +14,7 @@ from sqlalchemy.orm import sessionmaker, joinedload
 from config import settings
 from database.models import AlertLog, RouteExposureHistory, SavedRoute, User
 from services.alerts.detection import run_detection
-from services.alerts.route_exposure import compute_upes_along_saved_route
+from services.alerts.route_exposure import compute_upes_along_saved_routes
 from services.route_optimization.graph_builder import get_latest_upes_raster_path
 
 logger = logging.getLogger(__name__)
@@ -58,15 +58,14 @@ def compute_saved_route_upes_scores(self):
         routes = session.query(SavedRoute).all()
         now = datetime.now(timezone.utc)
         count = 0
-        for route in routes:
+        # Sample every route in one raster pass instead of reopening the raster per route
+        means, maxes = compute_upes_along_saved_routes(
+            [(r.origin_lat, r.origin_lon) for r in routes],
+            [(r.dest_lat, r.dest_lon) for r in routes],
+            raster_path=raster_path,
+        )
+        for route, mean_upes, max_upes in zip(routes, means.tolist(), maxes.tolist()):
             try:
-                mean_upes, max_upes = compute_upes_along_saved_route(
-                    route.origin_lat,
-                    route.origin_lon,
-                    route.dest_lat,
-                    route.dest_lon,
-                    raster_path=raster_path,
-                )
                 hist = RouteExposureHistory(
                     route_id=route.id,
                     timestamp=now,
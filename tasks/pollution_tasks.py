@@ -9,14 +9,13 @@ from typing import Optional
 
 import numpy as np
 
-from geoalchemy2 import WKTElement
-
 from celery_app import app
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from config import settings
-from database.models import PollutionGrid, SavedRoute
+from database.bulk import POLLUTION_GRID_INSERT, pollution_grid_params
+from database.models import SavedRoute
 from services.harmony_service import TEMPO_COLLECTION_IDS, fetch_tempo_geotiff
 from services.raster_normalizer import geotiff_to_grid_rows
 from services.upes.core import (
@@ -119,17 +118,9 @@ def fetch_tempo_hourly(self):
             try:
                 per_gas = 0
                 for chunk in geotiff_to_grid_rows(path, gas, timestamp):
-                    rows = [
-                        PollutionGrid(
-                            timestamp=row["timestamp"],
-                            gas_type=row["gas_type"],
-                            geom=WKTElement(row["geom_wkt"], srid=4326),
-                            pollution_value=row["pollution_value"],
-                            severity_level=row["severity_level"],
-                        )
-                        for row in chunk
-                    ]
-                    session.add_all(rows)
+                    # Core executemany: no ORM objects per cell
+                    rows = pollution_grid_params(chunk)
+                    session.execute(POLLUTION_GRID_INSERT, rows)
                     session.commit()
                     per_gas += len(rows)
                     inserted_total += len(rows)
@@ -28,9 +28,10 @@ def pytest_configure(config):
 
 @pytest.fixture
 def mock_redis() -> AsyncMock:
-    """Fake async Redis for cache tests (get/setex return OK)."""
+    """Fake async Redis for cache tests (get/mget miss, setex returns OK)."""
     redis = AsyncMock()
     redis.get = AsyncMock(return_value=None)
+    redis.mget = AsyncMock(side_effect=lambda *keys: [None] * len(keys))
     redis.setex = AsyncMock(return_value=True)
     redis.ping = AsyncMock(return_value=True)
     return redis
@@ -57,7 +57,7 @@ class TestRunAlertPipeline:
     """Uses DB (saved_routes, user, route_exposure_history, alert_log), detection, optional n8n POST."""
 
     def test_skips_when_alerts_disabled(self):
-        with patch.object(settings, "alerts_enabled", False):
+        with patch("tasks.alert_tasks.settings", settings.model_copy(update={"alerts_enabled": False})):
             out = run_alert_pipeline()
         assert out.get("status") == "skipped"
         assert out.get("reason") == "disabled"
@@ -4,6 +4,8 @@ Tests for Alerts & Personalization: detection logic (ALERTS_AND_PERSONALIZATION.
 import pytest
 from unittest.mock import patch
 
+from config import settings
+from services.alerts import detection
 from services.alerts.detection import (
     check_hazard_alert,
     check_route_deterioration,
@@ -58,6 +60,15 @@ class TestCheckHazardAlert:
         assert check_hazard_alert(0.7, critical_threshold=0.8) is None
         assert check_hazard_alert(0.8, critical_threshold=0.8) is not None
 
+    def test_default_threshold_follows_refreshed_settings(self):
+        try:
+            with patch.object(detection, "settings", settings.model_copy(update={"alerts_hazard_threshold": 0.5})):
+                detection.refresh_thresholds()
+                assert check_hazard_alert(0.6) is not None
+        finally:
+            detection.refresh_thresholds()
+        assert check_hazard_alert(0.6) is None
+
 
 class TestCheckWindShiftAlert:
     """Wind toward route: bearing(source->route) ≈ (wind_degree+180); speed >= min_speed."""
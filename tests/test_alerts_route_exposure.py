@@ -5,8 +5,11 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
+
 from services.alerts.route_exposure import (
     compute_upes_along_saved_route,
+    compute_upes_along_saved_routes,
     route_line_coords,
 )
 
@@ -46,3 +49,24 @@ class TestComputeUpesAlongSavedRoute:
                 mean, max_u = compute_upes_along_saved_route(34.0, -118.0, 34.1, -117.9)
         assert mean == 0.5
         # When no raster, sampling uses fallback (0.5) so mean and max both 0.5
+
+
+class TestComputeUpesAlongSavedRoutes:
+    """Batch form: (N, 2) lat/lon arrays -> per-route mean and max arrays from one sampling call."""
+
+    def test_passes_all_lines_in_one_call(self):
+        fake_path = Path("/tmp/final_score_2025010112.tif")
+        with patch("services.alerts.route_exposure.sample_upes_along_lines_mean_max") as mock_samp:
+            mock_samp.return_value = [(0.3, 0.4), (0.6, 0.9)]
+            means, maxes = compute_upes_along_saved_routes(
+                [(34.0, -118.0), (35.0, -117.0)], [(34.1, -117.9), (35.1, -116.9)], raster_path=fake_path
+            )
+        mock_samp.assert_called_once()
+        assert mock_samp.call_args[0][1] == [[(-118.0, 34.0), (-117.9, 34.1)], [(-117.0, 35.0), (-116.9, 35.1)]]
+        assert means.tolist() == [0.3, 0.6]
+        assert maxes.tolist() == [0.4, 0.9]
+
+    def test_empty_batch(self):
+        with patch("services.alerts.route_exposure.get_latest_upes_raster_path", return_value=None):
+            means, maxes = compute_upes_along_saved_routes(np.empty((0, 2)), np.empty((0, 2)))
+        assert means.size == 0 and maxes.size == 0
@@ -0,0 +1,67 @@
+"""
+Tests for api_server._open_gas_file: the per-path gas file cache shared by asyncio.to_thread workers.
+Requires full project deps (api_server); file loading is mocked.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def api():
+    try:
+        import api_server
+    except Exception as e:
+        pytest.skip("api_server not importable: %s" % e)
+    with patch.dict(api_server._gas_file_cache, clear=True), patch.dict(api_server._gas_file_path_locks, clear=True):
+        yield api_server
+
+
+def _fake_load(calls):
+    lock = threading.Lock()
+
+    def load(data_file, gas, cacheable):
+        with lock:
+            calls.append(data_file)
+        time.sleep(0.02)
+        return {"path": data_file}
+
+    return load
+
+
+class TestOpenGasFileCache:
+    def test_concurrent_requests_open_same_file_once(self, api, tmp_path):
+        f = tmp_path / "no2.nc"
+        f.write_bytes(b"x")
+        calls = []
+        with patch.object(api, "_load_gas_file", side_effect=_fake_load(calls)):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                entries = list(pool.map(lambda _: api._open_gas_file(str(f), "NO2"), range(16)))
+        assert calls == [str(f)]
+        assert all(e is entries[0] for e in entries)
+
+    def test_concurrent_eviction_keeps_cache_bounded(self, api, tmp_path):
+        paths = []
+        for i in range(3 * api.GAS_FILE_CACHE_MAX):
+            p = tmp_path / f"g{i}.nc"
+            p.write_bytes(b"x")
+            paths.append(str(p))
+        calls = []
+        with patch.object(api, "_load_gas_file", side_effect=_fake_load(calls)):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                entries = list(pool.map(lambda p: api._open_gas_file(p, "NO2"), paths * 2))
+        assert [e["path"] for e in entries] == paths * 2
+        assert len(api._gas_file_cache) <= api.GAS_FILE_CACHE_MAX
+        assert set(api._gas_file_path_locks) <= set(api._gas_file_cache)
+
+    def test_failed_load_drops_path_lock(self, api, tmp_path):
+        f = tmp_path / "bad.nc"
+        f.write_bytes(b"x")
+        with patch.object(api, "_load_gas_file", side_effect=OSError("corrupt")):
+            with pytest.raises(OSError):
+                api._open_gas_file(str(f), "NO2")
+        assert api._gas_file_path_locks == {}
+        assert api._gas_file_cache == {}
@@ -0,0 +1,92 @@
+"""
+Tests for api_server.detect_hotspots (connected regions per severity level, nested level masks)
+and check_regional_alerts (alert window over the scene). Requires full project deps (api_server).
+"""
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from pollution_utils import POLLUTION_THRESHOLDS
+
+
+@pytest.fixture(scope="module")
+def api():
+    try:
+        import api_server
+    except Exception as e:
+        pytest.skip("api_server not importable: %s" % e)
+    return api_server
+
+
+@pytest.fixture(scope="module")
+def detect_hotspots(api):
+    return api.detect_hotspots
+
+
+def _plume(gas: str, n: int = 120):
+    """Single Gaussian plume peaking above the hazardous threshold, on a 1D lat/lon grid."""
+    lats = np.linspace(33.0, 35.0, n)
+    lons = np.linspace(-119.0, -117.0, n)
+    yy, xx = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    peak = POLLUTION_THRESHOLDS[gas]["hazardous"] * 2.0
+    data = peak * np.exp(-((yy - n / 2) ** 2 + (xx - n / 2) ** 2) / (2 * (n / 8) ** 2))
+    return data, lats, lons
+
+
+class TestDetectHotspots:
+    def test_single_plume_reports_each_level_with_its_own_footprint(self, detect_hotspots):
+        gas = "NO2"
+        data, lats, lons = _plume(gas)
+        hotspots = detect_hotspots(data, lats, lons, gas)
+
+        levels = ["hazardous", "very_unhealthy", "unhealthy", "moderate"]
+        assert [h["level"] for h in hotspots] == levels
+        lat_grid, lon_grid = np.meshgrid(lats, lons, indexing="ij")
+        for h, level in zip(hotspots, levels):
+            mask = data >= POLLUTION_THRESHOLDS[gas][level]
+            labeled, num = ndimage.label(mask)
+            assert num == 1
+            assert h["size_pixels"] == int(mask.sum())
+            assert h["area_km2"] == pytest.approx(mask.sum() * 2.1 * 4.4)
+            assert h["max_value"] == pytest.approx(data[mask].max())
+            assert h["mean_value"] == pytest.approx(data[mask].mean())
+            assert h["lat_range"] == pytest.approx((lat_grid[mask].min(), lat_grid[mask].max()))
+            assert h["lon_range"] == pytest.approx((lon_grid[mask].min(), lon_grid[mask].max()))
+        # Nested footprints grow outward from the hazardous core
+        sizes = [h["size_pixels"] for h in hotspots]
+        assert sizes == sorted(sizes)
+
+    def test_min_cluster_size_applies_per_level(self, detect_hotspots):
+        gas = "NO2"
+        data = np.zeros((10, 10))
+        data[2, 2] = POLLUTION_THRESHOLDS[gas]["hazardous"] * 2.0  # one-pixel core
+        data[1:4, 1:4] = np.maximum(data[1:4, 1:4], POLLUTION_THRESHOLDS[gas]["moderate"])
+        hotspots = detect_hotspots(data, np.arange(10.0), np.arange(10.0), gas, min_cluster_size=3)
+        assert [(h["level"], h["size_pixels"]) for h in hotspots] == [("moderate", 9)]
+
+
+class TestCheckRegionalAlerts:
+    def _curvilinear(self, n: int = 20):
+        lats, lons = np.meshgrid(np.linspace(33.0, 35.0, n), np.linspace(-119.0, -117.0, n), indexing="ij")
+        return lats.copy(), lons.copy()
+
+    def test_nan_coordinate_inside_box_keeps_its_row_and_column(self, api):
+        gas = "NO2"
+        lats, lons = self._curvilinear()
+        data = np.zeros(lats.shape)
+        # Peak in the box's first row and column (~33.53, ~-118.47), each also holding a fill coordinate
+        data[5, 5] = POLLUTION_THRESHOLDS[gas]["hazardous"] * 2.0
+        lats[5, 15] = np.nan
+        lons[15, 5] = np.nan
+        alerts = api.check_regional_alerts(data, lats, lons, 34.0, -118.0, 0.5, gas, "LA")
+        assert len(alerts) == 1
+        assert alerts[0]["level"] == "hazardous"
+        assert alerts[0]["max_value"] == data[5, 5]
+        inside = (lats >= 33.5) & (lats <= 34.5) & (lons >= -118.5) & (lons <= -117.5)
+        assert alerts[0]["num_pixels"] == int(inside.sum())
+
+    def test_all_nan_coordinates_give_no_alert(self, api):
+        lats, lons = self._curvilinear()
+        lats[:] = np.nan
+        data = np.full(lats.shape, POLLUTION_THRESHOLDS["NO2"]["hazardous"] * 2.0)
+        assert api.check_regional_alerts(data, lats, lons, 34.0, -118.0, 0.5, "NO2", "LA") == []
@@ -1,9 +1,12 @@
 """
 Tests for auth layer (DATA_LAYER): password hashing, JWT create/decode, get_current_user dependency.
 """
+import time
+
 import pytest
 
 from auth import (
+    _token_cache,
     create_access_token,
     decode_access_token,
     hash_password,
@@ -54,3 +57,13 @@ class TestJWT:
         token = create_access_token(subject="user@example.com")
         sub = decode_access_token(token)
         assert sub == "user@example.com"
+
+    def test_decode_is_cached_until_expiry(self):
+        token = create_access_token(subject=7)
+        assert decode_access_token(token) == "7"
+        assert len(_token_cache) > 0
+        key = next(k for k, v in _token_cache.items() if v[0] == "7")
+        _token_cache[key] = ("cached", time.time() + 60)
+        assert decode_access_token(token) == "cached"
+        _token_cache[key] = ("stale", time.time() - 1)
+        assert decode_access_token(token) == "7"
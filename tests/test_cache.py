@@ -9,24 +9,37 @@ import pytest
 from cache import (
     TTL_POLLUTANT_MOVEMENT,
     TTL_WEATHER,
+    _grid_cell,
+    _key_pollutant_movement,
+    _key_weather,
     cache_get,
     cache_set,
+    geocode_first_hit,
     get_pollutant_movement_cached,
     get_weather_cached,
+    key_geocode,
+    key_groq_interpretation,
     key_hotspots,
+    key_osrm_routes,
+    key_reverse_geocode,
     key_route_exposure,
     key_route_optimized,
+    reverse_geocode_batch,
 )
 
 
 class TestCacheKeyBuilders:
     def test_key_weather_format(self):
-        key = key_weather(34.0, -118.0, 3)
-        assert key == "weather:34.0:-118.0:3"
+        key = _key_weather(680, -2360, 3)
+        assert key == "wx:680:-2360:3"
 
     def test_key_pollutant_movement_format(self):
-        key = key_pollutant_movement(34.0, -118.0)
-        assert key == "pollutant_movement:34.0:-118.0"
+        key = _key_pollutant_movement(680, -2360)
+        assert key == "pmv:680:-2360"
+
+    def test_grid_cell_floors_negative_coords(self):
+        assert _grid_cell(34.01, -118.01) == (680, -2361)
+        assert _grid_cell(-0.01, 0.01) == (-1, 0)
 
     def test_key_hotspots_deterministic_for_same_gases(self):
         k1 = key_hotspots(34.0, -118.0, 0.3, ["NO2", "O3"])
@@ -39,6 +52,11 @@ class TestCacheKeyBuilders:
         assert "route_exposure:" in key
         assert "34.0" in key and "35.0" in key
 
+    def test_key_route_exposure_variant_changes_key(self):
+        base = key_route_exposure(34.0, -118.0, 35.0, -119.0, ["NO2"])
+        assert key_route_exposure(34.0, -118.0, 35.0, -119.0, ["NO2"], variant="20:False:commute") != base
+        assert key_route_exposure(34.0, -118.0, 35.0, -119.0, ["NO2"], variant="") == base
+
     def test_key_route_optimized_includes_mode(self):
         key = key_route_optimized(34.0, -118.0, 35.0, -119.0, "commute")
         assert "route_opt:" in key
@@ -48,13 +66,22 @@ class TestCacheKeyBuilders:
         key = key_route_optimized(34.0, -118.0, 35.0, -119.0, "  Jogger  ")
         assert "jogger" in key
 
+    def test_key_osrm_routes_rounds_to_thousandth_degree(self):
+        assert key_osrm_routes(34.00012, -118.00049, 35.0, -119.0, True) == key_osrm_routes(
+            34.0, -118.0, 35.0, -119.0, True
+        )
+        assert key_osrm_routes(34.0, -118.0, 35.0, -119.0, False) != key_osrm_routes(34.0, -118.0, 35.0, -119.0, True)
 
-def key_weather(lat: float, lon: float, days: int) -> str:
-    return f"weather:{lat}:{lon}:{days}"
+    def test_key_groq_interpretation_ignores_dict_order_and_separates_kinds(self):
+        k1 = key_groq_interpretation("weather", {"a": 1, "b": 2}, "LA")
+        assert k1 == key_groq_interpretation("weather", {"b": 2, "a": 1}, "LA")
+        assert k1.startswith("groq:weather:")
+        assert key_groq_interpretation("prediction", {"a": 1, "b": 2}, "LA") != k1
+        assert key_groq_interpretation("weather", {"a": 1, "b": 3}, "LA") != k1
 
 
-def key_pollutant_movement(lat: float, lon: float) -> str:
-    return f"pollutant_movement:{lat}:{lon}"
+def _entry(lat: float, lon: float, payload: dict) -> str:
+    return json.dumps({"lat": lat, "lon": lon, "payload": payload})
 
 
 class TestCacheGetSet:
@@ -97,15 +124,74 @@ class TestGetWeatherCached:
         result = await get_weather_cached(mock_redis, 34.0, -118.0, 1, fetch_fn)
         assert result == sample_weather_data
         mock_redis.setex.assert_called_once()
-        assert mock_redis.setex.call_args[0][1] == TTL_WEATHER
+        args = mock_redis.setex.call_args[0]
+        assert args[0] == _key_weather(*_grid_cell(34.0, -118.0), 1)
+        assert args[1] == TTL_WEATHER
+        assert json.loads(args[2]) == {"lat": 34.0, "lon": -118.0, "payload": sample_weather_data}
+
+    @pytest.mark.asyncio
+    async def test_async_fetch_fn_is_awaited(self, mock_redis, sample_weather_data):
+        async def fetch_fn(lat, lon, days):
+            return sample_weather_data
+
+        result = await get_weather_cached(mock_redis, 34.0, -118.0, 1, fetch_fn)
+        assert result == sample_weather_data
+        mock_redis.setex.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_lookup_probes_nine_cells(self, mock_redis, sample_weather_data):
+        await get_weather_cached(mock_redis, 34.0, -118.0, 1, lambda lat, lon, days: sample_weather_data)
+        keys = mock_redis.mget.call_args[0]
+        assert len(keys) == 9
+        assert keys[0] == _key_weather(*_grid_cell(34.0, -118.0), 1)
 
     @pytest.mark.asyncio
     async def test_hit_returns_cached(self, mock_redis, sample_weather_data):
-        mock_redis.get.return_value = json.dumps(sample_weather_data)
+        mock_redis.mget.side_effect = None
+        mock_redis.mget.return_value = [_entry(34.0, -118.0, sample_weather_data)] + [None] * 8
         fetch_fn = lambda lat, lon, days: {"never": "called"}
         result = await get_weather_cached(mock_redis, 34.0, -118.0, 1, fetch_fn)
         assert result == sample_weather_data
 
+    @pytest.mark.asyncio
+    async def test_neighbor_cell_within_tolerance_hits(self, mock_redis, sample_weather_data):
+        # Stored in the cell to the north (~2 km away): reused
+        stored_lat = 34.04 + 0.02
+        assert _grid_cell(stored_lat, -118.0)[0] == _grid_cell(34.04, -118.0)[0] + 1
+        mock_redis.mget.side_effect = None
+        mock_redis.mget.return_value = [None] * 8 + [_entry(stored_lat, -118.0, sample_weather_data)]
+        fetch_fn = lambda lat, lon, days: {"never": "called"}
+        result = await get_weather_cached(mock_redis, 34.04, -118.0, 1, fetch_fn)
+        assert result == sample_weather_data
+
+    @pytest.mark.asyncio
+    async def test_entry_beyond_tolerance_is_ignored(self, mock_redis, sample_weather_data):
+        mock_redis.mget.side_effect = None
+        mock_redis.mget.return_value = [_entry(34.09, -118.09, {"stale": True})] + [None] * 8
+        fetch_fn = lambda lat, lon, days: sample_weather_data
+        result = await get_weather_cached(mock_redis, 34.0, -118.0, 1, fetch_fn)
+        assert result == sample_weather_data
+        mock_redis.setex.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_without_redis_uses_local_cache(self, sample_weather_data):
+        calls = []
+
+        def fetch_fn(lat, lon, days):
+            calls.append((lat, lon, days))
+            return sample_weather_data
+
+        first = await get_weather_cached(None, 12.3, 45.6, 1, fetch_fn)
+        second = await get_weather_cached(None, 12.31, 45.6, 1, fetch_fn)
+        assert first == second == sample_weather_data
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_error_payload_not_cached(self, mock_redis):
+        result = await get_weather_cached(mock_redis, 34.0, -118.0, 1, lambda lat, lon, days: {"error": "down"})
+        assert result == {"error": "down"}
+        mock_redis.setex.assert_not_called()
+
 
 class TestGetPollutantMovementCached:
     @pytest.mark.asyncio
@@ -119,7 +205,145 @@ class TestGetPollutantMovementCached:
 
     @pytest.mark.asyncio
     async def test_hit_returns_cached(self, mock_redis, sample_pollutant_movement):
-        mock_redis.get.return_value = json.dumps(sample_pollutant_movement)
+        mock_redis.mget.side_effect = None
+        mock_redis.mget.return_value = [_entry(34.0, -118.0, sample_pollutant_movement)] + [None] * 8
         fetch_fn = lambda lat, lon: {"never": "called"}
         result = await get_pollutant_movement_cached(mock_redis, 34.0, -118.0, fetch_fn)
         assert result == sample_pollutant_movement
+
+
+class TestReverseGeocodeBatch:
+    def test_key_rounds_to_hundredth_degree(self):
+        assert key_reverse_geocode(34.0512, -118.2437) == "geo:rev:34.05:-118.24"
+
+    @pytest.mark.asyncio
+    async def test_dedupes_points_and_fetches_misses_once(self, mock_redis):
+        calls = []
+
+        async def fetch_many(pts):
+            calls.extend(pts)
+            return ["Los Angeles"] * len(pts)
+
+        points = [(34.0512, -118.2437), (34.0498, -118.2441), (35.0, -119.0)]
+        names = await reverse_geocode_batch(mock_redis, points, fetch_many)
+        assert names == ["Los Angeles", "Los Angeles", "Los Angeles"]
+        assert len(calls) == 2
+        mock_redis.mget.assert_called_once_with("geo:rev:34.05:-118.24", "geo:rev:35.0:-119.0")
+        assert mock_redis.setex.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_names_skip_fetch(self, mock_redis):
+        mock_redis.mget.side_effect = None
+        mock_redis.mget.return_value = [json.dumps("Pasadena"), json.dumps(None)]
+
+        async def fetch_many(pts):
+            raise AssertionError("should not fetch on cache hit")
+
+        names = await reverse_geocode_batch(mock_redis, [(34.15, -118.14), (0.0, 0.0)], fetch_many)
+        assert names == ["Pasadena", None]
+        mock_redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_or_empty_lookups_are_not_cached(self, mock_redis):
+        async def fetch_none(pts):
+            return [None] * len(pts)
+
+        async def fetch_raises(pts):
+            raise TimeoutError("nominatim timed out")
+
+        assert await reverse_geocode_batch(mock_redis, [(34.0, -118.0)], fetch_none) == [None]
+        assert await reverse_geocode_batch(mock_redis, [(34.0, -118.0)], fetch_raises) == [None]
+        mock_redis.setex.assert_not_called()
+
+
+class TestGeocodeFirstHit:
+    def test_key_geocode_normalizes_case_and_whitespace(self):
+        assert key_geocode("Los  Angeles") == key_geocode("los angeles")
+
+    @pytest.mark.asyncio
+    async def test_cached_hit_skips_fetch(self, mock_redis):
+        mock_redis.mget.side_effect = None
+        mock_redis.mget.return_value = [json.dumps(None), json.dumps([34.05, -118.24])]
+
+        def fetch(query):
+            raise AssertionError("should not fetch on cache hit")
+
+        result = await geocode_first_hit(mock_redis, ["LA fire", "LA"], fetch)
+        assert result == (34.05, -118.24)
+
+    @pytest.mark.asyncio
+    async def test_misses_fetch_until_first_success_and_cache(self, mock_redis):
+        answers = {"Nowhere": None, "Nowhere, USA": (40.0, -100.0)}
+        result = await geocode_first_hit(
+            mock_redis, ["Nowhere", "Nowhere", "Nowhere, USA"], answers.get, min_interval_s=0
+        )
+        assert result == (40.0, -100.0)
+        mock_redis.mget.assert_called_once_with(key_geocode("Nowhere"), key_geocode("Nowhere, USA"))
+        cached = {c.args[0]: json.loads(c.args[2]) for c in mock_redis.setex.call_args_list}
+        assert cached[key_geocode("Nowhere, USA")] == [40.0, -100.0]
+
+    @pytest.mark.asyncio
+    async def test_cached_lower_priority_hit_does_not_beat_uncached_candidate(self, mock_redis):
+        mock_redis.mget.side_effect = None
+        mock_redis.mget.return_value = [None, json.dumps([1.0, 2.0])]
+        fetched = []
+
+        def fetch(query):
+            fetched.append(query)
+            return (39.8, -89.6)
+
+        result = await geocode_first_hit(
+            mock_redis, ["Springfield", "Springfield, California"], fetch, min_interval_s=0
+        )
+        assert result == (39.8, -89.6)
+        assert fetched == ["Springfield"]
+
+    @pytest.mark.asyncio
+    async def test_cached_hit_used_when_earlier_candidate_fails_to_fetch(self, mock_redis):
+        mock_redis.mget.side_effect = None
+        mock_redis.mget.return_value = [None, json.dumps([1.0, 2.0])]
+
+        result = await geocode_first_hit(mock_redis, ["Springfield", "Springfield, California"],
+                                         lambda q: None, min_interval_s=0)
+        assert result == (1.0, 2.0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_answer_in_candidate_order(self, mock_redis):
+        import time
+
+        def fetch(query):
+            if query == "first":
+                time.sleep(0.05)  # the higher-priority lookup finishes last
+            return {"first": (1.0, 1.0), "second": (2.0, 2.0)}[query]
+
+        result = await geocode_first_hit(
+            mock_redis, ["first", "second"], fetch, max_concurrency=2, min_interval_s=0
+        )
+        assert result == (1.0, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_is_not_cached_as_no_match(self, mock_redis):
+        def fetch(query):
+            raise TimeoutError("nominatim timed out")
+
+        assert await geocode_first_hit(mock_redis, ["Ojai"], fetch, min_interval_s=0) is None
+        mock_redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_real_no_match_is_cached(self, mock_redis):
+        assert await geocode_first_hit(mock_redis, ["Atlantis"], lambda q: None, min_interval_s=0) is None
+        key, _, raw = mock_redis.setex.call_args.args
+        assert key == key_geocode("Atlantis") and json.loads(raw) is None
+
+    @pytest.mark.asyncio
+    async def test_no_candidates_returns_none(self, mock_redis):
+        assert await geocode_first_hit(mock_redis, ["", ""], lambda q: (0.0, 0.0)) is None
+
+    @pytest.mark.asyncio
+    async def test_namespace_keys_apart_from_plain_lookups(self, mock_redis):
+        result = await geocode_first_hit(
+            mock_redis, ["Ojai"], lambda q: (34.45, -119.24), min_interval_s=0, namespace="us:"
+        )
+        assert result == (34.45, -119.24)
+        mock_redis.mget.assert_called_once_with(key_geocode("us:Ojai"))
+        assert mock_redis.setex.call_args.args[0] == key_geocode("us:Ojai") != key_geocode("Ojai")
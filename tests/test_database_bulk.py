@@ -0,0 +1,52 @@
+"""
+Tests for Core bulk inserts (DATA_LAYER): pollution_grid_params and bulk_insert_pollution_grid.
+"""
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from geoalchemy2 import WKTElement
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.bulk import POLLUTION_GRID_INSERT, bulk_insert_pollution_grid, pollution_grid_params
+
+_TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+_WKT = "POLYGON((-118 34, -117.95 34, -117.95 34.05, -118 34.05, -118 34))"
+
+
+def _row(value: float = 1.0e16, severity: int = 2) -> dict:
+    return {
+        "timestamp": _TS,
+        "gas_type": "NO2",
+        "geom_wkt": _WKT,
+        "pollution_value": value,
+        "severity_level": severity,
+    }
+
+
+class TestPollutionGridParams:
+    def test_maps_geom_wkt_to_srid_4326_element(self):
+        params = pollution_grid_params([_row()])
+        assert set(params[0]) == {"timestamp", "gas_type", "geom", "pollution_value", "severity_level"}
+        assert isinstance(params[0]["geom"], WKTElement)
+        assert params[0]["geom"].srid == 4326
+        assert params[0]["geom"].data == _WKT
+
+
+class TestBulkInsertPollutionGrid:
+    @pytest.mark.asyncio
+    async def test_single_executemany_for_all_rows(self):
+        session = AsyncMock(spec=AsyncSession)
+        n = await bulk_insert_pollution_grid(session, [_row(), _row(2.0e16, 3)])
+        assert n == 2
+        session.execute.assert_awaited_once()
+        stmt, params = session.execute.await_args.args
+        assert stmt is POLLUTION_GRID_INSERT
+        assert [p["severity_level"] for p in params] == [2, 3]
+        session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_skip_execute(self):
+        session = AsyncMock(spec=AsyncSession)
+        assert await bulk_insert_pollution_grid(session, []) == 0
+        session.execute.assert_not_called()
@@ -17,7 +17,7 @@ from database.models import (
 
 
 class TestUserModel:
-    """User table: email, password_hash, notification_preferences, preferred_activity, exposure_sensitivity_level."""
+    """User table: email, password_hash, notify_* channels, preferred_activity, exposure_sensitivity_level."""
 
     def test_user_table_name(self):
         assert User.__tablename__ == "users"
@@ -28,12 +28,22 @@ class TestUserModel:
         assert "id" in col_names
         assert "email" in col_names
         assert "password_hash" in col_names
-        assert "notification_preferences" in col_names
+        assert {"notify_email", "notify_push", "notify_in_app"} <= col_names
+        assert "notification_preferences" not in col_names
         assert "preferred_activity" in col_names
         assert "exposure_sensitivity_level" in col_names
         assert "created_at" in col_names
         assert "updated_at" in col_names
 
+    def test_notification_preferences_maps_to_notify_columns(self):
+        user = User(email="a@example.com", password_hash="x", notification_preferences={"email": True, "in_app": False})
+        assert (user.notify_email, user.notify_push, user.notify_in_app) == (True, False, False)
+        assert user.notification_preferences == {"email": True, "push": False, "in_app": False}
+
+    def test_notification_preferences_defaults_to_in_app_only(self):
+        user = User(email="a@example.com", password_hash="x", notification_preferences=None)
+        assert user.notification_preferences == {"email": False, "push": False, "in_app": True}
+
     def test_user_preferred_activity_check_constraint_exists(self):
         checks = [c for c in User.__table_args__ if isinstance(c, CheckConstraint)]
         activity_check = next((c for c in checks if "preferred_activity" in (c.name or "")), None)
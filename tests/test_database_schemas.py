@@ -7,8 +7,10 @@ import pytest
 from pydantic import ValidationError
 
 from database.schemas import (
+    AlertLogListAdapter,
     AlertLogResponse,
     SavedRouteCreate,
+    SavedRouteListAdapter,
     SavedRouteResponse,
     SavedRouteUpdate,
     Token,
@@ -41,6 +43,15 @@ class TestUserLoginSchema:
         assert schema.email == "u@example.com"
         assert schema.password == "any"
 
+    def test_domain_lowercased_like_register(self):
+        payload = {"email": "Some.User@Example.COM", "password": "password123"}
+        assert UserLogin(**payload).email == UserRegister(**payload).email == "Some.User@example.com"
+
+    def test_invalid_email_raises(self):
+        for bad in ("not-an-email", "a@b", "a b@example.com", "a@@example.com"):
+            with pytest.raises(ValidationError):
+                UserLogin(email=bad, password="any")
+
 
 class TestTokenSchema:
     def test_default_token_type(self):
@@ -56,6 +67,7 @@ class TestUserResponseSchema:
     def test_from_attributes_config(self):
         # Pydantic v2: from_attributes in model_config
         assert getattr(UserResponse.model_config, "from_attributes", None) in (True, None)
+        assert UserResponse.model_config.get("from_attributes") is True
 
 
 class TestSavedRouteCreateSchema:
@@ -133,3 +145,28 @@ class TestAlertLogResponseSchema:
         )
         assert schema.alert_type == "deterioration"
         assert schema.route_id is None
+
+
+class TestListAdapters:
+    def test_saved_route_list_matches_per_row_dump(self):
+        from types import SimpleNamespace
+        rows = [
+            SimpleNamespace(
+                id=i, user_id=1, origin_lat=34.0, origin_lon=-118.0, dest_lat=34.1, dest_lon=-118.1,
+                activity_type="jog", last_computed_score=None, last_updated_at=None,
+                last_upes_score=None, last_upes_updated_at=None, created_at=datetime(2025, 1, 1),
+            )
+            for i in range(3)
+        ]
+        out = SavedRouteListAdapter.dump_python(SavedRouteListAdapter.validate_python(rows, from_attributes=True), mode="json")
+        assert out == [SavedRouteResponse.model_validate(r).model_dump(mode="json") for r in rows]
+
+    def test_alert_log_list_reads_metadata_alias(self):
+        from types import SimpleNamespace
+        row = SimpleNamespace(
+            id=1, user_id=2, route_id=None, alert_type="hazard", score_before=None, score_after=0.9,
+            threshold=0.85, alert_metadata={"k": 1}, created_at=datetime(2025, 1, 1), notified_channels=["email"],
+        )
+        out = AlertLogListAdapter.dump_python(AlertLogListAdapter.validate_python([row], from_attributes=True), mode="json")
+        assert out[0]["metadata"] == {"k": 1}
+        assert out[0]["created_at"] == "2025-01-01T00:00:00"
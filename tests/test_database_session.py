@@ -38,6 +38,44 @@ async def test_get_db_yields_session():
         assert session is fake_session
 
 
+@pytest.mark.asyncio
+async def test_get_db_does_not_commit():
+    """get_db leaves commits to the handler; closing the generator issues no COMMIT."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+    fake_session = MagicMock(spec=AsyncSession)
+    fake_cm = AsyncMock()
+    fake_cm.__aenter__.return_value = fake_session
+    fake_cm.__aexit__.return_value = None
+    with patch("database.session.async_session_factory", new=MagicMock(return_value=fake_cm)):
+        from database.session import get_db as get_db_fresh
+        gen = get_db_fresh()
+        await gen.__anext__()
+        await gen.aclose()
+    fake_session.commit.assert_not_called()
+    fake_cm.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_db_tx_wraps_session_in_transaction():
+    """get_db_tx yields inside session.begin(), so the transaction commits when the handler returns."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+    fake_tx = AsyncMock()
+    fake_session = MagicMock(spec=AsyncSession)
+    fake_session.begin.return_value = fake_tx
+    fake_cm = AsyncMock()
+    fake_cm.__aenter__.return_value = fake_session
+    fake_cm.__aexit__.return_value = None
+    with patch("database.session.async_session_factory", new=MagicMock(return_value=fake_cm)):
+        from database.session import get_db_tx
+        gen = get_db_tx()
+        session = await gen.__anext__()
+        assert session is fake_session
+        fake_tx.__aenter__.assert_awaited_once()
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
+    fake_tx.__aexit__.assert_awaited_once()
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_init_db_extensions_creates_postgis(skip_if_no_db):
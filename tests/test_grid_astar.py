@@ -0,0 +1,34 @@
+"""
+Tests for grid_astar.astar_grid_path: A* over the route severity grid.
+"""
+import numpy as np
+
+from grid_astar import astar_grid_path
+
+
+class TestAstarGridPath:
+    def test_clean_grid_goes_diagonal(self):
+        path = astar_grid_path(np.zeros((5, 5)), (0, 0), (4, 4))
+        assert path.tolist() == [[k, k] for k in range(5)]
+
+    def test_start_equals_goal(self):
+        path = astar_grid_path(np.zeros((3, 3)), (1, 2), (1, 2))
+        assert path.tolist() == [[1, 2]]
+
+    def test_detours_around_polluted_wall(self):
+        grid = np.zeros((7, 7))
+        grid[1:, 3] = 4.0  # wall with a clean gap in row 0
+        path = astar_grid_path(grid, (6, 0), (6, 6))
+        cells = [tuple(c) for c in path.tolist()]
+        assert cells[0] == (6, 0) and cells[-1] == (6, 6)
+        assert all(grid[c] == 0 for c in cells)
+        # consecutive cells are 8-neighbours
+        steps = np.abs(np.diff(path, axis=0))
+        assert steps.max() == 1
+
+    def test_uint8_grid_matches_float_grid(self):
+        rng = np.random.default_rng(3)
+        grid = rng.integers(0, 5, (30, 40)).astype(np.uint8)
+        path_u8 = astar_grid_path(grid, (0, 0), (29, 39))
+        path_f64 = astar_grid_path(grid.astype(np.float64), (0, 0), (29, 39))
+        assert path_u8.tolist() == path_f64.tolist()
@@ -0,0 +1,60 @@
+"""
+Tests for grid_stats.scan_grid_stats: summary statistics used for plot colour scaling.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from grid_stats import HIST_BINS, scan_grid_stats
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestScanGridStats:
+    def test_matches_numpy_on_finite_values(self):
+        rng = np.random.default_rng(0)
+        data = rng.random((200, 150)) * 3e16
+        data[data < 3e15] = np.nan
+        stats = scan_grid_stats(data)
+        finite = data[np.isfinite(data)]
+        assert stats["count"] == finite.size
+        assert np.isclose(stats["mean"], finite.mean())
+        assert stats["min"] == finite.min()
+        assert stats["max"] == finite.max()
+        bin_width = (finite.max() - finite.min()) / HIST_BINS
+        assert abs(stats["p98"] - np.percentile(finite, 98)) <= bin_width
+
+    def test_all_nan_returns_zero_count(self):
+        stats = scan_grid_stats(np.full((4, 4), np.nan))
+        assert stats["count"] == 0
+        assert np.isnan(stats["p98"])
+
+    def test_constant_grid(self):
+        stats = scan_grid_stats(np.full((3, 3), 2.5))
+        assert stats["count"] == 9
+        assert stats["min"] == stats["max"] == stats["p98"] == 2.5
+
+    def test_float32_grid(self):
+        rng = np.random.default_rng(1)
+        data = (rng.random((120, 80)) * 3e16).astype(np.float32)
+        data[::7] = np.nan
+        stats = scan_grid_stats(data)
+        finite = data[np.isfinite(data)].astype(np.float64)
+        assert stats["count"] == finite.size
+        assert np.isclose(stats["mean"], finite.mean(), rtol=1e-6)
+        assert stats["max"] == finite.max()
+
+    def test_falls_back_to_numpy_without_a_safe_threading_layer(self):
+        # workqueue is not safe for concurrent callers: forcing it must route scans to NumPy
+        code = (
+            "import numpy as np, grid_stats\n"
+            "stats = grid_stats.scan_grid_stats(np.arange(10.0))\n"
+            "assert stats['count'] == 10 and stats['max'] == 9.0\n"
+            "assert not grid_stats._USE_JIT or grid_stats._layer_safe is False\n"
+        )
+        env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
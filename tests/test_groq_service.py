@@ -0,0 +1,59 @@
+"""
+Tests for groq_service weather-advice memo: quantized keys and reuse without a second Groq call.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import groq_service
+from groq_service import _weather_memo_key, generate_weather_interpretation
+
+
+def _weather(temp_c: float, humidity: int, wind_kph: float, no2: float) -> dict:
+    return {
+        "current": {"temp_c": temp_c, "humidity": humidity, "wind_kph": wind_kph,
+                    "wind_dir": "NW", "condition": {"text": "Sunny"}},
+        "air_quality": {"no2": no2, "pm2_5": 12.2},
+    }
+
+
+class TestWeatherMemoKey:
+    def test_nearby_readings_share_key(self):
+        assert _weather_memo_key(_weather(21.2, 41, 11.0, 18.3), "Austin") == \
+            _weather_memo_key(_weather(20.9, 39, 9.0, 17.8), "Austin")
+
+    def test_location_and_large_changes_differ(self):
+        base = _weather_memo_key(_weather(21.0, 40, 10.0, 18.0), "Austin")
+        assert base != _weather_memo_key(_weather(21.0, 40, 10.0, 18.0), "Dallas")
+        assert base != _weather_memo_key(_weather(25.0, 40, 10.0, 18.0), "Austin")
+
+    def test_missing_values_are_hashable(self):
+        hash(_weather_memo_key({"current": {"temp_c": "N/A"}, "air_quality": None}, "X"))
+
+
+class TestWeatherMemo:
+    @pytest.fixture(autouse=True)
+    def _clean_memo(self):
+        groq_service._weather_memo.clear()
+        yield
+        groq_service._weather_memo.clear()
+
+    def _response(self, status: int, content: str = "") -> MagicMock:
+        resp = MagicMock(status_code=status, text="err")
+        resp.json.return_value = {"choices": [{"message": {"content": content}}]}
+        return resp
+
+    def test_repeat_call_reuses_answer(self):
+        post = MagicMock(return_value=self._response(200, "Air Quality: Good"))
+        with patch.object(groq_service, "GROQ_API_KEY", "k"), patch.object(groq_service._SESSION, "post", post):
+            first = generate_weather_interpretation(_weather(21.2, 41, 11.0, 18.3), "Austin")
+            second = generate_weather_interpretation(_weather(20.9, 39, 9.0, 17.8), "Austin")
+        assert first == second == "Air Quality: Good"
+        assert post.call_count == 1
+
+    def test_api_error_not_memoized(self):
+        post = MagicMock(return_value=self._response(500))
+        with patch.object(groq_service, "GROQ_API_KEY", "k"), patch.object(groq_service._SESSION, "post", post):
+            assert generate_weather_interpretation(_weather(21.0, 40, 10.0, 18.0), "Austin") is None
+            assert generate_weather_interpretation(_weather(21.0, 40, 10.0, 18.0), "Austin") is None
+        assert post.call_count == 2
@@ -8,6 +8,8 @@ from unittest.mock import patch
 import pytest
 
 from services.harmony_service import (
+    _SESSION,
+    _request_with_retry,
     DEFAULT_VARIABLE,
     TEMPO_COLLECTION_IDS,
     build_tempo_rangeset_url,
@@ -22,7 +24,7 @@ class TestSearchCmrCollections:
     """CMR collection search (notebook pattern: short_name / keyword)."""
 
     def test_short_name_returns_entries(self):
-        with patch("services.harmony_service.requests.get") as mget:
+        with patch("services.harmony_service._SESSION.get") as mget:
             mget.return_value.json.return_value = {
                 "feed": {
                     "entry": [
@@ -116,19 +118,36 @@ class TestGetBearerToken:
             s.bearer_token = None
             s.earthdata_username = "user"
             s.earthdata_password = "pass"
-            with patch("services.harmony_service.requests.get") as get:
+            with patch("services.harmony_service._SESSION.get") as get:
                 get.return_value.status_code = 200
                 get.return_value.json.return_value = [{"access_token": "refreshed-token"}]
                 assert get_bearer_token() == "refreshed-token"
-            with patch("services.harmony_service.requests.get") as get:
+            with patch("services.harmony_service._SESSION.get") as get:
                 get.return_value.status_code = 200
                 get.return_value.json.return_value = []
-                with patch("services.harmony_service.requests.post") as post:
+                with patch("services.harmony_service._SESSION.post") as post:
                     post.return_value.raise_for_status = lambda: None
                     post.return_value.json.return_value = {"access_token": "new-token"}
                     assert get_bearer_token() == "new-token"
 
 
+class TestSharedSession:
+    """All Harmony/CMR calls go through one keep-alive session."""
+
+    def test_retry_helper_reuses_module_session(self):
+        with patch("services.harmony_service.requests.Session") as new_session:
+            with patch("services.harmony_service._SESSION.get") as get:
+                get.return_value.status_code = 200
+                _request_with_retry("GET", "https://harmony.example/jobs/1")
+                _request_with_retry("GET", "https://harmony.example/jobs/1")
+        assert get.call_count == 2
+        new_session.assert_not_called()
+
+    def test_https_adapter_is_pooled(self):
+        adapter = _SESSION.get_adapter("https://harmony.earthdata.nasa.gov/")
+        assert adapter._pool_maxsize == 16
+
+
 class TestSubmitRequest:
     """Submit GET: handle redirect (async), 200 JSON with jobID, 200 binary."""
 
@@ -1,14 +1,13 @@
 """
 Tests for NetCDF resolver (DATA_LAYER): resolve_netcdf_paths_for_gases from DB + object storage.
 """
-from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.models import NetcdfFile
 from netcdf_resolver import resolve_netcdf_paths_for_gases
 
 
@@ -27,7 +26,7 @@ async def test_resolve_returns_empty_when_no_rows_in_db():
     with patch("netcdf_resolver.is_configured", return_value=True):
         session = AsyncMock(spec=AsyncSession)
         result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = None
+        result_mock.all.return_value = []
         session.execute = AsyncMock(return_value=result_mock)
 
         overrides, temp_paths = await resolve_netcdf_paths_for_gases(session, ["NO2"])
@@ -40,15 +39,8 @@ async def test_resolve_skips_gas_on_download_failure():
     with patch("netcdf_resolver.is_configured", return_value=True):
         with patch("netcdf_resolver.download_netcdf_to_path", side_effect=Exception("download failed")):
             session = AsyncMock(spec=AsyncSession)
-            row = NetcdfFile(
-                id=1,
-                file_name="no2.nc",
-                bucket_path="bucket/no2.nc",
-                timestamp=datetime.utcnow(),
-                gas_type="NO2",
-            )
             result_mock = MagicMock()
-            result_mock.scalar_one_or_none.return_value = row
+            result_mock.all.return_value = [("NO2", "bucket/no2.nc")]
             session.execute = AsyncMock(return_value=result_mock)
 
             overrides, temp_paths = await resolve_netcdf_paths_for_gases(session, ["NO2"])
@@ -61,17 +53,27 @@ async def test_resolve_returns_override_and_temp_path_on_success():
     with patch("netcdf_resolver.is_configured", return_value=True):
         with patch("netcdf_resolver.download_netcdf_to_path", return_value="/tmp/fake_no2.nc"):
             session = AsyncMock(spec=AsyncSession)
-            row = NetcdfFile(
-                id=1,
-                file_name="no2.nc",
-                bucket_path="bucket/no2.nc",
-                timestamp=datetime.utcnow(),
-                gas_type="NO2",
-            )
             result_mock = MagicMock()
-            result_mock.scalar_one_or_none.return_value = row
+            result_mock.all.return_value = [("NO2", "bucket/no2.nc")]
             session.execute = AsyncMock(return_value=result_mock)
 
             overrides, temp_paths = await resolve_netcdf_paths_for_gases(session, ["NO2"])
             assert overrides == {"NO2": "/tmp/fake_no2.nc"}
             assert temp_paths == ["/tmp/fake_no2.nc"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_uses_one_query_for_all_gases():
+    with patch("netcdf_resolver.is_configured", return_value=True):
+        with patch("netcdf_resolver.download_netcdf_to_path", side_effect=lambda key: "/tmp/" + key) as dl:
+            session = AsyncMock(spec=AsyncSession)
+            result_mock = MagicMock()
+            result_mock.all.return_value = [("NO2", "no2.nc"), ("O3", "o3.nc")]
+            session.execute = AsyncMock(return_value=result_mock)
+
+            overrides, temp_paths = await resolve_netcdf_paths_for_gases(session, ["O3", "HCHO", "NO2"])
+            assert session.execute.await_count == 1
+            assert "DISTINCT ON" in str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+            assert overrides == {"O3": "/tmp/o3.nc", "NO2": "/tmp/no2.nc"}
+            assert temp_paths == ["/tmp/o3.nc", "/tmp/no2.nc"]
+            assert dl.call_count == 2
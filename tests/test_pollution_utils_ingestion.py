@@ -4,7 +4,14 @@ Tests for pollution_utils used by ingestion (DATA INGESTION): thresholds and cla
 import numpy as np
 import pytest
 
-from pollution_utils import POLLUTION_THRESHOLDS, classify_pollution_level
+from pollution_utils import (
+    LEVELS,
+    NO_DATA_LEVEL,
+    POLLUTION_THRESHOLDS,
+    classify_pollution_level,
+    classify_pollution_level_vec,
+    classify_severity_array,
+)
 
 
 class TestPollutionThresholds:
@@ -50,3 +57,67 @@ class TestClassifyPollutionLevel:
         name, sev = classify_pollution_level(1.0, "UNKNOWN")
         assert name == "no_data"
         assert sev == 0
+
+    def test_exact_threshold_starts_level_for_all_gases(self):
+        for gas, t in POLLUTION_THRESHOLDS.items():
+            for sev, level in enumerate(("moderate", "unhealthy", "very_unhealthy", "hazardous"), start=1):
+                assert classify_pollution_level(t[level], gas) == (level, sev)
+                name, below = classify_pollution_level(np.nextafter(t[level], -np.inf), gas)
+                assert below == sev - 1
+
+    def test_numpy_scalar_input_returns_python_types(self):
+        name, sev = classify_pollution_level(np.float32(4e16), "NO2")
+        assert (name, sev) == ("hazardous", 4)
+        assert type(name) is str and type(sev) is int
+
+    def test_returns_shared_level_tuples(self):
+        assert classify_pollution_level(4e16, "NO2") is LEVELS[4]
+        assert classify_pollution_level(0.0, "O3") is LEVELS[0]
+        assert classify_pollution_level(float("nan"), "NO2") is NO_DATA_LEVEL
+
+
+class TestClassifySeverityArray:
+    """Vectorized classifier must agree with the scalar one, including boundaries and NaN."""
+
+    def test_matches_scalar_for_all_gases(self):
+        for gas, t in POLLUTION_THRESHOLDS.items():
+            values = np.array(
+                [0.0, t["moderate"], t["unhealthy"] * 0.99, t["unhealthy"], t["very_unhealthy"],
+                 t["hazardous"], t["hazardous"] * 10, float("nan")]
+            )
+            sev = classify_severity_array(values, gas)
+            assert sev.dtype == np.int8
+            assert sev.tolist() == [classify_pollution_level(float(v), gas)[1] for v in values]
+
+    def test_preserves_shape(self):
+        sev = classify_severity_array(np.full((3, 4), 4e16), "NO2")
+        assert sev.shape == (3, 4)
+        assert (sev == 4).all()
+
+    def test_unknown_gas_returns_zeros(self):
+        sev = classify_severity_array(np.array([1.0, 100.0]), "UNKNOWN")
+        assert sev.tolist() == [0, 0]
+
+    def test_float32_grid_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        values = (rng.random((20, 30)) * 600).astype(np.float32)
+        values[::4, ::5] = np.nan
+        sev = classify_severity_array(values, "O3")
+        assert sev.dtype == np.int8
+        expected = [[classify_pollution_level(float(v), "O3")[1] for v in row] for row in values]
+        assert sev.tolist() == expected
+
+
+class TestClassifyPollutionLevelVec:
+    """Labels and severities must match the scalar (name, severity) pairs element-wise."""
+
+    def test_labels_match_scalar(self):
+        values = np.array([0.0, 6e15, 1.5e16, 2.5e16, 4e16, float("nan")])
+        labels, sev = classify_pollution_level_vec(values, "NO2")
+        expected = [classify_pollution_level(float(v), "NO2") for v in values]
+        assert list(zip(labels.tolist(), sev.tolist())) == expected
+
+    def test_unknown_gas_is_no_data(self):
+        labels, sev = classify_pollution_level_vec(np.array([[1.0, 2.0]]), "UNKNOWN")
+        assert labels.tolist() == [["no_data", "no_data"]]
+        assert sev.tolist() == [[0, 0]]
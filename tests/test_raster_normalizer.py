@@ -17,6 +17,8 @@ from services.raster_normalizer import (
     DEFAULT_MAX_CELLS,
     _cell_to_wkt,
     _pixel_bounds,
+    band_to_grid_columns,
+    geotiff_to_grid_columns,
     geotiff_to_grid_rows,
 )
 
@@ -165,3 +167,51 @@ class TestGeotiffToGridRows:
     def test_missing_file_raises(self):
         with pytest.raises(FileNotFoundError):
             list(geotiff_to_grid_rows("/nonexistent/path.tif", "NO2", datetime.now(timezone.utc)))
+
+
+class TestGeotiffToGridColumns:
+    """Columnar chunks: scalar timestamp/gas_type, parallel geom_wkt/pollution_value/severity_level arrays."""
+
+    def test_columns_match_rows(self):
+        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as f:
+            _make_geotiff(f.name, width=6, height=5, fill=1.2e16)
+            try:
+                ts = datetime(2024, 6, 15, 10, 0, 0, tzinfo=timezone.utc)
+                cols = list(geotiff_to_grid_columns(f.name, "NO2", ts, max_cells=100, chunk_size=7))
+                rows = list(geotiff_to_grid_rows(f.name, "NO2", ts, max_cells=100, chunk_size=7))
+                assert [len(c["severity_level"]) for c in cols] == [len(r) for r in rows]
+                for chunk, row_chunk in zip(cols, rows):
+                    assert chunk["timestamp"] == ts and chunk["gas_type"] == "NO2"
+                    assert chunk["pollution_value"].dtype == np.float64
+                    assert chunk["severity_level"].dtype == np.int8
+                    assert chunk["geom_wkt"].tolist() == [r["geom_wkt"] for r in row_chunk]
+                    assert chunk["pollution_value"].tolist() == [r["pollution_value"] for r in row_chunk]
+                    assert chunk["severity_level"].tolist() == [r["severity_level"] for r in row_chunk]
+            finally:
+                os.unlink(f.name)
+
+    def test_all_nan_yields_nothing(self):
+        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as f:
+            _make_geotiff(f.name, width=3, height=3, fill=np.nan)
+            try:
+                ts = datetime(2024, 6, 15, 10, 0, 0, tzinfo=timezone.utc)
+                assert list(geotiff_to_grid_columns(f.name, "NO2", ts)) == []
+            finally:
+                os.unlink(f.name)
+
+    def test_band_in_memory_matches_file(self):
+        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as f:
+            _make_geotiff(f.name, width=6, height=5, fill=1.2e16)
+            try:
+                ts = datetime(2024, 6, 15, 10, 0, 0, tzinfo=timezone.utc)
+                with rasterio.open(f.name) as src:
+                    band, transform = src.read(1), src.transform
+                from_band = list(band_to_grid_columns(band, transform, "NO2", ts, max_cells=100, chunk_size=7))
+                from_file = list(geotiff_to_grid_columns(f.name, "NO2", ts, max_cells=100, chunk_size=7))
+                assert len(from_band) == len(from_file)
+                for a, b in zip(from_band, from_file):
+                    assert a["geom_wkt"].tolist() == b["geom_wkt"].tolist()
+                    assert a["pollution_value"].tolist() == b["pollution_value"].tolist()
+                    assert a["severity_level"].tolist() == b["severity_level"].tolist()
+            finally:
+                os.unlink(f.name)
@@ -40,7 +40,7 @@ class TestRouteOptimizedAPI:
         from unittest.mock import patch
         from fastapi.testclient import TestClient
         from api_server import app_settings, app
-        with patch.object(app_settings, "route_optimization_enabled", False):
+        with patch("api_server.app_settings", app_settings.model_copy(update={"route_optimization_enabled": False})):
             client = TestClient(app)
             r = client.get(
                 "/api/route/optimized",
@@ -3,6 +3,7 @@ Tests for route optimization graph builder (ROUTE_OPTIMIZATION_ENGINE).
 Mocks OSMnx to avoid network access; verifies integration with UPES storage.
 """
 import os
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -53,6 +54,21 @@ class TestGetLatestUpesRasterPath:
                 (base / "hourly_scores").rmdir()
                 base.rmdir()
 
+    def test_reuses_scan_until_directory_changes(self, tmp_path):
+        final_dir = tmp_path / "hourly_scores" / "final_score"
+        final_dir.mkdir(parents=True)
+        (final_dir / "final_score_2024060112.tif").touch()
+        with patch("services.route_optimization.graph_builder.upes_output_base", return_value=tmp_path):
+            first = get_latest_upes_raster_path()
+            with patch("services.route_optimization.graph_builder._scan_latest_upes_raster") as scan:
+                assert get_latest_upes_raster_path() == first
+                scan.assert_not_called()
+            newer = final_dir / "final_score_2024060113.tif"
+            newer.touch()
+            os.utime(newer, (time.time() + 10, time.time() + 10))
+            os.utime(final_dir, (time.time() + 10, time.time() + 10))
+            assert get_latest_upes_raster_path() == newer
+
 
 class TestEdgeGeometryToCoords:
     def test_none_returns_empty(self):
@@ -17,6 +17,7 @@ from services.route_optimization.upes_sampling import (
     _resample_line,
     sample_upes_along_line,
     sample_upes_along_line_mean_max,
+    sample_upes_along_lines_mean_max,
 )
 
 
@@ -105,3 +106,36 @@ class TestSampleUpesAlongLineMeanMax:
         finally:
             if os.path.exists(path):
                 os.unlink(path)
+
+
+class TestSampleUpesAlongLinesMeanMax:
+    """Batch form: one raster pass, same (mean, max) per line as the single-line sampler."""
+
+    def test_no_raster_returns_fallback_per_line(self):
+        assert sample_upes_along_lines_mean_max(None, [[(-118.0, 34.0)], []]) == [
+            (DEFAULT_UPES_FALLBACK, DEFAULT_UPES_FALLBACK)
+        ] * 2
+
+    def test_matches_single_line_sampler(self):
+        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as f:
+            path = f.name
+        try:
+            transform = from_bounds(-118.5, 33.5, -117.5, 34.5, 20, 20)
+            data = np.random.default_rng(0).random((20, 20)).astype(np.float32)
+            data[3:6, 3:6] = np.nan
+            with rasterio.open(
+                path, "w", driver="GTiff", height=20, width=20, count=1,
+                dtype=data.dtype, crs=CRS.from_epsg(4326), transform=transform,
+            ) as dst:
+                dst.write(data, 1)
+            lines = [
+                [(-118.0, 34.0), (-117.6, 34.2)],
+                [(-118.4, 34.4), (-118.3, 34.3)],
+                [(-110.0, 10.0), (-110.001, 10.0)],  # outside the raster -> fallback
+                [],
+            ]
+            expected = [sample_upes_along_line_mean_max(path, coords, step_m=100) for coords in lines]
+            assert sample_upes_along_lines_mean_max(path, lines, step_m=100) == expected
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
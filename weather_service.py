@@ -1,6 +1,8 @@
+import asyncio
 import os
+import httpx
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,6 +18,36 @@ CURRENT_ENDPOINT = f"{BASE_URL}/current.json"
 FORECAST_ENDPOINT = f"{BASE_URL}/forecast.json"
 
 
+def _weather_params(lat: float, lon: float, days: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Query params for the current and forecast endpoints."""
+    common_params = {
+        "key": WEATHER_API_KEY,
+        "q": f"{lat},{lon}",
+        "aqi": "yes",    # request air quality data
+    }
+    forecast_params = common_params.copy()
+    forecast_params["days"] = days  # number of forecast days
+    return common_params, forecast_params
+
+
+def _build_weather_result(current_data: Dict[str, Any], forecast_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a simplified result from the current and forecast payloads."""
+    return {
+        "location": current_data.get("location"),
+        "current": {
+            "temp_c": current_data["current"]["temp_c"],
+            "humidity": current_data["current"]["humidity"],
+            "wind_kph": current_data["current"]["wind_kph"],
+            "wind_degree": current_data["current"]["wind_degree"],
+            "condition": current_data["current"]["condition"]["text"],
+        },
+        "air_quality": current_data["current"].get("air_quality"),  # may be None if plan doesn't support
+        "forecast": {
+            "forecastday": forecast_data.get("forecast", {}).get("forecastday")
+        }
+    }
+
+
 def get_weather_data(lat: float, lon: float, days: int = 1) -> Dict[str, Any]:
     """
     Fetch current weather + forecast (for `days` ahead) via WeatherAPI.com.
@@ -23,14 +55,8 @@ def get_weather_data(lat: float, lon: float, days: int = 1) -> Dict[str, Any]:
     """
     if not WEATHER_API_KEY:
         return {"error": "Weather API key not configured"}
-    
-    location_query = f"{lat},{lon}"
-    common_params = {
-        "key": WEATHER_API_KEY,
-        "q": location_query,
-        "aqi": "yes",    # request air quality data
-    }
 
+    common_params, forecast_params = _weather_params(lat, lon, days)
     try:
         # Current weather
         resp_current = requests.get(CURRENT_ENDPOINT, params=common_params, timeout=10)
@@ -39,36 +65,43 @@ def get_weather_data(lat: float, lon: float, days: int = 1) -> Dict[str, Any]:
         current_data = resp_current.json()
 
         # Forecast weather
-        forecast_params = common_params.copy()
-        forecast_params["days"] = days  # number of forecast days
         resp_forecast = requests.get(FORECAST_ENDPOINT, params=forecast_params, timeout=10)
         if resp_forecast.status_code != 200:
             return {"error": f"Weather API error: {resp_forecast.status_code}"}
         forecast_data = resp_forecast.json()
 
-        # Build a simplified result
-        result = {
-            "location": current_data.get("location"),
-            "current": {
-                "temp_c": current_data["current"]["temp_c"],
-                "humidity": current_data["current"]["humidity"],
-                "wind_kph": current_data["current"]["wind_kph"],
-                "wind_degree": current_data["current"]["wind_degree"],
-                "condition": current_data["current"]["condition"]["text"],
-            },
-            "air_quality": current_data["current"].get("air_quality"),  # may be None if plan doesn't support
-            "forecast": {
-                "forecastday": forecast_data.get("forecast", {}).get("forecastday")
-            }
-        }
-
-        return result
+        return _build_weather_result(current_data, forecast_data)
     except requests.exceptions.RequestException as e:
         return {"error": f"Network error: {str(e)}"}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}"}
 
 
+async def get_weather_data_async(client: httpx.AsyncClient, lat: float, lon: float, days: int = 1) -> Dict[str, Any]:
+    """
+    Async get_weather_data on a shared httpx client: current and forecast are requested concurrently
+    over the client's keep-alive pool. Same result and error payloads as the sync version.
+    """
+    if not WEATHER_API_KEY:
+        return {"error": "Weather API key not configured"}
+
+    common_params, forecast_params = _weather_params(lat, lon, days)
+    try:
+        resp_current, resp_forecast = await asyncio.gather(
+            client.get(CURRENT_ENDPOINT, params=common_params, timeout=10),
+            client.get(FORECAST_ENDPOINT, params=forecast_params, timeout=10),
+        )
+        if resp_current.status_code != 200:
+            return {"error": f"Weather API error: {resp_current.status_code}"}
+        if resp_forecast.status_code != 200:
+            return {"error": f"Weather API error: {resp_forecast.status_code}"}
+        return _build_weather_result(resp_current.json(), resp_forecast.json())
+    except httpx.HTTPError as e:
+        return {"error": f"Network error: {str(e)}"}
+    except Exception as e:
+        return {"error": f"Unexpected error: {str(e)}"}
+
+
 def get_pollutant_movement_prediction(lat: float, lon: float) -> Dict[str, Any]:
     """
     Predict the movement and concentration changes of pollutants for next 3 hours.